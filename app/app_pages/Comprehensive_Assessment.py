@@ -17,6 +17,7 @@ import pandas as pd
 # explicit libraries
 from bahamas.utils import  UCA_types
 from bahamas.software_total_failure_probability_bbn import BBN
+from bahamas.cache import WorkbookCache
 
 # Reference data location for defect correlations
 workdir = os.path.dirname(__file__)
@@ -443,10 +444,18 @@ def app():
         if st.session_state.CA_tasks == None:
             error_InputError()
         else:
-            if st.session_state.CA_defects is not None:
-                software_BBN = BBN(st.session_state.CA_defects, st.session_state.CA_tasks, st.session_state.CA_num_samples)
+            defects = st.session_state.CA_defects if st.session_state.CA_defects is not None else defect_data
+            software_BBN = st.session_state.get("CA_bbn")
+            # uploaded files are new objects on each rerun, compare the defect data by content
+            defects_key = WorkbookCache.key(defects)
+            if (software_BBN is None or st.session_state.get("CA_bbn_defects") != defects_key
+                    or software_BBN.num_samples != st.session_state.CA_num_samples):
+                # keep the sampled intermediates between calculations, so that only the edited stages are resampled
+                software_BBN = BBN(defects, st.session_state.CA_tasks, st.session_state.CA_num_samples, incremental=True)
+                st.session_state.CA_bbn = software_BBN
+                st.session_state.CA_bbn_defects = defects_key
             else:
-                software_BBN = BBN(defect_data, st.session_state.CA_tasks, st.session_state.CA_num_samples)
+                software_BBN.update_task(st.session_state.CA_tasks)
 
             runAndPlot(software_BBN)
 
@@ -1,29 +1,53 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
+import importlib.metadata
+
+try:
+  __version__ = importlib.metadata.version('BAHAMAS')
+except importlib.metadata.PackageNotFoundError:
+  # source tree without an installed distribution
+  __version__ = 'unknown'
+
 from .software_total_failure_probability_bbn import BBN
 from .sdlc_stage_hep_calculation import sdlc_stage_hep_calculation
 from .sdlc_stage_hep_calculation_approx import sdlc_stage_hep_calculation_approx
 from .human_error_mode_distribution import get_hemd_from_spreadsheet
-from .stage_odc_distribution import get_stage_odc_dist
+from .stage_odc_distribution import get_stage_odc_dist, get_stage_odc_params, sample_stage_odc
 from .defect_conditional_probability import stage_dcp_calculation
-from .uca_defect_correlation import get_uca_defect_correlation_dist
+from .uca_defect_correlation import get_uca_defect_correlation_dist, get_uca_defect_correlation_params, sample_uca_defect_correlation
 from .utils import SDLC_stages, ODC_types, UCA_types
 from .plot_utils import plot_histogram
 from .cccg import CCCG
 from .workflow import Workflow
 from .validate import validate_toml
+from .cache import WorkbookCache
+from .summary import StreamingSummary
+from .batch import BatchAssessment
+from .sweep import ParameterSweep, grid_design, random_design
+from .sensitivity import sobol_indices
 
 __all__ = ["BBN",
           "sdlc_stage_hep_calculation",
           "sdlc_stage_hep_calculation_approx",
           "get_hemd_from_spreadsheet",
           "get_stage_odc_dist",
+          "get_stage_odc_params",
+          "sample_stage_odc",
           "stage_dcp_calculation",
           "get_uca_defect_correlation_dist",
+          "get_uca_defect_correlation_params",
+          "sample_uca_defect_correlation",
           "plot_histogram",
           "CCCG",
           "Workflow",
           "validate_toml",
+          "WorkbookCache",
+          "StreamingSummary",
+          "BatchAssessment",
+          "ParameterSweep",
+          "grid_design",
+          "random_design",
+          "sobol_indices",
           "SDLC_stages",
           "ODC_types",
           "UCA_types"]
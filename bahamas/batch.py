@@ -0,0 +1,147 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import os
+import logging
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from .software_total_failure_probability_bbn import BBN, load_defect_data
+from .utils import UCA_types
+from .writer import write_table
+
+logger = logging.getLogger('BAHAMAS.Batch')
+
+# Defect data and BBN options shared by the task lists assessed in a worker process
+_worker_defect = None
+_worker_options = None
+
+def _initialize_worker(defect_data, options):
+  """Store the shared defect data and BBN options in the worker process
+
+  Args:
+      defect_data (dict): Defect data loaded by load_defect_data
+      options (dict): BBN options
+  """
+  global _worker_defect, _worker_options
+  _worker_defect = defect_data
+  _worker_options = options
+
+def _assess_worker(args):
+  """Assess a task list with the defect data of the worker process
+
+  Args:
+      args (tuple): task list file and quantiles
+
+  Returns:
+      dict: row of the results table
+  """
+  return assess_task_list(_worker_defect, *args, **_worker_options)
+
+def find_task_files(path):
+  """Find the task list workbooks of a batch
+
+  Args:
+      path (str): Directory with the task list workbooks (*.xlsx), or manifest file that lists one workbook per
+        line, relative to the manifest location; blank lines and lines starting with '#' are skipped
+
+  Returns:
+      list: paths of the task list workbooks
+  """
+  if os.path.isdir(path):
+    files = sorted(f for f in os.listdir(path) if f.endswith('.xlsx') and not f.startswith('~$'))
+    return [os.path.join(path, f) for f in files]
+  if not os.path.isfile(path):
+    raise IOError(f'Batch input {path} is neither a directory nor a manifest file!')
+  base = os.path.dirname(os.path.abspath(path))
+  with open(path) as f:
+    lines = [line.strip() for line in f]
+  return [os.path.join(base, line) for line in lines if line and not line.startswith('#')]
+
+def assess_task_list(defect_data, task_file, quantiles=(0.05, 0.5, 0.95), **options):
+  """Assess the software failure probability of one task list
+
+  Args:
+      defect_data (dict): Defect data loaded by load_defect_data
+      task_file (str): Task list file
+      quantiles (tuple, optional): Quantiles of the total failure probability to report (defaults to (0.05, 0.5, 0.95))
+      options (dict): BBN options, e.g., num_samples, seed and approx for the stage level assessment
+
+  Returns:
+      dict: row of the results table
+  """
+  software_BBN = BBN(None, task_file, defect_data=defect_data, **options)
+  software_BBN.calculate()
+  mean, sigma, _, values = software_BBN.get_total_failure_probability(quantiles=list(quantiles))
+  row = {'Module': os.path.splitext(os.path.basename(task_file))[0], 'Task File': task_file,
+         'Samples': software_BBN.total_samples, 'Total Mean': mean, 'Total Sigma': sigma}
+  for q, value in zip(quantiles, values):
+    row[f'Total Q{q:g}'] = value
+  for uca in UCA_types:
+    row[f'{uca} Mean'], row[f'{uca} Sigma'], _ = software_BBN.get_uca(uca)
+  return row
+
+
+class BatchAssessment(object):
+  """
+    Assessment of many task lists that share one defect data file. The defect data and the distributions
+    derived from it are loaded once, and the task lists are assessed in parallel.
+  """
+
+  def __init__(self, defect_file, task_files, workers=None, cache=None, quantiles=(0.05, 0.5, 0.95), approx=False,
+               **options):
+    """Constructor
+
+    Args:
+        defect_file (str or file-like): Defect data file
+        task_files (str or list): Task list files, or a directory or manifest file, see find_task_files
+        workers (int, optional): Number of worker processes that assess the task lists (defaults to None, i.e.,
+          serial assessment)
+        cache (bahamas.cache.WorkbookCache, optional): Cache of parsed input workbooks (defaults to None)
+        quantiles (tuple, optional): Quantiles of the total failure probability to report (defaults to (0.05, 0.5, 0.95))
+        approx (bool, optional): Stage level assessment of SDLC stage data files if True, task level assessment of task
+          list files otherwise (defaults to False)
+        options (dict): BBN options, e.g., num_samples and seed, shared by all task lists. Each task list is sampled
+          with the same seed, i.e., with common random numbers, which sharpens the comparison of the modules
+    """
+    if isinstance(task_files, str):
+      task_files = find_task_files(task_files)
+    if len(task_files) == 0:
+      raise IOError('No task list files are provided for the batch assessment!')
+    self._task_files = list(task_files)
+    self._workers = workers
+    self._quantiles = tuple(quantiles)
+    self._options = dict(options, cache=cache, approx=approx)
+    logger.info('Load defect data shared by %s task lists', len(self._task_files))
+    self._defect = load_defect_data(defect_file, approx=approx, cache=cache)
+    self.results = None
+
+  def run(self):
+    """Assess all task lists
+
+    Returns:
+        pandas.DataFrame: results table, one row per task list in the order of the task files
+    """
+    tasks = [(task_file, self._quantiles) for task_file in self._task_files]
+    if self._workers is None or self._workers == 1:
+      rows = []
+      for task_file, quantiles in tasks:
+        logger.info('Assess task list %s', task_file)
+        rows.append(assess_task_list(self._defect, task_file, quantiles, **self._options))
+    else:
+      with ProcessPoolExecutor(max_workers=self._workers, initializer=_initialize_worker,
+                               initargs=(self._defect, self._options)) as executor:
+        rows = list(executor.map(_assess_worker, tasks))
+    self.results = pd.DataFrame(rows)
+    return self.results
+
+  def write(self, out_file, style=None):
+    """Write the results table
+
+    Args:
+        out_file (str): Output file
+        style (str, optional): Type of file, "csv", "parquet" or "npz" (defaults to None, i.e., the file extension)
+    """
+    if self.results is None:
+      raise IOError('No results are available, call run first!')
+    write_table(self.results, out_file, style)
+    logger.info('Batch results are saved to: %s', out_file)
@@ -0,0 +1,263 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('BAHAMAS.Cache')
+
+default_cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'bahamas')
+
+def _json_value(value):
+  """Convert numpy scalars of object columns to JSON values
+
+  Args:
+      value (object): cell value
+
+  Returns:
+      object: JSON serializable value
+  """
+  if isinstance(value, np.bool_):
+    return bool(value)
+  if isinstance(value, np.integer):
+    return int(value)
+  if isinstance(value, np.floating):
+    return float(value)
+  raise TypeError(f'Cell value {value!r} of type {type(value).__name__} can not be cached')
+
+def _encode_values(values, name, arrays):
+  """Encode a column or index, numeric, boolean and datetime values are stored as arrays, object values as JSON
+
+  Args:
+      values (pandas.Series or pandas.Index): The values
+      name (str): Name of the array in the archive
+      arrays (dict): Arrays of the archive, updated in place
+
+  Returns:
+      dict: description of the encoded values
+  """
+  if values.dtype.kind in 'biufcmM' and isinstance(values.dtype, np.dtype):
+    arrays[name] = values.to_numpy()
+    return {'kind': 'array'}
+  if values.dtype != object:
+    raise TypeError(f'Values of type {values.dtype} can not be cached')
+  arrays[name] = np.array(json.dumps(values.tolist(), default=_json_value))
+  return {'kind': 'json'}
+
+def _decode_values(spec, name, arrays):
+  """Decode values encoded by _encode_values
+
+  Args:
+      spec (dict): description of the encoded values
+      name (str): Name of the array in the archive
+      arrays (dict or numpy.lib.npyio.NpzFile): Arrays of the archive
+
+  Returns:
+      numpy.ndarray: The values
+  """
+  if spec['kind'] == 'array':
+    return arrays[name]
+  values = json.loads(str(arrays[name]))
+  result = np.empty(len(values), dtype=object)
+  result[:] = values
+  return result
+
+def encode_sheets(sheets):
+  """Encode parsed sheets into arrays and metadata that are saved without pickle
+
+  Args:
+      sheets (dict): The parsed sheets, {'sheet name': pandas.DataFrame}
+
+  Returns:
+      tuple: {'name': numpy.ndarray} and the JSON serializable metadata
+  """
+  arrays = {}
+  metadata = []
+  for i, (sheet_name, df) in enumerate(sheets.items()):
+    if isinstance(df.index, pd.RangeIndex):
+      index = {'range': [df.index.start, df.index.stop, df.index.step]}
+    else:
+      index = _encode_values(df.index, f's{i}_index', arrays)
+    columns = [_encode_values(df.iloc[:, j], f's{i}_c{j}', arrays) for j in range(df.shape[1])]
+    metadata.append({'name': sheet_name, 'columns': list(df.columns), 'index': index, 'values': columns})
+  # raises TypeError for sheet or column names that are not JSON values
+  json.dumps(metadata, default=_json_value)
+  return arrays, metadata
+
+def decode_sheets(arrays, metadata):
+  """Decode sheets encoded by encode_sheets
+
+  Args:
+      arrays (dict or numpy.lib.npyio.NpzFile): The arrays
+      metadata (list): The metadata
+
+  Returns:
+      dict: The parsed sheets, {'sheet name': pandas.DataFrame}
+  """
+  sheets = {}
+  for i, sheet in enumerate(metadata):
+    if 'range' in sheet['index']:
+      index = pd.RangeIndex(*sheet['index']['range'])
+    else:
+      index = pd.Index(_decode_values(sheet['index'], f's{i}_index', arrays))
+    data = {j: _decode_values(spec, f's{i}_c{j}', arrays) for j, spec in enumerate(sheet['values'])}
+    df = pd.DataFrame(data, index=index)
+    df.columns = sheet['columns'] if len(sheet['columns']) > 0 else df.columns
+    sheets[sheet['name']] = df
+  return sheets
+
+
+
+class WorkbookCache(object):
+  """
+    On-disk cache of parsed excel workbooks, keyed by the SHA-256 of the file content.
+    Entries are evicted in least recently used order once the cache exceeds its size limit.
+    Entries are .npz archives loaded without pickle, so that no code is run from the cache directory.
+  """
+
+  def __init__(self, cache_dir=None, max_size=512*1024**2):
+    """Constructor
+
+    Args:
+        cache_dir (str, optional): Directory of the cache (defaults to $BAHAMAS_CACHE_DIR or ~/.cache/bahamas)
+        max_size (int, optional): Maximum size of the cache in bytes (defaults to 512 MB)
+    """
+    if cache_dir is None:
+      cache_dir = os.environ.get('BAHAMAS_CACHE_DIR', default_cache_dir)
+    self._cache_dir = cache_dir
+    self._max_size = max_size
+    os.makedirs(self._cache_dir, exist_ok=True)
+
+  @staticmethod
+  def key(excel_file):
+    """Compute the cache key of an excel file
+
+    Args:
+        excel_file (str or file-like): The excel file
+
+    Returns:
+        str: SHA-256 hex digest of the file content
+    """
+    sha = hashlib.sha256()
+    if hasattr(excel_file, 'read'):
+      pos = excel_file.tell()
+      sha.update(excel_file.read())
+      excel_file.seek(pos)
+    else:
+      with open(excel_file, 'rb') as f:
+        for block in iter(lambda: f.read(1024*1024), b''):
+          sha.update(block)
+    return sha.hexdigest()
+
+  def _path(self, key):
+    return os.path.join(self._cache_dir, key + '.npz')
+
+  def get(self, key):
+    """Get the parsed sheets stored under key
+
+    Args:
+        key (str): Cache key
+
+    Returns:
+        dict or None: The parsed sheets, None if the key is not cached
+    """
+    path = self._path(key)
+    if not os.path.exists(path):
+      return None
+    try:
+      with np.load(path, allow_pickle=False) as npz:
+        sheets = decode_sheets(npz, json.loads(str(npz['metadata'])))
+    except Exception:
+      # a corrupt or incompatible entry is a miss
+      logger.warning('Remove unreadable cached workbook %s', key)
+      self._remove(path)
+      return None
+    # refresh access time for the LRU eviction
+    os.utime(path)
+    logger.info('Load cached workbook %s', key)
+    return sheets
+
+  def put(self, key, sheets):
+    """Store the parsed sheets under key
+
+    Args:
+        key (str): Cache key
+        sheets (dict): The parsed sheets, {'sheet name': pandas.DataFrame}
+    """
+    try:
+      arrays, metadata = encode_sheets(sheets)
+    except TypeError as err:
+      logger.warning('Workbook %s is not cached: %s', key, err)
+      return
+    # write to a temporary file first so that concurrent readers never see partial entries
+    fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+    os.close(fd)
+    try:
+      with open(tmp, 'wb') as f:
+        np.savez(f, metadata=np.array(json.dumps(metadata, default=_json_value)), **arrays)
+      os.replace(tmp, self._path(key))
+    finally:
+      if os.path.exists(tmp):
+        os.remove(tmp)
+    self._evict(keep=key)
+
+  def load(self, excel_file, reader):
+    """Get the parsed sheets of excel_file from the cache, parse and store them on a miss
+
+    Args:
+        excel_file (str or file-like): The excel file
+        reader (callable): Function that parses excel_file into a dict of sheets
+
+    Returns:
+        dict: The parsed sheets, {'sheet name': pandas.DataFrame}
+    """
+    key = self.key(excel_file)
+    sheets = self.get(key)
+    if sheets is None:
+      sheets = reader(excel_file)
+      self.put(key, sheets)
+    return sheets
+
+  def size(self):
+    """Total size of the cached entries in bytes
+
+    Returns:
+        int: size in bytes
+    """
+    return sum(os.path.getsize(path) for path in self._entries())
+
+  def clear(self):
+    """Remove all cached entries
+    """
+    for path in self._entries():
+      os.remove(path)
+
+  def _entries(self):
+    return [os.path.join(self._cache_dir, f) for f in os.listdir(self._cache_dir) if f.endswith('.npz')]
+
+  def _remove(self, path):
+    try:
+      os.remove(path)
+    except OSError:
+      pass
+
+  def _evict(self, keep=None):
+    """Remove least recently used entries until the cache fits into its size limit
+
+    Args:
+        keep (str, optional): Key that is never evicted (defaults to None)
+    """
+    entries = sorted(self._entries(), key=os.path.getmtime)
+    total = sum(os.path.getsize(path) for path in entries)
+    for path in entries:
+      if total <= self._max_size:
+        break
+      if keep is not None and path == self._path(keep):
+        continue
+      total -= os.path.getsize(path)
+      os.remove(path)
+      logger.info('Evict cached workbook %s', os.path.basename(path))
@@ -2,13 +2,13 @@
 Created on September 7, 2025
 @author: wangc, chene
 """
+import numpy as np
 import pandas as pd
 import warnings
-import copy
 warnings.filterwarnings('ignore')
 import logging
 
-from .utils import read_excel
+from .utils import read_workbook
 
 logger = logging.getLogger('BAHAMAS.CCCG')
 
@@ -56,33 +56,34 @@ def merge_multi_lists(*arg):
     master = drop_dup(master)
     return master
 
+def group_key(src_arr):
+    """Canonical key of a CCCG, i.e., the set of its component row ids
+
+    Args:
+        src_arr (pd.DataFrame): CCCG data, indexed by the row ids of the component table
+
+    Returns:
+        frozenset: row ids of the components in the CCCG
+    """
+    return frozenset(src_arr.index)
+
 def drop_dup(list_pd):
-    """Drop duplicated CCCG data
+    """Drop duplicated CCCG data, two CCCGs are duplicates if they hold the same components
 
     Args:
         list_pd (list): list of pd.DataFrame (CCCG data)
 
     Returns:
-        list: list of pd.DataFrame (CCCG data) without duplications
+        list: list of pd.DataFrame (CCCG data) without duplications, in order of first appearance
     """
     filtered_list_pd = list()
-
-    flag = False
+    seen = set()
 
     for pd_tmp in list_pd:
-        if len(filtered_list_pd) == 0:
-            filtered_list_pd.append(list_pd[0])
-            continue
-
-        for c in filtered_list_pd:
-            # Drop index comparison
-            c = c.reset_index(drop=True)
-            pd_tmp = pd_tmp.reset_index(drop=True)
-            if pd_tmp.equals(c):
-                flag = True
-        if not flag:
+        key = group_key(pd_tmp)
+        if key not in seen:
+            seen.add(key)
             filtered_list_pd.append(pd_tmp)
-        flag = False
 
     return filtered_list_pd
 
@@ -169,10 +170,10 @@ def match_multi_on(src_arr, col_name):
         # Check if multiple dependencies
         matching_rows = src_arr[col_name].notna()
 
-        tmp = src_arr[matching_rows].reset_index(drop=True)
+        tmp = src_arr[matching_rows]
 
-        # Result is a CCCG
-        for i in range(len(tmp)):
+        # Result is a CCCG, keep the row ids of the component table
+        for i in tmp.index:
             row = tmp.loc[[i]]
             CCCG_arr.append(row)
 
@@ -193,6 +194,140 @@ def match_multi_list_on(list_pd, col_name):
 
     return CCCG_arr
 
+def expand_configs(df_pd):
+    """Expand Function_Config, Input_Config and Design_Config into one column per variable, i.e.,
+    Function_1, Function_2, ..., Input_1, ... and Design_1, ...
+
+    Args:
+        df_pd (pd.DataFrame): Component table
+
+    Returns:
+        pd.DataFrame: Component table with expanded coupling factors
+    """
+    df_pd_tmp = df_pd
+    for factor in ['Function', 'Input', 'Design']:
+        big = df_pd[f'{factor}_Config'].str.split('; ', expand=True)
+        big.columns = [f'{factor}_{i+1}' for i in range(big.shape[1])]
+        df_pd_tmp = pd.concat([df_pd_tmp.drop(columns=[f'{factor}_Config']), big], axis=1)
+    return df_pd_tmp
+
+def aggregate_configs(df_pd):
+    """Aggregate the variables of each component into sorted Function_Config, Input_Config and Design_Config
+    strings, separated by ";", as reported in the CCCGs
+
+    Args:
+        df_pd (pd.DataFrame): Component table
+
+    Returns:
+        pd.DataFrame: Component table with the aggregated Config columns after the other columns
+    """
+    factors = ['Function', 'Input', 'Design']
+    table = df_pd.drop(columns=[f'{factor}_Config' for factor in factors])
+    for factor in factors:
+        table[f'{factor}_Config'] = [clean_string(';'.join(sorted(values)))
+                                     for values in split_config(df_pd[f'{factor}_Config'])]
+    return table
+
+def split_config(config):
+    """Split the Config column of a coupling factor into the variables of each component
+
+    Args:
+        config (pd.Series): Config column, variables separated by "; "
+
+    Returns:
+        list: list of variables of each component, empty if the cell is not a string
+    """
+    return [cell.split('; ') if isinstance(cell, str) else [] for cell in config]
+
+def bitset(rows, size):
+    """Build the bitset of a set of components, bit r is set if component r is a member
+
+    Args:
+        rows (list): component row positions
+        size (int): number of components
+
+    Returns:
+        int: the bitset
+    """
+    bits = np.zeros(size, dtype=bool)
+    bits[list(rows)] = True
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+def bitset_rows(mask):
+    """Get the members of a bitset
+
+    Args:
+        mask (int): the bitset
+
+    Returns:
+        numpy.ndarray: sorted component row positions
+    """
+    data = np.frombuffer(mask.to_bytes((mask.bit_length() + 7)//8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder='little'))
+
+def inverted_index(tokens):
+    """Build the inverted index of a coupling factor
+
+    Args:
+        tokens (list): list of variables of each component, see split_config
+
+    Returns:
+        dict: {variable: bitset of the components}
+    """
+    rows = dict()
+    for row, values in enumerate(tokens):
+        for value in values:
+            rows.setdefault(value, []).append(row)
+    return {value: bitset(members, len(tokens)) for value, members in rows.items()}
+
+def ordered_values(group, tokens):
+    """Get the variables of the components of a group in order of first appearance, scanning the
+    expanded columns *_1, *_2, etc. one after the other (the order of unique_cells)
+
+    Args:
+        group (numpy.ndarray): sorted component row positions
+        tokens (list): list of variables of each component, see split_config
+
+    Returns:
+        list: unique variables of the group
+    """
+    seen = dict()
+    depth = max(len(tokens[row]) for row in group)
+    for col in range(depth):
+        for row in group:
+            if col < len(tokens[row]):
+                seen.setdefault(tokens[row][col], None)
+    return list(seen)
+
+def match_index_on(groups, tokens, index):
+    """Inverted index counterpart of match_CCCG_list_on: split each group into the CCCGs of the components
+    that share a variable of an additional coupling factor, one AND of bitsets per variable
+
+    Args:
+        groups (list): list of groups, each a bitset of the components
+        tokens (list): list of variables of each component for the coupling factor, see split_config
+        index (dict): inverted index of the coupling factor, see inverted_index
+
+    Returns:
+        list: CCCGs as bitsets, without duplications, in order of first appearance
+    """
+    CCCG_arr = dict()
+    for group in groups:
+        for value in ordered_values(bitset_rows(group), tokens):
+            CCCG_arr.setdefault(group & index[value], None)
+    return list(CCCG_arr)
+
+def merge_index_lists(*arg):
+    """Merge multiple lists of CCCGs given as bitsets and remove duplicates
+
+    Args:
+        arg (list): lists of CCCGs
+
+    Returns:
+        list: Merged CCCGs without duplications, in order of first appearance
+    """
+    return list(dict.fromkeys(group for groups in arg for group in groups))
+
 class CCCG(object):
   """
   Compute CCCGs for given list of components of diversity and redundancy system
@@ -201,8 +336,10 @@ class CCCG(object):
       object (_type_): _description_
   """
 
-  def __init__(self, file):
+  def __init__(self, file, cache=None):
     self._sys_diagram = file
+    self._cache = cache
+    self._table = None # Component table with aggregated Config strings
     self._cccg_final = []
     self._cccg_function = []
     self._cccg_input = []
@@ -210,17 +347,9 @@ class CCCG(object):
     self._cccg_single = []
     self._cccg_function_input = []
     self._cccg_function_design = []
-    self._cccg_input_function = []
-    self._cccg_input_design = []
     self._cccg_design_input = []
-    self._cccg_design_function = []
     self._cccg_double = []
     self._cccg_function_input_design = []
-    self._cccg_function_design_input = []
-    self._cccg_input_design_function = []
-    self._cccg_input_function_design = []
-    self._cccg_design_input_function = []
-    self._cccg_design_function_input = []
     self._cccg_triple = []
     self._function_all = []
     self._input_all = []
@@ -229,94 +358,69 @@ class CCCG(object):
 
   def generate(self, config=None):
     """
-    Generate CCCGs based on three coupling factors, i.e., Function, Input and Design
+    Generate CCCGs based on three coupling factors, i.e., Function, Input and Design. The CCCGs are derived
+    from an inverted index of each coupling factor (variable -> bitset of the components) by AND of the
+    bitsets, in the order of match_CCCG_on and match_CCCG_list_on
     """
     logger.info("Generating")
     # Read data file into Pandas
-    df_pd = read_excel(self._sys_diagram)
+    # the component table is the first sheet of the workbook
+    df_pd = next(iter(read_workbook(self._sys_diagram, cache=self._cache).values()))
     
-    # Expand Function_Config
-    func_big = df_pd["Function_Config"].str.split('; ', expand=True)
-    func_big.columns = [f'Function_{i+1}' for i in range(func_big.shape[1])]
-    
-    # Expand Function_Config
-    func_big = df_pd["Function_Config"].str.split('; ', expand=True)
-    func_big.columns = [f'Function_{i+1}' for i in range(func_big.shape[1])]
-
-    df_pd_tmp = pd.concat([df_pd.drop(columns=['Function_Config']), func_big], axis=1)
-
-    # Expand Input_Config
-    inpt_big = df_pd["Input_Config"].str.split('; ', expand=True)
-    inpt_big.columns = [f'Input_{i+1}' for i in range(inpt_big.shape[1])]
-
-    df_pd_tmp = pd.concat([df_pd_tmp.drop(columns=['Input_Config']), inpt_big], axis=1)
-
-    # Expand Design Config
-    dsgn_big = df_pd["Design_Config"].str.split('; ', expand=True)
-    dsgn_big.columns = [f'Design_{i+1}' for i in range(dsgn_big.shape[1])]
-
-    df_pd_tmp = pd.concat([df_pd_tmp.drop(columns=['Design_Config']), dsgn_big], axis=1)
-
-    # Get CCCG on single coupling factor
-    self._cccg_function = match_CCCG_on(df_pd_tmp, 'Function_') # list[first variable pd.DataFrame, second variable pd.DataFrame, ...]
-    self._cccg_design   = match_CCCG_on(df_pd_tmp, 'Design_')
-    self._cccg_input    = match_CCCG_on(df_pd_tmp, 'Input_')
+    # Aggregated Config strings of each component, joined to the CCCGs by get
+    self._table = aggregate_configs(df_pd)
+
+    # Inverted index of each coupling factor, {variable: bitset of the components}
+    tokens = {factor: split_config(df_pd[f'{factor}_Config']) for factor in ['Function', 'Input', 'Design']}
+    index = {factor: inverted_index(tokens[factor]) for factor in tokens}
+    def match(groups, factor):
+      return match_index_on(groups, tokens[factor], index[factor])
+    def multi(groups):
+      # remove single entry since there is no other component that has shared coupling factors
+      return [x for x in groups if x & (x - 1) != 0]
+
+    # Get CCCG on single coupling factor, i.e., split the group of all components
+    everything = [(1 << len(df_pd)) - 1] if len(df_pd) > 0 else []
+    function = match(everything, 'Function') # list[first variable group, second variable group, ...]
+    design   = match(everything, 'Design')
+    inpt     = match(everything, 'Input')
 
     # Merge all CCCGs on single coupling factor and drop duplicates
-    self._cccg_single   = merge_multi_lists(self._cccg_function,
-                                    self._cccg_design,
-                                    self._cccg_input
-                                    )
-    # remove single entry since there is no other component that has shared coupling factors
-    self._cccg_single = [x for x in self._cccg_single if len(x) != 1]
+    single = multi(merge_index_lists(function, design, inpt))
 
-    # Get CCCG on two coupling factor
-    self._cccg_function_input  = match_CCCG_list_on(self._cccg_function, 'Input_')
-    self._cccg_function_design = match_CCCG_list_on(self._cccg_function, 'Design_')
-
-    self._cccg_input_function  = match_CCCG_list_on(self._cccg_input, 'Function_')
-    self._cccg_input_design = match_CCCG_list_on(self._cccg_input, 'Design_')
-
-    self._cccg_design_input  = match_CCCG_list_on(self._cccg_design, 'Input_')
-    self._cccg_design_function = match_CCCG_list_on(self._cccg_design, 'Function_')
+    # Get CCCG on two coupling factor. The intersection does not depend on the order of the coupling factors,
+    # e.g., the Input groups of the Function groups are the Function groups of the Input groups, so each
+    # pair is computed once, in the order that comes first in the merged list
+    function_design = match(function, 'Design')
+    function_input  = match(function, 'Input')
+    design_input    = match(design, 'Input')
 
     # Merge all CCCGs on two coupling factor and drop duplicates
-    self._cccg_double   = merge_multi_lists(self._cccg_function_design,
-                                    self._cccg_function_input,
-                                    self._cccg_design_input,
-                                    self._cccg_design_function,
-                                    self._cccg_input_design,
-                                    self._cccg_input_function
-                                    )
-    # remove single entry since there is no other component that has shared coupling factors
-    self._cccg_double = [x for x in self._cccg_double if len(x) != 1]
-
-    # Get CCCG on three coupling factor
-    self._cccg_function_input_design = match_CCCG_list_on(self._cccg_function_input, 'Design_')
-    self._cccg_function_design_input = match_CCCG_list_on(self._cccg_function_design, 'Input_')
-
-    self._cccg_input_design_function = match_CCCG_list_on(self._cccg_input_design, 'Function_')
-    self._cccg_input_function_design = match_CCCG_list_on(self._cccg_input_function, 'Design_')
-
-    self._cccg_design_input_function = match_CCCG_list_on(self._cccg_design_input, 'Function_')
-    self._cccg_design_function_input = match_CCCG_list_on(self._cccg_design_function, 'Input_')
+    double = multi(merge_index_lists(function_design, function_input, design_input))
+
+    # Get CCCG on three coupling factor, computed once for the same reason
+    function_input_design = match(function_input, 'Design')
 
     # Merge all CCCGs on triple coupling factor and drop duplicates
-    self._cccg_triple   = merge_multi_lists(self._cccg_function_input_design,
-                                    self._cccg_function_design_input,
-                                    self._cccg_input_design_function,
-                                    self._cccg_input_function_design,
-                                    self._cccg_design_input_function,
-                                    self._cccg_design_function_input,
-                                    )
-    # remove single entry since there is no other component that has shared coupling factors
-    self._cccg_triple = [x for x in self._cccg_triple if len(x) != 1]
+    triple = multi(function_input_design)
 
     # Merge all CCCGs and drop duplicates
-    self._cccg_final = merge_multi_lists(self._cccg_single,
-                                self._cccg_double,
-                                self._cccg_triple
-    )
+    final = merge_index_lists(single, double, triple)
+
+    # CCCGs are kept as component row positions
+    def rows(groups):
+      return [bitset_rows(group) for group in groups]
+    self._cccg_function = rows(function)
+    self._cccg_design = rows(design)
+    self._cccg_input = rows(inpt)
+    self._cccg_single = rows(single)
+    self._cccg_function_input = rows(function_input)
+    self._cccg_function_design = rows(function_design)
+    self._cccg_design_input = rows(design_input)
+    self._cccg_double = rows(double)
+    self._cccg_function_input_design = rows(function_input_design)
+    self._cccg_triple = rows(triple)
+    self._cccg_final = rows(final)
 
   def get(self, name):
     """Get CCCGs
@@ -354,44 +458,37 @@ class CCCG(object):
           f.write('\n')
 
   def aggregate(self, cccgs):
-    """Aggregate expanded Function, Input, Design into Function_Config, Input_Config and Design_Config
+    """Join the CCCGs to the aggregated Function_Config, Input_Config and Design_Config of the components,
+    and identify their shared coupling factors
 
     Args:
-        cccgs (list): list of pd.DataFrame (i.e., CCCGs)
+        cccgs (list): list of CCCGs, each given as component row positions, or as pd.DataFrame of the
+          component table, e.g., from match_CCCG_on
 
     Returns:
-        list: list of aggregated CCCGs
+        list: list of aggregated CCCGs (pd.DataFrame)
     """
-    cccg_list = copy.deepcopy(cccgs) # deepcopy is required, otherwise data manipulation
+    if self._table is None:
+      raise IOError('No component table is loaded, call generate first!')
+    configs = {factor: self._table[f'{factor}_Config'].to_numpy() for factor in ['Function', 'Input', 'Design']}
     cccg_transfer = []
-    for pd_arr in cccg_list:
+    for group in cccgs:
+        if isinstance(group, pd.DataFrame):
+          rows = self._table.index.get_indexer(group.index)
+          if np.any(rows < 0):
+            unknown = group[rows < 0]
+            names = unknown['Component_Name'] if 'Component_Name' in unknown else unknown.index
+            raise IOError(f'Components {list(names)} are not in the component table!')
+          group = rows
+        pd_arr = self._table.iloc[group]
         coupling_factor = []
-        function_columns = [col for col in pd_arr.columns if col.startswith('Function_')]
-        if len(function_columns) > 0:
-          pd_arr["Function_Config"] = pd_arr[function_columns].apply(lambda row: ';'.join(sorted(str(v) for v in row.values)), axis=1)
-          pd_arr.drop(columns=function_columns, inplace=True)
-          pd_arr["Function_Config"] = pd_arr["Function_Config"].apply(clean_string)
-          if len(pd_arr["Function_Config"]) > 1 and pd_arr["Function_Config"].nunique() == 1 and pd_arr["Function_Config"].iloc[0] != '':
-              coupling_factor.append('Function')
-
-        input_columns = [col for col in pd_arr.columns if col.startswith('Input_')]
-        if len(input_columns) > 0:
-          pd_arr["Input_Config"] = pd_arr[input_columns].apply(lambda row: ';'.join(sorted(str(v) for v in row.values)), axis=1)
-          pd_arr.drop(columns=input_columns, inplace=True)
-          pd_arr["Input_Config"] = pd_arr["Input_Config"].apply(clean_string)
-          if len(pd_arr["Input_Config"]) > 1 and pd_arr["Input_Config"].nunique() == 1 and pd_arr["Input_Config"].iloc[0] != '':
-              coupling_factor.append('Input')
-
-        design_columns = [col for col in pd_arr.columns if col.startswith('Design_')]
-        if len(design_columns) > 0:
-          pd_arr["Design_Config"] = pd_arr[design_columns].apply(lambda row: ';'.join(sorted(str(v) for v in row.values)), axis=1)
-          pd_arr.drop(columns=design_columns, inplace=True)
-          pd_arr["Design_Config"] = pd_arr["Design_Config"].apply(clean_string)
-          if len(pd_arr["Design_Config"]) > 1 and pd_arr["Design_Config"].nunique() == 1 and pd_arr["Design_Config"].iloc[0] != '':
-              coupling_factor.append('Design')
+        if len(group) > 1:
+          for factor, values in configs.items():
+            first = values[group[0]]
+            if first != '' and all(values[row] == first for row in group):
+              coupling_factor.append(factor)
         if len(coupling_factor) > 0:
-          pd_arr['Coupling_Factor'] = ";".join(coupling_factor)
+          pd_arr = pd_arr.assign(Coupling_Factor=";".join(coupling_factor))
         cccg_transfer.append(pd_arr)
 
     return cccg_transfer
-
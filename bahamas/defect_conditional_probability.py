@@ -3,32 +3,59 @@
 import logging
 import numpy as np
 
-from .utils import read_excel
+from .utils import get_sheet
 
 logger = logging.getLogger('BAHAMAS.DCP')
 
-def stage_dcp_calculation(excel_file, sheet_name):
-  """Defect conditional probability calculation for each SDLC stage
+def get_stage_review_trigger(excel_file, sheet_name):
+  """Get the average review number and trigger coverage of an SDLC stage
 
   Args:
-      excel_file (str): The filename of the spreadsheet with the review number and trigger coverage
+      excel_file (str or dict): The filename of the spreadsheet with the review number and trigger coverage,
+        or its sheets loaded by utils.read_workbook
       sheet_name (str): The sheet name in the spreadsheet with the data (i.e., the SDLC stage name)
 
+  Returns:
+      tuple: average review number and trigger coverage
+  """
+  df = get_sheet(excel_file, sheet_name, usecols=["Review Number","Trigger Coverage"])
+  df = df.dropna()
+  if df.empty:
+    logger.error('Try to process sheet "%s", but got empty inputs!', sheet_name)
+    raise IOError(f'Try to process sheet "{sheet_name}", but got empty inputs!')
+  reviews = df.iloc[:, 0].mean()
+  triggers = df.iloc[:, 1].mean()
+  return reviews, triggers
+
+def dcp_from_review_trigger(reviews, triggers):
+  """Defect conditional probability for the given review number and trigger coverage
+
+  Args:
+      reviews (float): average review number
+      triggers (float): average trigger coverage
+
   Returns:
       dcp (float): defect conditional probability
   """
-  logger.info('Calculate DCP for SDLC "%s" stage', sheet_name)
   # TODO: how to determine G value?
   # G = 0.25 # Based on normalization
   G = 1.0
 #   G = 0.125 # given by previous implementation, need to be verified
-  df = read_excel(excel_file, sheet_name=sheet_name, usecols=["Review Number","Trigger Coverage"])
-  df = df.dropna()
-  if df.empty:
-    logger.error('Try to process %s, but got empty inputs!', excel_file)
-    raise IOError(f'Try to process {excel_file}, but got empty inputs!')
-  reviews = df.iloc[:, 0].mean()
-  triggers = df.iloc[:, 1].mean()
-  dcp = G*np.exp(-4.*reviews*triggers)
+  return G*np.exp(-4.*reviews*triggers)
+
+def stage_dcp_calculation(excel_file, sheet_name):
+  """Defect conditional probability calculation for each SDLC stage
+
+  Args:
+      excel_file (str or dict): The filename of the spreadsheet with the review number and trigger coverage,
+        or its sheets loaded by utils.read_workbook
+      sheet_name (str): The sheet name in the spreadsheet with the data (i.e., the SDLC stage name)
+
+  Returns:
+      dcp (float): defect conditional probability
+  """
+  logger.info('Calculate DCP for SDLC "%s" stage', sheet_name)
+  reviews, triggers = get_stage_review_trigger(excel_file, sheet_name)
+  dcp = dcp_from_review_trigger(reviews, triggers)
 
   return dcp
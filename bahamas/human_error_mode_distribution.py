@@ -6,15 +6,16 @@ import logging
 
 logger = logging.getLogger('BAHAMAS.HEMD')
 
-from .utils import SDLC_stages, human_error_modes, read_excel
+from .utils import SDLC_stages, human_error_modes, get_sheet
 
 
 def get_hemd_from_spreadsheet(spreadsheet_file, sheet_name="HEMD", distribution="lognorm"):
     """
     Parameters
     ----------
-    spreadsheet_file : str
-        Filename of the spreadsheet to read in
+    spreadsheet_file : str or dict
+        Filename of the spreadsheet to read in, or its sheets loaded by
+        ``utils.read_workbook``
     sheet_name : str
         Name of the sheet with the human error mode distribution data
     distribution : str
@@ -24,14 +25,14 @@ def get_hemd_from_spreadsheet(spreadsheet_file, sheet_name="HEMD", distribution=
     -------
     hemd, dist_dict : dict, dict
         The first dictionary contains the rvs sampling function for the action
-        type; the second dictionary contains the distribution dictionary --- both
+        type (accepting a ``random_state`` generator); the second dictionary contains the distribution dictionary --- both
         are keyed by the action type.
 
     gets the human error mode distributions from a spreadsheet
     """
     hemd = {}
     dist_dict = {}
-    df = read_excel(spreadsheet_file,sheet_name=sheet_name)
+    df = get_sheet(spreadsheet_file, sheet_name)
     for row in df.iterrows():
         series = row[1]
         # logger.info(f"{series.key} {series.sigma} {series.mu}")
@@ -41,6 +41,9 @@ def main():
   parser = argparse.ArgumentParser(description='')
   parser.add_argument('-i', '--input', type=str, default='../examples/bbn.toml', help='The path to the input file')
   parser.add_argument('-o', '--output', type=str, default='output.csv', help='The output file path to save the output to')
+  parser.add_argument('-b', '--batch', type=str, default=None, help='Directory or manifest file of task list workbooks to assess with the BBN config of the input file')
+  parser.add_argument('-f', '--format', type=str, default=None, choices=['csv', 'parquet', 'npz'], help='The format of the output file (defaults to the extension of the output file)')
+  parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes of the batch assessment')
   # parse the arguments
   args = parser.parse_args()
   in_file = args.input
@@ -51,9 +54,12 @@ def main():
   out_file =  os.path.join(cwd, out_file)
 
   module = Workflow(config)
-  module.run()
-
-  # logger.info('Outputs are saved to: %s', out_file)
+  if args.batch is not None:
+    module.run_batch(os.path.join(cwd, args.batch), out_file, workers=args.workers, style=args.format)
+  else:
+    module.run()
+    if module.bbn is not None:
+      module.write(module.bbn, out_file, style=args.format)
 
   logger.info(' ... Complete!')
 
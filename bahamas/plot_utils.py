@@ -1,29 +1,95 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
+import numpy as np
 import plotly.graph_objects as go
 import plotly.io as pio
 
 # pio.renderers.default = "browser"
 
 
-def plot_histogram(data_dict, title, save=False, show=True):
-  """Plot histogram for sampled data
+def histogram_edges(data, bins=50, log=False):
+  """Compute bin edges shared by several sets of samples
 
   Args:
-      data_dict (dict): dictionary of sampled data
+      data (list): list of sampled data
+      bins (int, optional): Number of bins (defaults to 50)
+      log (bool, optional): Log-spaced bins over the positive samples if True (defaults to False)
+
+  Returns:
+      numpy.ndarray: bin edges, shape (bins+1,)
+  """
+  values = [np.asarray(values) for values in data]
+  if log:
+    values = [v[v > 0] for v in values]
+  values = [v for v in values if v.size > 0]
+  if len(values) == 0:
+    return np.linspace(0., 1., bins+1)
+  low = min(np.min(v) for v in values)
+  high = max(np.max(v) for v in values)
+  if log:
+    if high <= low:
+      low, high = low/10., high*10.
+    return np.logspace(np.log10(low), np.log10(high), bins+1)
+  if high <= low:
+    low, high = low - 0.5, high + 0.5
+  return np.linspace(low, high, bins+1)
+
+def _trim(counts, edges):
+  """Remove the empty bins below the first and above the last filled bin
+
+  Args:
+      counts (numpy.ndarray): bin counts
+      edges (numpy.ndarray): bin edges
+
+  Returns:
+      tuple: trimmed counts and edges
+  """
+  filled = np.flatnonzero(counts)
+  if filled.size == 0:
+    return counts, edges
+  return counts[filled[0]:filled[-1]+1], edges[filled[0]:filled[-1]+2]
+
+def plot_histogram(data_dict, title, save=False, show=True, bins=50, log=False, weights=None):
+  """Plot histogram for sampled data. The samples are binned with numpy and plotted as bar traces, so that the
+  figure size does not depend on the number of samples
+
+  Args:
+      data_dict (dict): dictionary of sampled data, or of pre-binned (counts, edges) tuples, e.g., from
+        StreamingSummary.histogram
       title (str): title for the plot
       save (bool, optional): Save plot into .png file if True (defaults to False)
+      show (bool, optional): Show the plot if True (defaults to True)
+      bins (int, optional): Number of bins of the sampled data (defaults to 50)
+      log (bool, optional): Log-spaced bins and a log scale value axis if True, samples that are not positive
+        are left out (defaults to False)
+      weights (numpy.ndarray, optional): weights of the sampled data, e.g., importance sampling weights
+        (defaults to None)
 
   Returns:
     figure object: plotly figure object
   """
+  samples = [values for values in data_dict.values() if not isinstance(values, tuple)]
+  edges = histogram_edges(samples, bins=bins, log=log) if len(samples) > 0 else None
   hist_data = []
   for key, values in data_dict.items():
-    hist_data.append(go.Histogram(x=values, name=key, opacity=0.75))
+    if isinstance(values, tuple):
+      counts, key_edges = _trim(*values)
+    else:
+      counts, key_edges = np.histogram(values, bins=edges, weights=weights)
+    if log:
+      # bars on the log10 axis, which keeps the widths of log-spaced bins uniform
+      key_edges = np.log10(key_edges)
+    centers = 0.5*(key_edges[1:] + key_edges[:-1])
+    hist_data.append(go.Bar(x=centers, y=counts, width=np.diff(key_edges), name=key, opacity=0.75))
   # create a layout
-  layout = go.Layout(title=title, barmode='overlay', xaxis_title='Value', yaxis_title='Count')
+  layout = go.Layout(title=title, barmode='overlay', bargap=0, xaxis_title='Value', yaxis_title='Count')
   # create a figure
   fig = go.Figure(data=hist_data, layout=layout)
+  if log and len(hist_data) > 0:
+    low = min(np.min(trace.x) for trace in hist_data)
+    high = max(np.max(trace.x) for trace in hist_data)
+    decades = np.arange(np.floor(low), np.ceil(high) + 1).astype(int)
+    fig.update_xaxes(tickvals=decades, ticktext=[f'1e{k}' for k in decades])
   # save the plot as image
   if save:
     fig.write_image(title+".png")
@@ -33,4 +99,3 @@ def plot_histogram(data_dict, title, save=False, show=True):
     # fig.write_html("my_plot.html", auto_open=True, full_html=True)
 
   return fig
-
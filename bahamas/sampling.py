@@ -0,0 +1,35 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import logging
+from scipy.stats import qmc
+
+logger = logging.getLogger('BAHAMAS.Sampling')
+
+# 'random': pseudo-random sampling, 'lhs': Latin hypercube sampling, 'sobol': scrambled Sobol sequence
+sampling_methods = ['random', 'lhs', 'sobol']
+
+
+def uniform_design(method, dim, num_samples, rng):
+  """Generate a design of uniform samples on the unit hypercube, all inputs share one
+  design so that the samples are space filling in the joint input space
+
+  Args:
+      method (str): Sampling method, 'lhs' or 'sobol'
+      dim (int): Number of inputs, at most scipy.stats.qmc.Sobol.MAXDIM for Sobol sequences
+      num_samples (int): Number of samples, a power of 2 keeps the balance properties of Sobol sequences
+      rng (numpy.random.Generator): Random number generator used for the randomization of the design
+
+  Returns:
+      numpy.ndarray: uniform samples, shape (dim, num_samples)
+  """
+  if method == 'lhs':
+    engine = qmc.LatinHypercube(d=dim, seed=rng)
+  elif method == 'sobol':
+    if dim > qmc.Sobol.MAXDIM:
+      raise ValueError(f'Sobol sampling supports at most {qmc.Sobol.MAXDIM} inputs, the design has {dim} inputs '
+                       '(the actions of the task list, the ODC and UCA correlation terms, and for the sensitivity '
+                       'analysis twice as many)! Use lhs or random sampling instead.')
+    engine = qmc.Sobol(d=dim, scramble=True, seed=rng)
+  else:
+    raise IOError(f'Unrecognized sampling method {method}. Valid methods are {sampling_methods}!')
+  return engine.random(num_samples).T
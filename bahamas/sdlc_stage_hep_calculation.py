@@ -1,27 +1,58 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
 import numpy as np
+import pandas as pd
 from scipy.stats import lognorm
 import logging
 from . import human_error_mode_distribution
-from .utils import read_excel
+from .utils import get_sheet
 
 logger = logging.getLogger('BAHAMAS.HEP')
 
-def sdlc_stage_hep_calculation(excel_file_path, sheet_name, hemd, num_samples=100, distribution="lognorm"):
+def get_stage_actions(excel_file_path, sheet_name):
     """
     Parameters
     ----------
-    excel_file_path : str
-        Filename of the spreadsheet with the number of actions and types
+    excel_file_path : str or dict
+        Filename of the spreadsheet with the number of actions and types, or its
+        sheets loaded by ``utils.read_workbook``
+    sheet_name : str
+        Sheet name in the spreadsheet with the data
+
+    Returns
+    -------
+    action_types : pandas.Series
+        The human error mode of each action of the SDLC stage
+    """
+    # Read the action types from the given sheet
+    df = get_sheet(excel_file_path, sheet_name, usecols=["Human Error Mode"])
+    df = df.dropna()
+    if df.empty:
+        logger.error('Try to process sheet "%s", but got empty inputs for "Human Error Mode"!', sheet_name)
+        raise IOError(f'Try to process sheet "{sheet_name}", but got empty inputs "Human Error Mode"!')
+    return df.iloc[:, 0].astype(str).str.strip()
+
+def sdlc_stage_hep_calculation(excel_file_path, sheet_name, hemd, num_samples=100, distribution="lognorm", random_state=None, uniforms=None):
+    """
+    Parameters
+    ----------
+    excel_file_path : str or dict
+        Filename of the spreadsheet with the number of actions and types, or its
+        sheets loaded by ``utils.read_workbook``
     sheet_name : str
         Sheet name in the spreadsheet with the data
     hemd : dict
-        Dictionary of rvs functions, keyed by action type
+        Dictionary of frozen distributions, keyed by action type
     num_samples : int
         Number of samples to generate for each action
     distribution : str
         Type of distribution to use (currently always "lognorm")
+    random_state : numpy.random.Generator, optional
+        Random number generator used for sampling (defaults to numpy's global state)
+    uniforms : numpy.array, optional
+        Uniform samples of shape (actions, num_samples) mapped through the inverse CDF
+        of each action, e.g., from a Latin hypercube or Sobol design (defaults to None,
+        i.e., random sampling)
 
     Returns
     -------
@@ -33,18 +64,21 @@ def sdlc_stage_hep_calculation(excel_file_path, sheet_name, hemd, num_samples=10
     spreadsheet, and calculates the human error probability distributions.
     """
     logger.info('Calculate SDLC "%s" stage HEP', sheet_name)
-    # Read the action types from the given sheet
-    df = read_excel(excel_file_path, sheet_name=sheet_name, usecols=["Human Error Mode"])
-    df = df.dropna()
-    if df.empty:
-        logger.error('Try to process %s, but got empty inputs for "Human Error Mode"!', excel_file_path)
-        raise IOError(f'Try to process {excel_file_path}, but got empty inputs "Human Error Mode"!')
-    num_actions = len(df)
-    action_types = df.iloc[:, 0].to_numpy()
-
-    # change to bounded method to avoid the explosion of total distribution
-    action_samples = np.array([hemd[action_types[i].strip()].rvs(num_samples) for i in range(num_actions)])
-    total = 1 - np.prod(1-action_samples, axis=0)
+    action_types = get_stage_actions(excel_file_path, sheet_name)
+
+    # Draw all actions of the same human error mode at once, and accumulate the stage
+    # total 1 - prod(1 - p) in log space without storing the (actions, samples) matrix
+    log_survival = np.zeros(num_samples)
+    codes, modes = pd.factorize(action_types)
+    for i, mode in enumerate(modes):
+        if uniforms is None:
+            action_samples = hemd[mode].rvs(size=(np.count_nonzero(codes == i), num_samples), random_state=random_state)
+        else:
+            action_samples = hemd[mode].ppf(uniforms[codes == i])
+        # change to bounded method to avoid the explosion of total distribution
+        with np.errstate(divide='ignore'):
+            log_survival += np.sum(np.log1p(-np.minimum(action_samples, 1.)), axis=0)
+    total = -np.expm1(log_survival)
 
     stage_mean = np.mean(total)
     # Fit the lognormal distribution to the total samples
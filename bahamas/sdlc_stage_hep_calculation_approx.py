@@ -4,25 +4,31 @@ import numpy as np
 from scipy.stats import lognorm, norm, truncnorm
 import logging
 
-from .utils import read_excel
+from .utils import get_sheet
 
 logger = logging.getLogger('BAHAMAS.HEPApprox')
 
-def sdlc_stage_hep_calculation_approx(excel_file_path, sheet_name, num_samples=100, distribution="norm"):
+def sdlc_stage_hep_calculation_approx(excel_file_path, sheet_name, num_samples=100, distribution="norm", random_state=None, uniforms=None):
     """
     This function reads in the human error probability (mean and std) from a
     spreadsheet and calculates the human error probability distributions.
 
     Parameters
     ----------
-    excel_file_path : str
-        Filename of the spreadsheet with the number of actions and types
+    excel_file_path : str or dict
+        Filename of the spreadsheet with the number of actions and types, or its
+        sheets loaded by ``utils.read_workbook``
     sheet_name : str
         Sheet name in the spreadsheet with the data
     num_samples : int
         Number of samples to generate for each action
     distribution : str
         Type of distribution to use (currently always "norm")
+    random_state : numpy.random.Generator, optional
+        Random number generator used for sampling (defaults to numpy's global state)
+    uniforms : numpy.array, optional
+        Uniform samples mapped through the inverse CDF, e.g., from a Latin hypercube
+        or Sobol design (defaults to None, i.e., random sampling)
 
     Returns
     -------
@@ -31,18 +37,21 @@ def sdlc_stage_hep_calculation_approx(excel_file_path, sheet_name, num_samples=1
     """
     logger.info('Calculate SDLC "%s" stage HEP', sheet_name)
     # Read the action types from the given sheet
-    df = read_excel(excel_file_path, sheet_name=sheet_name, usecols=["Human Error Probability (Mean)","Human Error Probability (STD)"])
+    df = get_sheet(excel_file_path, sheet_name, usecols=["Human Error Probability (Mean)","Human Error Probability (STD)"])
     df = df.dropna()
     if df.empty:
-        logger.error('Try to process %s, but got empty inputs!', excel_file_path)
-        raise IOError(f'Try to process {excel_file_path}, but got empty inputs !')
+        logger.error('Try to process sheet "%s", but got empty inputs!', sheet_name)
+        raise IOError(f'Try to process sheet "{sheet_name}", but got empty inputs !')
     mean, std = df.iloc[0, 0], df.iloc[0, 1]
 
     if distribution == "norm":
         a = (0 - mean) / std
         b = (1 - mean) / std
         dist = truncnorm(a, b, loc=mean, scale=std)
-        total = dist.rvs(size=num_samples)
+        if uniforms is None:
+            total = dist.rvs(size=num_samples, random_state=random_state)
+        else:
+            total = dist.ppf(uniforms)
     else:
         raise IOError(f"Unsupported distribution type {distribution}")
 
@@ -0,0 +1,112 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import logging
+import numpy as np
+import pandas as pd
+
+from .software_total_failure_probability_bbn import propagate
+from .sampling import uniform_design
+
+logger = logging.getLogger('BAHAMAS.Sensitivity')
+
+
+def _input_groups(bbn, dcp_factor):
+  """Get the inputs of the sensitivity analysis and their rows in the uniform design
+
+  Args:
+      bbn (BBN): BBN instance
+      dcp_factor (float): Spread of the DCP, or None
+
+  Returns:
+      tuple: list of (input name, rows of the design), number of rows of the BBN inputs, total number of rows
+  """
+  groups, num_inputs = bbn.input_groups()
+  num_rows = num_inputs
+  if dcp_factor is not None:
+    for stage in bbn._sdlc:
+      groups.append((f'DCP:{stage}', np.array([num_rows])))
+      num_rows += 1
+  return groups, num_inputs, num_rows
+
+def _evaluate(bbn, design, num_inputs, dcp_factor):
+  """Evaluate the BBN for a design of uniform samples of the nominal input distributions, also if the BBN
+  calculation uses importance sampling
+
+  Args:
+      bbn (BBN): BBN instance with initialized DCP
+      design (numpy.ndarray): uniform samples, shape (rows, samples)
+      num_inputs (int): Number of rows of the BBN inputs, the remaining rows are the DCP inputs
+      dcp_factor (float): Spread of the DCP, or None
+
+  Returns:
+      numpy.ndarray: total and UCA failure probabilities, shape (1 + uca, samples)
+  """
+  prob_stage, prob_stage_odc, prob_uca_correlation = bbn.sample_inputs(design[:num_inputs])
+  if dcp_factor is not None:
+    # log-uniform DCP in [DCP/dcp_factor, DCP*dcp_factor], a factor of the stage HEP in the marginal probability
+    prob_stage = prob_stage*dcp_factor**(2.*design[num_inputs:] - 1.)
+  prob_dcp = np.array([bbn.prob_dcp[stage] for stage in bbn._sdlc])
+  _, prob_uca, prob_total = propagate(prob_stage, prob_stage_odc, prob_uca_correlation, prob_dcp)
+  return np.vstack([prob_total, prob_uca])
+
+def sobol_indices(bbn, num_samples=1024, dcp_factor=2., seed=None, block_size=100000):
+  """Compute the first order and total Sobol indices of the total and UCA failure probabilities with respect to
+  the HEP and DCP of each SDLC stage, each ODC conditional probability and each UCA correlation term.
+  One pair of input matrices A and B is evaluated together with the matrices A_B^(i), whose rows of input i
+  are taken from B, and the indices follow from the Saltelli (2010) first order and Jansen total estimators:
+  S_i = E[f(B) (f(A_B^(i)) - f(A))]/V and ST_i = E[(f(A) - f(A_B^(i)))^2]/(2V). The stage HEP of the task level
+  assessment is a group of its action inputs.
+
+  Args:
+      bbn (BBN): BBN instance, the sampling method of the instance generates A and B
+      num_samples (int, optional): Number of rows of A and B, the BBN is evaluated num_samples*(inputs + 2) times
+        (defaults to 1024)
+      dcp_factor (float, optional): The DCP is a single value computed from the review numbers and trigger coverages,
+        for the sensitivity analysis it is taken as log-uniform in [DCP/dcp_factor, DCP*dcp_factor] (defaults to 2,
+        None excludes the DCP)
+      seed (int, optional): Seed of the random number generator (defaults to None, i.e., the seed of bbn)
+      block_size (int, optional): Maximum number of samples evaluated in one vectorized call (defaults to 100000)
+
+  Returns:
+      pandas.DataFrame: one row per output (Total and each UCA type) and input with the first order index S1 and
+        the total index ST
+  """
+  if any(isinstance(dist, np.ndarray) for dist in bbn._stage_dist.values()):
+    raise IOError('Sensitivity analysis is not available with user provided stage samples!')
+  bbn.initialize_dcp()
+  groups, num_inputs, num_rows = _input_groups(bbn, dcp_factor)
+  rng = np.random.Generator(bbn._bit_generator(np.random.SeedSequence(bbn._seed if seed is None else seed)))
+  if bbn.sampling == 'random':
+    design = rng.random((2*num_rows, num_samples))
+  else:
+    design = uniform_design(bbn.sampling, 2*num_rows, num_samples, rng)
+  A, B = design[:num_rows], design[num_rows:]
+
+  # A, B and each A_B^(i), evaluated in blocks of whole matrices
+  def matrix(i):
+    if i == 0:
+      return A
+    if i == 1:
+      return B
+    AB = A.copy()
+    AB[groups[i-2][1]] = B[groups[i-2][1]]
+    return AB
+  num_matrices = len(groups) + 2
+  per_block = max(1, block_size//num_samples)
+  logger.info('Sobol indices of %s inputs with %s BBN evaluations', len(groups), num_matrices*num_samples)
+  values = []
+  for start in range(0, num_matrices, per_block):
+    block = np.hstack([matrix(i) for i in range(start, min(start + per_block, num_matrices))])
+    values.append(_evaluate(bbn, block, num_inputs, dcp_factor))
+  values = np.hstack(values).reshape(1 + len(bbn._uca), num_matrices, num_samples)
+
+  f_A, f_B, f_AB = values[:, 0], values[:, 1], values[:, 2:]
+  var = np.var(np.concatenate([f_A, f_B], axis=1), axis=1)
+  first = np.mean(f_B[:, None, :]*(f_AB - f_A[:, None, :]), axis=2)/var[:, None]
+  total = 0.5*np.mean((f_A[:, None, :] - f_AB)**2, axis=2)/var[:, None]
+
+  rows = []
+  for k, output in enumerate(['Total'] + list(bbn._uca)):
+    for i, (name, _) in enumerate(groups):
+      rows.append({'Output': output, 'Input': name, 'S1': first[k, i], 'ST': total[k, i]})
+  return pd.DataFrame(rows)
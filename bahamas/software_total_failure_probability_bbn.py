@@ -2,48 +2,258 @@
 
 import numpy as np
 import logging
-from scipy.stats import truncnorm
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import truncnorm, norm
 
-from bahamas.sdlc_stage_hep_calculation import sdlc_stage_hep_calculation
+from bahamas.sdlc_stage_hep_calculation import sdlc_stage_hep_calculation, get_stage_actions
 from bahamas.sdlc_stage_hep_calculation_approx import sdlc_stage_hep_calculation_approx
 from bahamas.human_error_mode_distribution import get_hemd_from_spreadsheet
-from bahamas.stage_odc_distribution import get_stage_odc_dist
+from bahamas.stage_odc_distribution import get_stage_odc_dist, get_stage_odc_params, sample_stage_odc
 from bahamas.defect_conditional_probability import stage_dcp_calculation
-from bahamas.uca_defect_correlation import get_uca_defect_correlation_dist
-from bahamas.utils import SDLC_stages, ODC_types, UCA_types
+from bahamas.uca_defect_correlation import get_uca_defect_correlation_dist, get_uca_defect_correlation_params, sample_uca_defect_correlation
+from bahamas.utils import SDLC_stages, ODC_types, UCA_types, read_workbook, hash_sheet, hash_workbook
 from bahamas.plot_utils import plot_histogram
+from bahamas.summary import StreamingSummary, weighted_quantile
+from bahamas.sampling import sampling_methods, uniform_design
+from bahamas.store import save_arrays, load_arrays
+from bahamas import __version__
 
 logger = logging.getLogger('BAHAMAS.BBN')
 
+# Number of samples per block in parallel mode if chunk_size is not provided. The block
+# layout must not depend on the number of workers to keep the results reproducible.
+default_block_size = 10000
+
+# Fraction of the importance sampling samples drawn from the nominal distributions (defensive mixture), which
+# bounds the weights by 1/defensive_fraction
+defensive_fraction = 0.5
+
+# Columns of a stage sheet that determine the stage HEP (task and stage level assessment) and the DCP, which key the
+# samples kept in incremental mode
+hep_columns = ['Human Error Mode']
+approx_hep_columns = ['Human Error Probability (Mean)', 'Human Error Probability (STD)']
+dcp_columns = ['Review Number', 'Trigger Coverage']
+
+# BBN instance shared by the blocks evaluated in a worker process
+_worker_bbn = None
+
+def _initialize_worker(bbn):
+  """Store the BBN instance in the worker process
+
+  Args:
+      bbn (BBN): BBN instance
+  """
+  global _worker_bbn
+  _worker_bbn = bbn
+
+def _evaluate_block(args):
+  """Evaluate a block of samples with the BBN instance of the worker process
+
+  Args:
+      args (tuple): start index, number of samples and seed sequence of the block
+
+  Returns:
+      tuple or dict: sampled probabilities, or their streaming statistics in chunked mode
+  """
+  return _worker_bbn._evaluate_block(*args)
+
+def odc_failure_probability(prob_stage_odc_marg):
+  """Propagate the stage ODC marginal probabilities through the BBN, i.e., compute the
+  probability that at least one SDLC stage introduces a defect of each ODC type,
+  P(ODC) = 1 - prod_stage (1 - P(ODC|stage)). This is the closed form of summing the
+  BBN joint probability over all stage combinations except the defect-free one.
+
+  Args:
+      prob_stage_odc_marg (numpy.ndarray): marginal probabilities, shape (stages, odc, samples)
+
+  Returns:
+      numpy.ndarray: ODC failure probabilities, shape (odc, samples)
+  """
+  # log-space product keeps the accuracy for small probabilities
+  return -np.expm1(np.sum(np.log1p(-prob_stage_odc_marg), axis=0))
+
+def propagate(prob_stage, prob_stage_odc, prob_uca_correlation, prob_dcp):
+  """Propagate sampled inputs through the BBN
+
+  Args:
+      prob_stage (numpy.ndarray): stage HEP, shape (stages, samples)
+      prob_stage_odc (numpy.ndarray): stage ODC conditional probabilities, shape (stages, odc, samples)
+      prob_uca_correlation (numpy.ndarray): UCA defect correlation, shape (uca, odc, samples)
+      prob_dcp (numpy.ndarray): stage DCP, shape (stages,)
+
+  Returns:
+      tuple: ODC (odc, samples), UCA (uca, samples) and total (samples) probabilities
+  """
+  # Calculate Marginal Probability
+  logger.debug('Compute marginal ODC')
+  prob_stage_odc_marg = prob_stage_odc * prob_stage[:, None, :] * prob_dcp[:, None, None]
+
+  # Propagate uncertainties via BBN
+  logger.debug('BBN Propagation')
+  prob_odc = odc_failure_probability(prob_stage_odc_marg)
+
+  # Evaluate UCA probability and Total probability
+  logger.debug('Compute UCA and total failure probabilities')
+  prob_uca = np.sum(prob_odc[None, :, :] * prob_uca_correlation, axis=1)
+  prob_total = np.sum(prob_uca, axis=0)
+  return prob_odc, prob_uca, prob_total
+
+def load_defect_data(defect_file, approx=False, cache=None):
+  """Load the defect workbook and the distributions derived from it, which may be shared by several BBN
+  instances, e.g., for the assessment of many task lists
+
+  Args:
+      defect_file (str or file-like): Defect data file
+      approx (bool, optional): Skip the human error mode distributions, which are only used by the task level
+        assessment (defaults to False)
+      cache (bahamas.cache.WorkbookCache, optional): Cache of parsed input workbooks (defaults to None)
+
+  Returns:
+      dict: {'sheets':workbook sheets, 'hemd':human error mode distributions, 'stage_odc':stage ODC distributions,
+        'uca_correlation':UCA defect correlation distributions, 'odc_params' and 'uca_params':their parameter tables}
+  """
+  sheets = read_workbook(defect_file, cache=cache)
+  return {'sheets': sheets,
+          'hemd': {} if approx else get_hemd_from_spreadsheet(sheets)[1],
+          'stage_odc': get_stage_odc_dist(sheets),
+          'uca_correlation': get_uca_defect_correlation_dist(sheets),
+          'odc_params': get_stage_odc_params(sheets),
+          'uca_params': get_uca_defect_correlation_params(sheets)}
+
 class BBN(object):
   """
     Bayesian belief network for reliability analysis of software
   """
 
-  def __init__(self, defect_file, task_file, num_samples=1000, approx=False, data=None, seed=42):
+  def __init__(self, defect_file, task_file, num_samples=1000, approx=False, data=None, seed=42, cache=None,
+               chunk_size=None, reservoir_size=10000, workers=None, bit_generator='PCG64', sampling='random',
+               tolerance=None, max_samples=1000000, quantile=None, importance=None,
+               pilot_samples=10000, dtype='float64', defect_data=None, incremental=False):
+    """Constructor
+
+    Args:
+        defect_file (str or file-like): Defect data file
+        task_file (str or file-like): Task list file (precise analysis) or SDLC stage data file (approx analysis)
+        num_samples (int, optional): Number of samples (defaults to 1000)
+        approx (bool, optional): Stage level assessment if True, task level assessment otherwise (defaults to False)
+        data (dict, optional): User provided stage data, used if no task file is provided for approx analysis (defaults to None)
+        seed (int, optional): Seed of the random number generator (defaults to 42)
+        cache (bahamas.cache.WorkbookCache, optional): Cache of parsed input workbooks (defaults to None)
+        chunk_size (int, optional): If provided, samples are processed in blocks of chunk_size and only streaming
+          statistics plus a reservoir of the leading samples are kept (defaults to None, i.e., keep all samples)
+        reservoir_size (int, optional): Number of raw samples kept in chunked mode (defaults to 10000)
+        workers (int, optional): If provided, blocks of samples are evaluated by a pool of workers processes, each
+          block drawing from its own stream spawned from seed, so that results do not depend on the number of
+          workers (defaults to None, i.e., serial evaluation with a single random stream)
+        bit_generator (str, optional): Name of the numpy bit generator, e.g., PCG64, SFC64, Philox or MT19937
+          (defaults to 'PCG64')
+        sampling (str, optional): Sampling method of the uncertain inputs, 'random' for pseudo-random sampling,
+          'lhs' for Latin hypercube sampling or 'sobol' for a scrambled Sobol sequence (defaults to 'random')
+        tolerance (float, optional): If provided, batches of num_samples are drawn until the relative standard error
+          of the mean (or the relative half width of the 95% confidence interval of quantile) of the total and each
+          UCA failure probability falls below tolerance (defaults to None, i.e., a fixed number of samples)
+        max_samples (int, optional): Maximum number of samples drawn with tolerance (defaults to 1000000)
+        quantile (float, optional): Quantile used for the convergence check with tolerance (defaults to None, i.e.,
+          the mean is used)
+        importance (float, optional): If provided, the stage HEP and ODC inputs are sampled from distributions biased
+          toward total failure probabilities above the importance quantile, estimated by a pilot run, and the samples
+          carry likelihood ratio weights. Estimates are then self-normalized weighted estimates (defaults to None,
+          i.e., no importance sampling)
+        pilot_samples (int, optional): Minimum number of samples of the importance sampling pilot run, which uses
+          max(num_samples, pilot_samples) samples (defaults to 10000)
+        dtype (str, optional): Precision of the stored and propagated samples, 'float64' or 'float32'. The inputs are
+          sampled in double precision and the 1 - P products are evaluated in log space, which keeps the relative
+          accuracy of small probabilities in single precision (defaults to 'float64')
+        defect_data (dict, optional): Defect data loaded by load_defect_data, which replaces defect_file (defaults to
+          None, i.e., load defect_file)
+        incremental (bool, optional): If True, the HEP of each stage, the ODC and the UCA correlation samples are drawn
+          from their own streams and kept between calculations, keyed by the human error modes of the stage sheet
+          (the DCP by its review numbers and trigger coverages), so that a calculation after update_task only
+          recomputes the changed stage inputs. Results do not depend on the calculation
+          history, but differ from the single stream samples. Requires task_file (defaults to False)
+    """
+    # parse each workbook once, all sheets are shared by the calculations
+    task = read_workbook(task_file, cache=cache) if task_file is not None else None
+    if defect_data is None:
+      defect_data = load_defect_data(defect_file, approx=approx, cache=cache)
+    elif not approx and not defect_data['hemd']:
+      raise IOError('Human error mode distributions are required by the task level assessment, but missing!')
+    self._initialize(task, defect_data, num_samples=num_samples, approx=approx, data=data, seed=seed, cache=cache,
+                     chunk_size=chunk_size, reservoir_size=reservoir_size, workers=workers, bit_generator=bit_generator,
+                     sampling=sampling, tolerance=tolerance, max_samples=max_samples, quantile=quantile,
+                     importance=importance, pilot_samples=pilot_samples, dtype=dtype, incremental=incremental)
+
+  def _initialize(self, task, defect_data, num_samples, approx, data, seed, cache, chunk_size, reservoir_size, workers,
+                  bit_generator, sampling, tolerance, max_samples, quantile, importance, pilot_samples, dtype,
+                  incremental):
+    """Set up the options, inputs and empty results, shared by the constructor and load
+
+    Args:
+        task (dict): Sheets of the task file, or None
+        defect_data (dict): Defect data loaded by load_defect_data, or None for a loaded calculation
+        others: see the constructor
+    """
     self.num_samples = num_samples
     self._approx = approx
     self._data = data
-    np.random.seed(seed)
+    self._seed = seed
+    # each instance owns its random stream, so that instances can run concurrently
+    self._bit_generator = getattr(np.random, bit_generator)
+    self._rng = np.random.Generator(self._bit_generator(np.random.SeedSequence(seed)))
     self._uca = UCA_types
     self._odc = ODC_types
     self._sdlc = SDLC_stages
-    self._defect = defect_file
-    self._task = task_file
+    self._cache = cache
+    self._task = task
+    self.chunk_size = chunk_size
+    self.reservoir_size = reservoir_size
+    self.workers = workers
+    if sampling not in sampling_methods:
+      raise IOError(f'Unrecognized sampling method {sampling}. Valid methods are {sampling_methods}!')
+    self.sampling = sampling
+    self.tolerance = tolerance
+    self.max_samples = max_samples
+    self.quantile = quantile
+    if importance is not None and not 0. < importance < 1.:
+      raise IOError(f'The importance sampling quantile must be in (0, 1), got {importance}!')
+    self.importance = importance
+    self.pilot_samples = pilot_samples
+    self._shift = None # Shift of the latent variables of the biased inputs with importance sampling
+    if dtype not in ['float32', 'float64']:
+      raise IOError(f'Unrecognized dtype {dtype}. Valid dtypes are float32 and float64!')
+    self.dtype = np.dtype(dtype)
+    self.incremental = incremental
+    self._intermediates = {} # Samples kept between incremental calculations, {component: (key, samples)}
+    if incremental and (chunk_size is not None or workers is not None or sampling != 'random' or tolerance is not None
+                        or importance is not None):
+      raise IOError('Incremental calculation is only available for serial random sampling with a fixed number of samples!')
+    if incremental and self._task is None:
+      raise IOError('Incremental calculation is only available with a task file, the samples are kept per stage sheet!')
+    self.total_samples = 0 # Number of samples drawn by the last calculation
+    self.converged = None # Convergence status of the last adaptive calculation
     self.prob_stage = {} # HEP for each stage
     self.prob_odc = {} # ODC marginal probability
     self.prob_dcp = {} # DEP for each stage
     self.prob_total = None # Software total probability
     self.prob_uca = {} # UCA probability
-    self._hemd_dist = {}
-    if not self._approx:
-      _, self._hemd_dist =  get_hemd_from_spreadsheet(self._defect)
-    self.prob_stage_odc = get_stage_odc_dist(self._defect)
-    self.prob_uca_correlation = get_uca_defect_correlation_dist(self._defect)
+    self.weights = None # Importance sampling weights of the samples
+    self.summary = None # Streaming statistics in chunked mode
+    self._stage_dist = {} # User provided stage distributions or samples
+    if defect_data is None:
+      defect_data = dict.fromkeys(['sheets', 'hemd', 'stage_odc', 'uca_correlation', 'odc_params', 'uca_params'])
+    self._defect = defect_data['sheets']
+    self._hemd_dist = defect_data['hemd']
+    self.prob_stage_odc = defect_data['stage_odc']
+    self.prob_uca_correlation = defect_data['uca_correlation']
+    # parameter tables of the distributions above, sampled block-wise in one vectorized call
+    self._odc_params = defect_data['odc_params']
+    self._uca_params = defect_data['uca_params']
     self._G = 0.25
     self.review_trigger_factor = np.exp(-8)*self._G # The same as the value used in Software_Quality_Survey.py
 
   def initialize_stage(self):
+    """Initialize the stage distributions and DCP from the user provided data
+    """
     G = self._G
     for stage, vals in self._data.items():
       rev = vals['review']
@@ -53,142 +263,800 @@ class BBN(object):
         std = vals['std']
         a = (0 - mean) / std
         b = (1 - mean) / std
-        dist = truncnorm(a, b, loc=mean, scale=std)
-        total = dist.rvs(size=self.num_samples)
-        self.prob_stage[stage] = total
+        self._stage_dist[stage] = truncnorm(a, b, loc=mean, scale=std)
         self.prob_dcp[stage] = G*np.exp(-4.*rev*trigger)
       else:
-        self.prob_stage[stage] = vals['samples']
+        self._stage_dist[stage] = vals['samples']
         self.prob_dcp[stage] = G*np.exp(-4.*rev*trigger)/self.review_trigger_factor
 
-  def calculate(self):
-    """Calculate software failure probability based on BBN
+  def _use_task(self):
+    """Check if the stage HEP and DCP are computed from the task file
+
+    Returns:
+        bool: True if the task file is used, False if the user provided data is used
     """
-    logger.info('Sampling HEP and DCP')
+    if not self._approx and self._task is None:
+      raise IOError("Task List input file is requested, but missing!")
+    return self._task is not None
+
+  def _stage_dims(self):
+    """Get the number of uncertain inputs of each SDLC stage HEP
+
+    Returns:
+        list: number of inputs for each stage
+    """
+    dims = []
     for stage in self._sdlc:
-      if self._approx:
-        if self._task is not None:
-          # calculate human error propagation for each SDLC stage [sampled values]
-          self.prob_stage[stage], _ = sdlc_stage_hep_calculation_approx(self._task, stage, self.num_samples, distribution="norm")
-          # calculate DCP for each SDLC stage [single value without sampling]
-          self.prob_dcp[stage] = stage_dcp_calculation(self._task, stage)
+      if self._use_task():
+        dims.append(1 if self._approx else len(get_stage_actions(self._task, stage)))
       else:
-        if self._task is None:
-          raise IOError("Task List input file is requested, but missing!")
-        # calculate human error propagation for each SDLC stage [sampled values]
-        self.prob_stage[stage], _ = sdlc_stage_hep_calculation(self._task, stage, self._hemd_dist, self.num_samples)
-        # calculate DCP for each SDLC stage [single value without sampling]
-        self.prob_dcp[stage] = stage_dcp_calculation(self._task, stage)
+        dims.append(0 if isinstance(self._stage_dist.get(stage), np.ndarray) else 1)
+    return dims
 
-    if len(self.prob_stage) == 0 and self._data is not None:
-      self.initialize_stage()
+  def _input_dims(self):
+    """Get the number of uncertain inputs
 
-    # Sample stage ODC conditional probability
-    logger.info('Sampling ODC')
-    prob_stage_odc = {}
-    for stage in self._sdlc:
-      prob_stage_odc[stage] = {}
-      for odc in self._odc:
-        prob_stage_odc[stage][odc] = self.prob_stage_odc[stage][odc].rvs(self.num_samples)
+    Returns:
+        tuple: number of inputs of each stage HEP (list), number of biased inputs with importance sampling, i.e., the
+          stage HEP and ODC inputs, and total number of inputs
+    """
+    stage_dims = self._stage_dims()
+    num_biased = sum(stage_dims) + len(self._sdlc)*len(self._odc)
+    return stage_dims, num_biased, num_biased + len(self._uca)*len(self._odc)
 
-    # Sample UCA correlation
-    logger.info('Sampling UCA')
-    prob_uca_correlation = {}
-    for uca in self._uca:
-      prob_uca_correlation[uca] = {}
-      for odc in self._odc:
-        prob_uca_correlation[uca][odc] = self.prob_uca_correlation[uca][odc].rvs(self.num_samples)
+  def _sample_uniforms(self, num_samples, rng, design=None):
+    """Generate one design of uniform samples for all uncertain inputs
+
+    Args:
+        num_samples (int): Number of samples of the block
+        rng (numpy.random.Generator): Random number generator
+        design (numpy.ndarray, optional): Uniform samples of all inputs, shape (inputs, samples) (defaults to None,
+          i.e., generate them with the sampling method)
+
+    Returns:
+        tuple: uniforms of each stage (list of arrays of shape (inputs, samples)), stage ODC (stages, odc, samples),
+          UCA correlation (uca, odc, samples) and the log importance sampling weights (samples) or None, or None
+          for random sampling without importance sampling
+    """
+    stage_dims, num_biased, num_inputs = self._input_dims()
+    if design is None:
+      if self.sampling == 'random' and self._shift is None:
+        return None
+      # with importance sampling, one more input selects the mixture component of each sample
+      num_design = num_inputs + (self._shift is not None)
+      if self.sampling == 'random':
+        design = rng.random((num_design, num_samples))
+      else:
+        design = uniform_design(self.sampling, num_design, num_samples, rng)
+    log_weights = None
+    if self._shift is not None:
+      design, log_weights = self._importance_shift(design, num_biased)
+    return self._split_design(design) + (log_weights,)
+
+  def _split_design(self, design):
+    """Split a design of uniform samples into the uniforms of each input
 
-    # Calculate Marginal Probability
-    logger.info('Compute marginal ODC')
-    prob_stage_odc_marg = {}
+    Args:
+        design (numpy.ndarray): Uniform samples of all inputs, shape (inputs, samples), further rows are ignored
+
+    Returns:
+        tuple: uniforms of each stage (list of arrays of shape (inputs, samples)), stage ODC (stages, odc, samples)
+          and UCA correlation (uca, odc, samples)
+    """
+    stage_dims, num_biased, num_inputs = self._input_dims()
+    num_samples = design.shape[1]
+    num_stage = sum(stage_dims)
+    stage_uniforms = np.split(design[:num_stage], np.cumsum(stage_dims)[:-1])
+    odc_uniforms = design[num_stage:num_biased].reshape(len(self._sdlc), len(self._odc), num_samples)
+    uca_uniforms = design[num_biased:num_inputs].reshape(len(self._uca), len(self._odc), num_samples)
+    return stage_uniforms, odc_uniforms, uca_uniforms
+
+  def input_groups(self):
+    """Get the uncertain inputs and their rows in a design of uniform samples, see sample_inputs. The stage HEP of
+    the task level assessment is a group of its action inputs
+
+    Returns:
+        tuple: list of (input name, rows of the design), and the number of rows of the design
+    """
+    stage_dims, _, num_inputs = self._input_dims()
+    groups = []
+    start = 0
+    for stage, dim in zip(self._sdlc, stage_dims):
+      if dim > 0:
+        groups.append((f'HEP:{stage}', np.arange(start, start + dim)))
+      start += dim
     for stage in self._sdlc:
-      prob_stage_odc_marg[stage] = {}
       for odc in self._odc:
-        prob_stage_odc_marg[stage][odc] = prob_stage_odc[stage][odc] * self.prob_stage[stage] * self.prob_dcp[stage]
-
-    # Propagate uncertainties via BBN
-    logger.info('BBN Propagation')
-    level = 2
-    concept, requirement, design, implementation, testing, InMain = SDLC_stages
-    for odc in self._odc:
-      prob = 0
-      for k in range(level):
-        for l in range(level):
-          for m in range(level):
-            for n in range(level):
-              for p in range(level):
-                for q in range(level):
-                  ak = prob_stage_odc_marg[concept][odc] if k == 0 else 1. - prob_stage_odc_marg[concept][odc]
-                  bl = prob_stage_odc_marg[requirement][odc] if l == 0 else 1. - prob_stage_odc_marg[requirement][odc]
-                  cm = prob_stage_odc_marg[design][odc] if m == 0 else 1. - prob_stage_odc_marg[design][odc]
-                  dn = prob_stage_odc_marg[implementation][odc] if n == 0 else 1. - prob_stage_odc_marg[implementation][odc]
-                  ep = prob_stage_odc_marg[testing][odc] if p == 0 else 1. - prob_stage_odc_marg[testing][odc]
-                  fq = prob_stage_odc_marg[InMain][odc] if q == 0 else 1. - prob_stage_odc_marg[InMain][odc]
-                  factor = 0. if np.all([k,l,m,n,p,q]) else 1.
-                  prob += factor * ak * bl * cm * dn * ep * fq
-      self.prob_odc[odc] = prob
-
-    logger.info('Compute UCA and total failure probabilities')
-    # Evaluate UCA probability and Total probability
-    self.prob_total = 0.
+        groups.append((f'ODC:{stage}:{odc}', np.array([start])))
+        start += 1
     for uca in self._uca:
-      prob = 0.
       for odc in self._odc:
-        prob += self.prob_odc[odc] * prob_uca_correlation[uca][odc]
-      self.prob_uca[uca] = prob
-      self.prob_total += prob
+        groups.append((f'UCA:{uca}:{odc}', np.array([start])))
+        start += 1
+    return groups, num_inputs
+
+  def sample_inputs(self, design):
+    """Map a design of uniform samples through the inverse CDF of each input. The inputs follow their nominal
+    distributions, the importance sampling shift of the calculation is not applied
+
+    Args:
+        design (numpy.ndarray): Uniform samples of all inputs, shape (inputs, samples), see input_groups
+
+    Returns:
+        tuple: stage HEP (stages, samples), stage ODC (stages, odc, samples) and UCA correlation (uca, odc, samples)
+          samples
+    """
+    if any(isinstance(dist, np.ndarray) for dist in self._stage_dist.values()):
+      raise IOError('Sampling a design is not available with user provided stage samples!')
+    num_samples = design.shape[1]
+    stage_uniforms, odc_uniforms, uca_uniforms = self._split_design(design)
+    prob_stage = self._sample_stage(0, num_samples, None, uniforms=stage_uniforms)
+    prob_stage_odc = sample_stage_odc(self._odc_params, num_samples, uniforms=odc_uniforms)
+    prob_uca_correlation = sample_uca_defect_correlation(self._uca_params, num_samples, uniforms=uca_uniforms)
+    return prob_stage, prob_stage_odc, prob_uca_correlation
+
+  def _importance_shift(self, design, num_biased):
+    """Sample the standard normal latent variables of the biased inputs from the defensive mixture of the nominal
+    and the shifted distribution and compute the log likelihood ratios of the nominal and the mixture density
+
+    Args:
+        design (numpy.ndarray): uniform samples, shape (inputs + 1, samples), the last input selects the mixture
+          component
+        num_biased (int): Number of leading inputs to bias, i.e., the stage HEP and ODC inputs
+
+    Returns:
+        tuple: biased uniform samples (inputs + 1, samples), log weights (samples)
+    """
+    shift = self._shift[:, None]
+    z = self._latent(design[:num_biased]) + shift*(design[-1] >= defensive_fraction)
+    design = design.copy()
+    design[:num_biased] = norm.cdf(z)
+    # phi(z)/(a phi(z) + (1 - a) phi(z - shift))
+    log_ratio = np.sum(shift*z, axis=0) - np.sum(shift**2)/2.
+    log_weights = -np.logaddexp(np.log(defensive_fraction), np.log1p(-defensive_fraction) + log_ratio)
+    return design, log_weights
+
+  @staticmethod
+  def _latent(uniforms):
+    """Map uniform samples to standard normal latent variables
+
+    Args:
+        uniforms (numpy.ndarray): uniform samples
+
+    Returns:
+        numpy.ndarray: standard normal samples
+    """
+    # keep the latent variables finite for uniforms at the boundary
+    return norm.ppf(np.clip(uniforms, np.finfo(float).tiny, None))
+
+  def _importance_pilot(self):
+    """Estimate the shift of the latent variables toward high failure probabilities with one cross-entropy step:
+    the shift is the mean of the latent variables of the nominal pilot samples whose total failure probability
+    exceeds the importance quantile. The pilot should keep about a hundred samples above the quantile.
+    """
+    if any(isinstance(dist, np.ndarray) for dist in self._stage_dist.values()):
+      raise IOError('Importance sampling is not available with user provided stage samples!')
+    self._shift = None
+    _, num_biased, num_inputs = self._input_dims()
+    num_samples = max(self.num_samples, self.pilot_samples)
+    design = self._rng.random((num_inputs, num_samples))
+    prob_total = self._sample_block(0, num_samples, self._rng, design=design)[3]
+    tail = prob_total >= np.quantile(prob_total, self.importance)
+    self._shift = np.mean(self._latent(design[:num_biased, tail]), axis=1)
+    logger.info('Importance sampling shift of norm %s from %s pilot samples', np.linalg.norm(self._shift), num_samples)
+
+  def _sample_stage(self, start, num_samples, rng, uniforms=None):
+    """Sample the HEP of each SDLC stage
+
+    Args:
+        start (int): Index of the first sample of the block
+        num_samples (int): Number of samples of the block
+        rng (numpy.random.Generator): Random number generator
+        uniforms (list, optional): Uniform samples of the inputs of each stage (defaults to None, i.e., random sampling)
+
+    Returns:
+        numpy.ndarray: HEP samples, shape (stages, samples)
+    """
+    prob_stage = {}
+    if self._use_task():
+      for i, stage in enumerate(self._sdlc):
+        u = uniforms[i] if uniforms is not None else None
+        prob_stage[stage] = self._sample_task_stage(stage, num_samples, rng, uniforms=u)
+    else:
+      for stage, dist in self._stage_dist.items():
+        if isinstance(dist, np.ndarray):
+          prob_stage[stage] = dist[start:start+num_samples] if dist.ndim > 0 else dist
+        elif uniforms is not None:
+          prob_stage[stage] = dist.ppf(uniforms[self._sdlc.index(stage)][0])
+        else:
+          prob_stage[stage] = dist.rvs(size=num_samples, random_state=rng)
+    return np.array([np.broadcast_to(prob_stage[stage], num_samples) for stage in self._sdlc])
+
+  def _sample_task_stage(self, stage, num_samples, rng, uniforms=None):
+    """Sample the HEP of an SDLC stage from the task file
+
+    Args:
+        stage (str): SDLC stage
+        num_samples (int): Number of samples
+        rng (numpy.random.Generator): Random number generator
+        uniforms (numpy.ndarray, optional): Uniform samples of the inputs of the stage (defaults to None, i.e.,
+          random sampling)
+
+    Returns:
+        numpy.ndarray: HEP samples, shape (samples,)
+    """
+    if self._approx:
+      # calculate human error propagation for each SDLC stage [sampled values]
+      u = uniforms[0] if uniforms is not None else None
+      prob_stage, _ = sdlc_stage_hep_calculation_approx(self._task, stage, num_samples, distribution="norm", random_state=rng, uniforms=u)
+    else:
+      prob_stage, _ = sdlc_stage_hep_calculation(self._task, stage, self._hemd_dist, num_samples, random_state=rng, uniforms=uniforms)
+    return prob_stage
+
+  def update_task(self, task_file):
+    """Replace the task file, an incremental calculation afterwards only resamples the changed stages
+
+    Args:
+        task_file (str, file-like or dict): Task list file (precise analysis) or SDLC stage data file (approx
+          analysis), or its sheets, e.g., edited copies of the sheets of the current task file
+    """
+    self._task = read_workbook(task_file, cache=self._cache)
+
+  def _sheet_key(self, stage, columns):
+    """Get the content hash of the columns of a stage sheet that determine an input component in incremental mode,
+    so that edits of the other columns keep the samples of the component
+
+    Args:
+        stage (str): SDLC stage
+        columns (list): Columns of the stage sheet
+
+    Returns:
+        str: SHA-256 hex digest of the columns
+    """
+    df = self._task[stage]
+    return hash_sheet(df[[column for column in columns if column in df.columns]])
+
+  def _component_rng(self, index):
+    """Get the random stream of an input component in incremental mode
+
+    Args:
+        index (int): Index of the component, the stages followed by ODC and UCA correlation
+
+    Returns:
+        numpy.random.Generator: Random number generator
+    """
+    return np.random.Generator(self._bit_generator(np.random.SeedSequence(self._seed, spawn_key=(index,))))
+
+  def _kept_samples(self, component, key, index, sampler):
+    """Get the samples of an input component kept from the last calculation, or draw them if key changed
 
-  def get_total_failure_probability(self):
-    """Get total failure probability
+    Args:
+        component (str): Name of the component
+        key (tuple): Key of the inputs that determine the samples
+        index (int): Index of the random stream of the component, or None if the component is not sampled
+        sampler (callable): Function that draws the samples with a random number generator
+
+    Returns:
+        numpy.ndarray: samples
+    """
+    kept = self._intermediates.get(component)
+    if kept is None or kept[0] != key:
+      logger.info('Sample %s', component)
+      kept = (key, sampler(self._component_rng(index) if index is not None else None))
+      self._intermediates[component] = kept
+    return kept[1]
+
+  def _sample_incremental(self, num_samples):
+    """Sample the BBN inputs in incremental mode, reusing the samples of the unchanged components
+
+    Args:
+        num_samples (int): Number of samples
+
+    Returns:
+        tuple: stage HEP (stages, samples), stage ODC (stages, odc, samples) and UCA correlation (uca, odc, samples)
+    """
+    prob_stage = []
+    for i, stage in enumerate(self._sdlc):
+      # the HEP only depends on the human error modes, or on the HEP columns of the stage level assessment
+      key = (self._sheet_key(stage, approx_hep_columns if self._approx else hep_columns), num_samples)
+      prob_stage.append(self._kept_samples(stage, key, i, lambda rng, stage=stage: self._sample_task_stage(stage, num_samples, rng)))
+    prob_stage_odc = self._kept_samples('ODC', num_samples, len(self._sdlc),
+                                        lambda rng: sample_stage_odc(self._odc_params, num_samples, random_state=rng))
+    prob_uca_correlation = self._kept_samples('UCA', num_samples, len(self._sdlc) + 1,
+                                              lambda rng: sample_uca_defect_correlation(self._uca_params, num_samples, random_state=rng))
+    return np.array(prob_stage), prob_stage_odc, prob_uca_correlation
+
+  def _sample_block(self, start, num_samples, rng, design=None):
+    """Sample the BBN inputs and propagate them for a block of samples
+
+    Args:
+        start (int): Index of the first sample of the block
+        num_samples (int): Number of samples of the block
+        rng (numpy.random.Generator): Random number generator
+        design (numpy.ndarray, optional): Uniform samples of all inputs, shape (inputs, samples) (defaults to None)
+
+    Returns:
+        tuple: stage HEP (stages, samples), ODC (odc, samples), UCA (uca, samples) and total (samples) probabilities,
+          and the importance sampling weights (samples) or None
+    """
+    uniforms = self._sample_uniforms(num_samples, rng, design=design)
+    weights = None
+    if self.incremental:
+      prob_stage, prob_stage_odc, prob_uca_correlation = self._sample_incremental(num_samples)
+    elif uniforms is None:
+      prob_stage = self._sample_stage(start, num_samples, rng)
+
+      # Sample stage ODC conditional probability, shape (stages, odc, samples)
+      logger.debug('Sampling ODC')
+      prob_stage_odc = sample_stage_odc(self._odc_params, num_samples, random_state=rng)
+
+      # Sample UCA correlation, shape (uca, odc, samples)
+      logger.debug('Sampling UCA')
+      prob_uca_correlation = sample_uca_defect_correlation(self._uca_params, num_samples, random_state=rng)
+    else:
+      # map the design through the inverse CDF of each input
+      stage_uniforms, odc_uniforms, uca_uniforms, log_weights = uniforms
+      if log_weights is not None:
+        weights = np.exp(log_weights)
+      prob_stage = self._sample_stage(start, num_samples, rng, uniforms=stage_uniforms)
+      prob_stage_odc = sample_stage_odc(self._odc_params, num_samples, uniforms=odc_uniforms)
+      prob_uca_correlation = sample_uca_defect_correlation(self._uca_params, num_samples, uniforms=uca_uniforms)
+
+    # store and propagate the samples in the requested precision
+    prob_stage = prob_stage.astype(self.dtype, copy=False)
+    prob_stage_odc = prob_stage_odc.astype(self.dtype, copy=False)
+    prob_uca_correlation = prob_uca_correlation.astype(self.dtype, copy=False)
+
+    prob_dcp = np.array([self.prob_dcp[stage] for stage in self._sdlc], dtype=self.dtype)
+    prob_odc, prob_uca, prob_total = propagate(prob_stage, prob_stage_odc, prob_uca_correlation, prob_dcp)
+    return prob_stage, prob_odc, prob_uca, prob_total, weights
+
+  def _store_samples(self, prob_stage, prob_odc, prob_uca, prob_total, weights=None):
+    """Store sampled probabilities
+
+    Args:
+        prob_stage (numpy.ndarray): stage HEP, shape (stages, samples)
+        prob_odc (numpy.ndarray): ODC probabilities, shape (odc, samples)
+        prob_uca (numpy.ndarray): UCA probabilities, shape (uca, samples)
+        prob_total (numpy.ndarray): total failure probabilities, shape (samples,)
+        weights (numpy.ndarray, optional): importance sampling weights, shape (samples,) (defaults to None)
+    """
+    self.prob_stage = dict(zip(self._sdlc, prob_stage))
+    self.prob_odc = dict(zip(self._odc, prob_odc))
+    self.prob_uca = dict(zip(self._uca, prob_uca))
+    self.prob_total = prob_total
+    self.weights = weights
+
+  def _stacked_samples(self):
+    """Get the stored samples as arrays
+
+    Returns:
+        tuple: stage HEP (stages, samples), ODC (odc, samples), UCA (uca, samples) and total (samples) probabilities,
+          and the importance sampling weights (samples) or None
+    """
+    return (np.array([self.prob_stage[stage] for stage in self._sdlc]),
+            np.array([self.prob_odc[odc] for odc in self._odc]),
+            np.array([self.prob_uca[uca] for uca in self._uca]),
+            self.prob_total, self.weights)
+
+  def initialize_dcp(self):
+    """Initialize the DCP of each stage, and the stage distributions from the user provided data
+    """
+    if self._use_task():
+      for stage in self._sdlc:
+        # calculate DCP for each SDLC stage [single value without sampling]
+        if self.incremental:
+          key = self._sheet_key(stage, dcp_columns)
+          self.prob_dcp[stage] = self._kept_samples(f'DCP:{stage}', key, None,
+                                                    lambda rng, stage=stage: stage_dcp_calculation(self._task, stage))
+        else:
+          self.prob_dcp[stage] = stage_dcp_calculation(self._task, stage)
+    elif self._data is not None:
+      self.initialize_stage()
+
+  def calculate(self):
+    """Calculate software failure probability based on BBN
+    """
+    if self._defect is None:
+      raise IOError('The input data of a loaded BBN are not available, create a new BBN to calculate!')
+    logger.info('Sampling HEP and DCP')
+    self.initialize_dcp()
+
+    if self.importance is not None:
+      self._importance_pilot()
+    seed_seq = np.random.SeedSequence(self._seed)
+    if self.tolerance is None:
+      self._collect(self._run(0, self.num_samples, seed_seq))
+      self.total_samples = self.num_samples
+    else:
+      self._calculate_adaptive(seed_seq)
+
+  def _calculate_adaptive(self, seed_seq):
+    """Draw batches of num_samples until the estimates converge or max_samples is reached
+
+    Args:
+        seed_seq (numpy.random.SeedSequence): Seed sequence of the parallel blocks
+    """
+    if any(isinstance(dist, np.ndarray) for dist in self._stage_dist.values()):
+      raise IOError('Adaptive sampling is not available with user provided stage samples!')
+    self.converged = False
+    total = 0
+    # running statistics of the outputs of the stopping rule, the streaming statistics in chunked mode
+    running = None
+    if self.chunk_size is None:
+      running = {'total': StreamingSummary(0), 'uca': {uca: StreamingSummary(0) for uca in self._uca}}
+    buffers = None
+    while total < self.max_samples:
+      num_samples = min(self.num_samples, self.max_samples - total)
+      results = self._run(total, num_samples, seed_seq)
+      if self.chunk_size is None:
+        buffers = self._collect_batch(results, total, buffers, running)
+      else:
+        self._collect(results, append=total > 0)
+      total += num_samples
+      error = self._relative_error(running if running is not None else self.summary)
+      logger.info('Samples: %s, relative error: %s', total, error)
+      if error <= self.tolerance:
+        self.converged = True
+        break
+    self.total_samples = total
+    if self.converged:
+      logger.info('Converged with %s samples', total)
+    else:
+      logger.warning('Not converged to tolerance %s with the maximum of %s samples', self.tolerance, self.max_samples)
+
+  def _collect_batch(self, results, start, buffers, running):
+    """Store the samples of an adaptive batch into sample arrays that grow by doubling up to max_samples, so that
+    previous batches are not copied again, and update the running statistics of the stopping rule
+
+    Args:
+        results (list): results of _evaluate_block for each block of the batch
+        start (int): Index of the first sample of the batch
+        buffers (list): sample arrays of the previous batches, None for the first batch
+        running (dict): {'total':StreamingSummary, 'uca':{uca:StreamingSummary}}, updated in place
+
+    Returns:
+        list: sample arrays, stage HEP, ODC, UCA, total and the weights (None without importance sampling)
+    """
+    samples = [np.concatenate([block[i] for block in results], axis=-1) for i in range(4)]
+    samples.append(None if results[0][4] is None else np.concatenate([block[4] for block in results]))
+    stop = start + samples[3].size
+    if buffers is None or stop > buffers[3].shape[-1]:
+      capacity = min(max(2*stop, self.num_samples), self.max_samples)
+      grown = []
+      for i, values in enumerate(samples):
+        if values is None:
+          grown.append(None)
+          continue
+        buffer = np.empty(values.shape[:-1] + (capacity,), dtype=values.dtype)
+        if buffers is not None:
+          buffer[..., :start] = buffers[i][..., :start]
+        grown.append(buffer)
+      buffers = grown
+    for buffer, values in zip(buffers, samples):
+      if values is not None:
+        buffer[..., start:stop] = values
+    self.summary = None
+    self._store_samples(*[buffer[..., :stop] if buffer is not None else None for buffer in buffers[:4]],
+                        weights=buffers[4][:stop] if buffers[4] is not None else None)
+    running['total'].update(samples[3], samples[4])
+    for uca, values in zip(self._uca, samples[2]):
+      running['uca'][uca].update(values, samples[4])
+    return buffers
+
+  def _relative_error(self, summary):
+    """Compute the largest relative error of the total and UCA failure probability estimates, i.e., the relative
+    standard error of the mean, or the relative half width of the 95% confidence interval of the quantile. The
+    errors are computed from the running statistics, which cost O(1) per batch for the mean; the quantiles are
+    estimated from their log-spaced histogram
+
+    Args:
+        summary (dict): {'total':StreamingSummary, 'uca':{uca:StreamingSummary}} of all samples drawn so far
 
     Returns:
-        tuple: mean, sigma, and samples
+        float: the largest relative error
     """
-    mean = np.mean(self.prob_total)
-    sigma = np.std(self.prob_total)
-    return mean, sigma, self.prob_total
+    errors = []
+    for output in [summary['total']] + [summary['uca'][uca] for uca in self._uca]:
+      count, mean, std = output.ess, output.mean, output.std
+      if self.quantile is None:
+        error, value = std/np.sqrt(count), mean
+      else:
+        # distribution-free confidence interval of the quantile from the binomial distribution of its rank
+        half = 1.96*np.sqrt(self.quantile*(1. - self.quantile)/count)
+        low, value, high = output.quantile([max(self.quantile - half, 0.), self.quantile, min(self.quantile + half, 1.)])
+        error = (high - low)/2.
+      errors.append(0. if error == 0. else error/abs(value) if value != 0. else np.inf)
+    return max(errors)
 
-  def get_uca(self, uca_type):
-    """Get UCA probability
+  def _run(self, start, num_samples, seed_seq):
+    """Evaluate a range of samples block by block
+
+    Args:
+        start (int): Index of the first sample
+        num_samples (int): Number of samples
+        seed_seq (numpy.random.SeedSequence): Seed sequence that spawns the streams of the parallel blocks
+
+    Returns:
+        list: results of _evaluate_block for each block
+    """
+    if self.workers is None:
+      block_size = self.chunk_size if self.chunk_size is not None else num_samples
+    else:
+      block_size = self.chunk_size if self.chunk_size is not None else default_block_size
+    stop = start + num_samples
+    blocks = [(i, min(block_size, stop - i)) for i in range(start, stop, block_size)]
+    if self.workers is None:
+      # a single random stream shared by all blocks
+      seeds = [None]*len(blocks)
+    else:
+      seeds = seed_seq.spawn(len(blocks))
+    tasks = [(i, n, seed) for (i, n), seed in zip(blocks, seeds)]
+
+    logger.info('BBN Propagation in %s blocks', len(tasks))
+    if self.workers is None or self.workers == 1:
+      return [self._evaluate_block(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize_worker, initargs=(self,)) as executor:
+      return list(executor.map(_evaluate_block, tasks))
+
+  def _new_summary(self):
+    """Create empty streaming statistics for all outputs
+
+    Returns:
+        dict: {'stage':{stage:StreamingSummary}, 'odc':{...}, 'uca':{...}, 'total':StreamingSummary}
+    """
+    return {'stage': {stage: StreamingSummary(self.reservoir_size) for stage in self._sdlc},
+            'odc': {odc: StreamingSummary(self.reservoir_size) for odc in self._odc},
+            'uca': {uca: StreamingSummary(self.reservoir_size) for uca in self._uca},
+            'total': StreamingSummary(self.reservoir_size)}
+
+  def _evaluate_block(self, start, num_samples, seed=None):
+    """Evaluate a block of samples
+
+    Args:
+        start (int): Index of the first sample of the block
+        num_samples (int): Number of samples of the block
+        seed (numpy.random.SeedSequence, optional): Seed of the block stream (defaults to None, i.e., continue
+          the current stream)
+
+    Returns:
+        tuple or dict: sampled probabilities, or their streaming statistics in chunked mode
+    """
+    rng = self._rng if seed is None else np.random.Generator(self._bit_generator(seed))
+    prob_stage, prob_odc, prob_uca, prob_total, weights = self._sample_block(start, num_samples, rng)
+    if self.chunk_size is None:
+      return prob_stage, prob_odc, prob_uca, prob_total, weights
+    summary = self._new_summary()
+    for stage, values in zip(self._sdlc, prob_stage):
+      summary['stage'][stage].update(values, weights)
+    for odc, values in zip(self._odc, prob_odc):
+      summary['odc'][odc].update(values, weights)
+    for uca, values in zip(self._uca, prob_uca):
+      summary['uca'][uca].update(values, weights)
+    summary['total'].update(prob_total, weights)
+    return summary
+
+  def _collect(self, results, append=False):
+    """Merge the results of the blocks in order and store them
+
+    Args:
+        results (list): results of _evaluate_block for each block
+        append (bool, optional): Append the results to the stored ones (defaults to False)
+    """
+    if self.chunk_size is None:
+      self.summary = None
+      if append:
+        results = [self._stacked_samples()] + results
+      samples = [np.concatenate([block[i] for block in results], axis=-1) for i in range(4)]
+      weights = None if results[0][4] is None else np.concatenate([block[4] for block in results])
+      self._store_samples(*samples, weights=weights)
+      return
+
+    summary = self.summary if append else self._new_summary()
+    for block in results:
+      for key in ['stage', 'odc', 'uca']:
+        for name, values in block[key].items():
+          summary[key][name].merge(values)
+      summary['total'].merge(block['total'])
+    self.summary = summary
+    # keep the reservoir samples for plotting and direct access
+    self._store_samples([summary['stage'][stage].reservoir for stage in self._sdlc],
+                        [summary['odc'][odc].reservoir for odc in self._odc],
+                        [summary['uca'][uca].reservoir for uca in self._uca],
+                        summary['total'].reservoir,
+                        weights=summary['total'].reservoir_weights if self.importance is not None else None)
+
+  def _moments(self, samples):
+    """Compute the mean and standard deviation of the samples, weighted with importance sampling
+
+    Args:
+        samples (numpy.ndarray): samples
+
+    Returns:
+        tuple: mean, sigma
+    """
+    if self.weights is None:
+      return np.mean(samples), np.std(samples)
+    mean = np.average(samples, weights=self.weights)
+    sigma = np.sqrt(np.average((samples - mean)**2, weights=self.weights))
+    return mean, sigma
+
+  def _estimates(self, summary, samples, quantiles=None):
+    """Compute the estimates of an output
+
+    Args:
+        summary (StreamingSummary): Streaming statistics of the output in chunked mode, None otherwise
+        samples (numpy.ndarray): samples of the output
+        quantiles (float or array-like, optional): quantiles to estimate (defaults to None)
+
+    Returns:
+        tuple: mean, sigma, samples, and the quantiles if requested
+    """
+    if summary is not None:
+      mean, sigma = summary.mean, summary.std
+      quantile = summary.quantile
+    else:
+      mean, sigma = self._moments(samples)
+      quantile = lambda q: weighted_quantile(samples, q, self.weights)
+    if quantiles is None:
+      return mean, sigma, samples
+    return mean, sigma, samples, quantile(quantiles)
+
+  def get_total_failure_probability(self, quantiles=None):
+    """Get total failure probability, the estimates are weighted with importance sampling
+
+    Args:
+        quantiles (float or array-like, optional): quantiles to estimate (defaults to None)
+
+    Returns:
+        tuple: mean, sigma, and samples (the reservoir samples in chunked mode), followed by the quantiles if requested
+    """
+    summary = self.summary['total'] if self.summary is not None else None
+    return self._estimates(summary, self.prob_total, quantiles)
+
+  def get_uca(self, uca_type, quantiles=None):
+    """Get UCA probability, the estimates are weighted with importance sampling
 
     Args:
         uca_type (str): Type of UCA
+        quantiles (float or array-like, optional): quantiles to estimate (defaults to None)
+
+    Returns:
+        tuple: mean, sigma, and samples (the reservoir samples in chunked mode), followed by the quantiles if requested
+    """
+    summary = self.summary['uca'][uca_type] if self.summary is not None else None
+    return self._estimates(summary, self.prob_uca[uca_type], quantiles)
+
+  def get_effective_sample_size(self):
+    """Get the effective sample size, (sum w)^2/sum w^2, which equals the number of samples without importance
+    sampling
+
+    Returns:
+        float: effective sample size
+    """
+    if self.summary is not None:
+      return self.summary['total'].ess
+    if self.weights is None:
+      return self.prob_total.size
+    return np.sum(self.weights)**2/np.sum(self.weights**2)
+
+
+  def save(self, file_path):
+    """Save the samples of a completed calculation, the streaming statistics in chunked mode, and the metadata of
+    the run (package version, seed, options, DCP and content hashes of the input workbooks) to an uncompressed
+    .npz archive
+
+    Args:
+        file_path (str): Output file, the .npz extension is added if missing
+    """
+    if self.prob_total is None:
+      raise IOError('No samples are available, call calculate first!')
+    prob_stage, prob_odc, prob_uca, prob_total, weights = self._stacked_samples()
+    arrays = {'prob_stage': prob_stage, 'prob_odc': prob_odc, 'prob_uca': prob_uca, 'prob_total': prob_total}
+    if weights is not None:
+      arrays['weights'] = weights
+    if self.summary is not None:
+      summaries = [('stage', name, self.summary['stage'][name]) for name in self._sdlc]
+      summaries += [('odc', name, self.summary['odc'][name]) for name in self._odc]
+      summaries += [('uca', name, self.summary['uca'][name]) for name in self._uca]
+      summaries.append(('total', 'total', self.summary['total']))
+      for key, name, summary in summaries:
+        for field, value in summary.state().items():
+          arrays[f'summary:{key}:{name}:{field}'] = value
+    metadata = {'version': __version__,
+                'seed': self._seed,
+                'options': {'num_samples': self.num_samples, 'approx': self._approx, 'chunk_size': self.chunk_size,
+                            'reservoir_size': self.reservoir_size, 'bit_generator': self._bit_generator.__name__,
+                            'sampling': self.sampling, 'tolerance': self.tolerance, 'max_samples': self.max_samples,
+                            'quantile': self.quantile, 'importance': self.importance,
+                            'pilot_samples': self.pilot_samples, 'dtype': self.dtype.name},
+                'total_samples': self.total_samples,
+                'converged': self.converged,
+                'prob_dcp': {stage: float(value) for stage, value in self.prob_dcp.items()},
+                'stages': list(self._sdlc), 'odc': list(self._odc), 'uca': list(self._uca),
+                'input_hashes': {'defect': hash_workbook(self._defect),
+                                 'task': hash_workbook(self._task) if self._task is not None else None}}
+    file_path = save_arrays(file_path, arrays, metadata)
+    logger.info('BBN samples are saved to: %s', file_path)
+
+  @classmethod
+  def load(cls, file_path, mmap=True):
+    """Load a calculation saved by save. The loaded instance provides the samples, estimates and plots of the
+    saved calculation, its metadata is available as the metadata attribute; the input data are not stored, so
+    it can not be recalculated
+
+    Args:
+        file_path (str): The .npz archive, the .npz extension is added if missing
+        mmap (bool, optional): Memory-map the samples instead of reading them (defaults to True)
 
     Returns:
-        tuple: mean, sigma, and samples
+        BBN: the loaded instance
     """
-    prob_uca = self.prob_uca[uca_type]
-    mean = np.mean(prob_uca)
-    sigma = np.std(prob_uca)
-    return mean, sigma, prob_uca
+    arrays, metadata = load_arrays(file_path, mmap=mmap)
+    bbn = cls.__new__(cls)
+    bbn._initialize(None, None, data=None, seed=metadata['seed'], cache=None, workers=None, incremental=False,
+                    **metadata['options'])
+    bbn.metadata = metadata
+    bbn._uca = metadata['uca']
+    bbn._odc = metadata['odc']
+    bbn._sdlc = metadata['stages']
+    bbn.total_samples = metadata['total_samples']
+    bbn.converged = metadata['converged']
+    bbn.prob_dcp = metadata['prob_dcp']
+    bbn._store_samples(arrays['prob_stage'], arrays['prob_odc'], arrays['prob_uca'], arrays['prob_total'],
+                       weights=arrays.get('weights'))
+    if bbn.chunk_size is not None:
+      def state(key, name):
+        return {field: arrays[f'summary:{key}:{name}:{field}']
+                for field in ['scalars', 'counts', 'reservoir', 'reservoir_weights']}
+      bbn.summary = {'stage': {stage: StreamingSummary.from_state(state('stage', stage)) for stage in bbn._sdlc},
+                     'odc': {odc: StreamingSummary.from_state(state('odc', odc)) for odc in bbn._odc},
+                     'uca': {uca: StreamingSummary.from_state(state('uca', uca)) for uca in bbn._uca},
+                     'total': StreamingSummary.from_state(state('total', 'total'))}
+    return bbn
+
 
+  def _plot_data(self, key, log=False):
+    """Get the data of a plot
+
+    Args:
+        key (str): 'stage', 'odc', 'uca' or 'total'
+        log (bool, optional): Log-spaced bins (defaults to False)
+
+    Returns:
+        dict: samples of each output, or in chunked mode with log-spaced bins the histograms of the streaming
+          statistics, which cover all samples
+    """
+    if self.summary is not None and log:
+      if key == 'total':
+        return {'Total Failure Probability': self.summary['total'].histogram()}
+      return {name: summary.histogram() for name, summary in self.summary[key].items()}
+    samples = {'stage': self.prob_stage, 'odc': self.prob_odc, 'uca': self.prob_uca}
+    return samples[key] if key in samples else {'Total Failure Probability': self.prob_total}
 
-  def plot(self, type='all', save=False, show=True):
+  def plot(self, type='all', save=False, show=True, bins=50, log=False):
     """Plot calculated data
 
     Args:
         type (str, optional): Type of plots to plot (defaults to 'all')
         save (bool, optional): Save plots into .png file if True (defaults to False)
+        show (bool, optional): Show plots if True (defaults to True)
+        bins (int, optional): Number of histogram bins (defaults to 50)
+        log (bool, optional): Log-spaced bins and log scale value axis if True (defaults to False)
 
     Returns:
       list or figure object: plotly figure object
     """
+    titles = {'stage': 'Software Development Life Cycle Stage Failure Probabilities Based on Human Error Propagation',
+              'odc': 'Software ODC Failure Probabilities',
+              'uca': 'Software UCA Failure Probabilities',
+              'total': 'Total Software Failure Probability'}
+    options = {'save': save, 'show': show, 'bins': bins, 'log': log, 'weights': self.weights}
     fig = None
     if type.lower() == 'all':
-      fig1 = plot_histogram(self.prob_stage, title='Software Development Life Cycle Stage Failure Probabilities Based on Human Error Propagation', save=save, show=show)
-      fig2 = plot_histogram(self.prob_odc, title='Software ODC Failure Probabilities', save=save, show=show)
-      fig3 = plot_histogram(self.prob_uca, title='Software UCA Failure Probabilities', save=save, show=show)
-      fig4 = plot_histogram({'Total Failure Probability':self.prob_total}, title='Total Software Failure Probability', save=save, show=show)
-      fig = [fig1, fig2, fig3, fig4]
-    elif type.lower() == 'stage':
-      fig = plot_histogram(self.prob_stage, title='Software Development Life Cycle Stage Failure Probabilities Based on Human Error Propagation', save=save, show=show)
-    elif type.lower() == 'odc':
-      fig = plot_histogram(self.prob_odc, title='Software ODC Failure Probabilities', save=save, show=show)
-    elif type.lower() == 'uca':
-      fig = plot_histogram(self.prob_uca, title='Software UCA Failure Probabilities', save=save, show=show)
-    elif type.lower() == 'total':
-      fig = plot_histogram({'Total Failure Probability':self.prob_total}, title='Total Software Failure Probability', save=save, show=show)
+      fig = [plot_histogram(self._plot_data(key, log), title=title, **options) for key, title in titles.items()]
+    elif type.lower() in titles:
+      fig = plot_histogram(self._plot_data(type.lower(), log), title=titles[type.lower()], **options)
 
     return fig
 
@@ -1,27 +1,30 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
+import numpy as np
 from scipy.stats import beta
 import logging
 
-from .utils import ODC_types, SDLC_stages, read_excel
+from .utils import ODC_types, SDLC_stages, get_sheet
 
 logger = logging.getLogger('BAHAMAS.ODC')
 
+# Jeffreys prior of the beta distributions
+alpha_prior = 0.5
+beta_prior = 0.5
+
 def get_stage_odc_dist(excel_file, distribution='beta', sheet_name='ODC'):
   """Get the distribution of each ODC defect at the given SDLC stage
   P(Defect type|SDLC Stage) = dist_dict['SDLC Stage']['Defect type']
 
   Args:
-      excel_file (str): Filename of the excel file to read in
+      excel_file (str or dict): Filename of the excel file to read in, or its sheets loaded by utils.read_workbook
       distribution (str, optional): Type of distribution to use (defaults to "beta")
       sheet_name (str, optional): Name of the sheet with the ODC data (defaults to "ODC")
   """
   logger.info('Construct ODC Conditional Distribution for each SDLC stage')
-  alpha_prior = 0.5
-  beta_prior = 0.5
   dist_dict = {}
 
-  df = read_excel(excel_file, sheet_name=sheet_name)
+  df = get_sheet(excel_file, sheet_name)
   for _, row in df.iterrows():
     dist_dict[row.Stages] = {}
     total = row.Total
@@ -36,6 +39,44 @@ def get_stage_odc_dist(excel_file, distribution='beta', sheet_name='ODC'):
       dist_dict[row.Stages][odc] = dist
   return dist_dict
 
+def get_stage_odc_params(excel_file, sheet_name='ODC'):
+  """Get the parameters of the beta distribution of each ODC defect at each SDLC stage, the parameter
+  table equivalent of get_stage_odc_dist
+
+  Args:
+      excel_file (str or dict): Filename of the excel file to read in, or its sheets loaded by utils.read_workbook
+      sheet_name (str, optional): Name of the sheet with the ODC data (defaults to "ODC")
+
+  Returns:
+      dict: {'alpha':numpy.ndarray, 'beta':numpy.ndarray}, shape (stages, odc) in the order of utils.SDLC_stages
+        and utils.ODC_types
+  """
+  df = get_sheet(excel_file, sheet_name).set_index('Stages')
+  counts = df.loc[SDLC_stages, ODC_types].to_numpy(dtype=float)
+  total = df.loc[SDLC_stages, 'Total'].to_numpy(dtype=float)
+  return {'alpha': alpha_prior + counts, 'beta': beta_prior + total[:, None] - counts}
 
+def sample_stage_odc(params, num_samples, random_state=None, uniforms=None):
+  """Sample the ODC conditional probabilities of all SDLC stages in one vectorized call
 
+  Args:
+      params (dict): Beta distribution parameters from get_stage_odc_params
+      num_samples (int): Number of samples
+      random_state (numpy.random.Generator, optional): Random number generator (defaults to None, i.e.,
+        numpy's global state)
+      uniforms (numpy.ndarray, optional): Uniform samples mapped through the inverse CDF, shape (stages, odc, samples)
+        (defaults to None, i.e., random sampling)
 
+  Returns:
+      numpy.ndarray: samples, shape (stages, odc, samples)
+  """
+  a = params['alpha'][..., None]
+  b = params['beta'][..., None]
+  if uniforms is not None:
+    return beta.ppf(uniforms, a, b)
+  if random_state is None or isinstance(random_state, np.random.RandomState):
+    # numpy's global state, seeded by numpy.random.seed, or a legacy RandomState
+    rng = np.random if random_state is None else random_state
+  else:
+    rng = np.random.default_rng(random_state)
+  return rng.beta(a, b, size=params['alpha'].shape + (num_samples,))
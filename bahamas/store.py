@@ -0,0 +1,111 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import json
+import struct
+import zipfile
+import logging
+import numpy as np
+
+logger = logging.getLogger('BAHAMAS.Store')
+
+# Name of the member of the archive that holds the JSON metadata
+metadata_key = 'metadata'
+
+def archive_path(file_path):
+  """Get the path of an archive, with the .npz extension added if missing
+
+  Args:
+      file_path (str): The archive
+
+  Returns:
+      str: the archive with the .npz extension
+  """
+  file_path = str(file_path)
+  return file_path if file_path.endswith('.npz') else file_path + '.npz'
+
+def save_arrays(file_path, arrays, metadata):
+  """Save arrays and metadata to an uncompressed .npz archive. The members are stored without
+  compression, so that they can be memory-mapped by load_arrays
+
+  Args:
+      file_path (str): Output file, the .npz extension is added if missing
+      arrays (dict): {'name': numpy.ndarray}
+      metadata (dict): JSON serializable metadata
+
+  Returns:
+      str: the written archive
+  """
+  if metadata_key in arrays:
+    raise IOError(f'Array name {metadata_key} is reserved for the metadata!')
+  file_path = archive_path(file_path)
+  np.savez(file_path, **arrays, **{metadata_key: np.array(json.dumps(metadata))})
+  return file_path
+
+def _member_offset(f, info):
+  """Get the offset of the data of an archive member, after its local file header
+
+  Args:
+      f (file): The archive opened in binary mode
+      info (zipfile.ZipInfo): The member
+
+  Returns:
+      int: offset of the member data in the file
+  """
+  f.seek(info.header_offset)
+  header = f.read(30)
+  if header[:4] != b'PK\x03\x04':
+    raise IOError(f'Corrupted archive member {info.filename}!')
+  name_length, extra_length = struct.unpack('<HH', header[26:30])
+  return info.header_offset + 30 + name_length + extra_length
+
+def _map_member(file_path, f, info):
+  """Memory-map an uncompressed .npy archive member
+
+  Args:
+      file_path (str): The archive
+      f (file): The archive opened in binary mode
+      info (zipfile.ZipInfo): The member
+
+  Returns:
+      numpy.ndarray: memory-mapped array, or None if the member can not be mapped
+  """
+  if info.compress_type != zipfile.ZIP_STORED:
+    return None
+  f.seek(_member_offset(f, info))
+  version = np.lib.format.read_magic(f)
+  if version == (1, 0):
+    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+  else:
+    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+  if dtype.hasobject or np.prod(shape) == 0:
+    return None
+  return np.memmap(file_path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                   order='F' if fortran_order else 'C')
+
+def load_arrays(file_path, mmap=True):
+  """Load arrays and metadata saved by save_arrays
+
+  Args:
+      file_path (str): The .npz archive, the .npz extension is added if missing
+      mmap (bool, optional): Memory-map the arrays instead of reading them, so that only the accessed
+        samples are read from disk (defaults to True)
+
+  Returns:
+      tuple: {'name': numpy.ndarray} and the metadata dict
+  """
+  file_path = archive_path(file_path)
+  arrays = {}
+  with np.load(file_path, allow_pickle=False) as npz:
+    metadata = json.loads(str(npz[metadata_key]))
+    names = [name for name in npz.files if name != metadata_key]
+    if mmap:
+      with zipfile.ZipFile(file_path) as zf, open(file_path, 'rb') as f:
+        for name in names:
+          array = _map_member(file_path, f, zf.getinfo(name + '.npy'))
+          if array is not None:
+            arrays[name] = array
+    for name in names:
+      if name not in arrays:
+        arrays[name] = npz[name]
+  logger.info('Load %s arrays from %s', len(arrays), file_path)
+  return arrays, metadata
@@ -0,0 +1,209 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import numpy as np
+
+
+class StreamingSummary(object):
+  """
+    Streaming statistics of sampled probabilities: mean and variance (merged with Chan's
+    parallel algorithm), a log-spaced histogram used for quantiles, and a reservoir that
+    keeps the leading samples. Monte Carlo samples are independent and identically
+    distributed, so the leading samples are an unbiased random subsample. Samples may carry
+    importance sampling weights, in which case all statistics are self-normalized weighted
+    estimates.
+  """
+
+  def __init__(self, reservoir_size=10000, low=1e-20, high=1., bins_per_decade=100):
+    """Constructor
+
+    Args:
+        reservoir_size (int, optional): Number of raw samples to keep (defaults to 10000)
+        low (float, optional): Lower edge of the histogram (defaults to 1e-20)
+        high (float, optional): Upper edge of the histogram (defaults to 1)
+        bins_per_decade (int, optional): Number of histogram bins per decade (defaults to 100)
+    """
+    self._low = low
+    self._high = high
+    self._bins_per_decade = bins_per_decade
+    num_bins = int(round(np.log10(high/low)*bins_per_decade))
+    self.edges = np.logspace(np.log10(low), np.log10(high), num_bins+1)
+    self.counts = np.zeros(num_bins)
+    self.underflow = 0 # samples below the lower edge, including zeros
+    self.overflow = 0 # samples above the upper edge
+    self.count = 0
+    self.weight = 0. # sum of the sample weights
+    self.weight2 = 0. # sum of the squared sample weights
+    self.mean = 0.
+    self._m2 = 0.
+    self.min = np.inf
+    self.max = -np.inf
+    self._reservoir_size = reservoir_size
+    self.reservoir = np.empty(0)
+    self.reservoir_weights = np.empty(0)
+
+  def update(self, values, weights=None):
+    """Add a block of samples
+
+    Args:
+        values (numpy.ndarray): samples
+        weights (numpy.ndarray, optional): importance sampling weights of the samples (defaults to None,
+          i.e., unit weights)
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    if values.size == 0:
+      return
+    block = StreamingSummary(self._reservoir_size, self._low, self._high, self._bins_per_decade)
+    block.count = values.size
+    block.min = np.min(values)
+    block.max = np.max(values)
+    if weights is None:
+      weights = np.ones(values.size)
+      block.weight = float(values.size)
+      block.weight2 = float(values.size)
+      block.mean = np.mean(values)
+      block._m2 = np.sum((values - block.mean)**2)
+      block.counts = np.histogram(values, bins=self.edges)[0].astype(float)
+      block.underflow = np.count_nonzero(values < self.edges[0])
+      block.overflow = np.count_nonzero(values > self.edges[-1])
+    else:
+      weights = np.asarray(weights, dtype=float).ravel()
+      block.weight = np.sum(weights)
+      block.weight2 = np.sum(weights**2)
+      block.mean = np.sum(weights*values)/block.weight
+      block._m2 = np.sum(weights*(values - block.mean)**2)
+      block.counts = np.histogram(values, bins=self.edges, weights=weights)[0]
+      block.underflow = np.sum(weights[values < self.edges[0]])
+      block.overflow = np.sum(weights[values > self.edges[-1]])
+    block.reservoir = values[:self._reservoir_size]
+    block.reservoir_weights = weights[:self._reservoir_size]
+    self.merge(block)
+
+  def merge(self, other):
+    """Merge the statistics of another summary into this one, other is assumed to hold
+    the samples that follow the ones of this summary
+
+    Args:
+        other (StreamingSummary): summary with the same histogram edges
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.mean, self._m2 = other.mean, other._m2
+    else:
+      delta = other.mean - self.mean
+      weight = self.weight + other.weight
+      self.mean = self.mean + delta*other.weight/weight
+      self._m2 = self._m2 + other._m2 + delta**2*self.weight*other.weight/weight
+    self.count += other.count
+    self.weight += other.weight
+    self.weight2 += other.weight2
+    self.min = min(self.min, other.min)
+    self.max = max(self.max, other.max)
+    self.counts = self.counts + other.counts
+    self.underflow += other.underflow
+    self.overflow += other.overflow
+    if self.reservoir.size < self._reservoir_size:
+      num = self._reservoir_size - self.reservoir.size
+      self.reservoir = np.concatenate([self.reservoir, other.reservoir[:num]])
+      self.reservoir_weights = np.concatenate([self.reservoir_weights, other.reservoir_weights[:num]])
+
+  @property
+  def var(self):
+    """Population variance of the samples
+    """
+    return self._m2/self.weight if self.count > 0 else np.nan
+
+  @property
+  def std(self):
+    """Population standard deviation of the samples
+    """
+    return np.sqrt(self.var)
+
+  @property
+  def ess(self):
+    """Effective sample size, (sum w)^2/sum w^2, equal to count for unit weights
+    """
+    return self.weight**2/self.weight2 if self.count > 0 else 0.
+
+  def quantile(self, q):
+    """Estimate quantiles from the histogram, interpolating log-linearly within a bin
+
+    Args:
+        q (float or array-like): quantiles in [0, 1]
+
+    Returns:
+        float or numpy.ndarray: estimated quantiles
+    """
+    q = np.asarray(q, dtype=float)
+    cum = self.underflow + np.concatenate([[0.], np.cumsum(self.counts)])
+    target = q*self.weight
+    idx = np.clip(np.searchsorted(cum, target, side='left'), 1, len(self.counts))
+    lower, upper = cum[idx-1], cum[idx]
+    frac = np.where(upper > lower, (target - lower)/np.where(upper > lower, upper - lower, 1.), 0.)
+    frac = np.clip(frac, 0., 1.)
+    log_edges = np.log(self.edges)
+    value = np.exp(log_edges[idx-1] + frac*(log_edges[idx] - log_edges[idx-1]))
+    # keep the estimates within the observed range
+    value = np.clip(value, self.min, self.max)
+    return value[()] if value.ndim == 0 else value
+
+  def histogram(self):
+    """Get the histogram of the samples
+
+    Returns:
+        tuple: counts and bin edges
+    """
+    return self.counts, self.edges
+
+  def state(self):
+    """Get the state of the summary as arrays, e.g., to save it
+
+    Returns:
+        dict: {'scalars': numpy.ndarray, 'counts': numpy.ndarray, 'reservoir': numpy.ndarray,
+          'reservoir_weights': numpy.ndarray}
+    """
+    scalars = [self._low, self._high, self._bins_per_decade, self._reservoir_size, self.underflow, self.overflow,
+               self.count, self.weight, self.weight2, self.mean, self._m2, self.min, self.max]
+    return {'scalars': np.array(scalars, dtype=float), 'counts': self.counts,
+            'reservoir': self.reservoir, 'reservoir_weights': self.reservoir_weights}
+
+  @classmethod
+  def from_state(cls, state):
+    """Create a summary from its state
+
+    Args:
+        state (dict): state returned by state()
+
+    Returns:
+        StreamingSummary: the summary
+    """
+    (low, high, bins_per_decade, reservoir_size, underflow, overflow,
+     count, weight, weight2, mean, m2, vmin, vmax) = state['scalars']
+    summary = cls(int(reservoir_size), low, high, int(bins_per_decade))
+    summary.underflow, summary.overflow = underflow, overflow
+    summary.count, summary.weight, summary.weight2 = int(count), weight, weight2
+    summary.mean, summary._m2, summary.min, summary.max = mean, m2, vmin, vmax
+    summary.counts = state['counts']
+    summary.reservoir = state['reservoir']
+    summary.reservoir_weights = state['reservoir_weights']
+    return summary
+
+
+def weighted_quantile(values, q, weights=None):
+  """Compute quantiles of weighted samples, using the inverse of the weighted empirical CDF
+
+  Args:
+      values (numpy.ndarray): samples
+      q (float or array-like): quantiles in [0, 1]
+      weights (numpy.ndarray, optional): sample weights (defaults to None, i.e., numpy.quantile)
+
+  Returns:
+      float or numpy.ndarray: quantiles
+  """
+  if weights is None:
+    return np.quantile(values, q)
+  order = np.argsort(values)
+  cdf = np.cumsum(weights[order])
+  cdf /= cdf[-1]
+  idx = np.minimum(np.searchsorted(cdf, q, side='left'), len(values) - 1)
+  return values[order][idx]
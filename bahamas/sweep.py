@@ -0,0 +1,198 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import itertools
+import logging
+import numpy as np
+import pandas as pd
+
+from .software_total_failure_probability_bbn import load_defect_data, propagate
+from .sdlc_stage_hep_calculation import get_stage_actions
+from .defect_conditional_probability import get_stage_review_trigger, dcp_from_review_trigger
+from .stage_odc_distribution import sample_stage_odc
+from .uca_defect_correlation import sample_uca_defect_correlation
+from .utils import SDLC_stages, UCA_types, read_workbook, get_sheet
+
+logger = logging.getLogger('BAHAMAS.Sweep')
+
+# Factors of a sweep: 'samples', 'review:<stage>', 'trigger:<stage>', 'mu:<human error mode>' and 'sigma:<human error mode>'
+factor_types = ['samples', 'review', 'trigger', 'mu', 'sigma']
+
+def grid_design(factors):
+  """Full factorial design of the sweep factors
+
+  Args:
+      factors (dict): {'factor': list of values}
+
+  Returns:
+      pandas.DataFrame: one row per point, one column per factor
+  """
+  names = list(factors)
+  return pd.DataFrame(list(itertools.product(*[factors[name] for name in names])), columns=names)
+
+def random_design(factors, num_points, seed=None):
+  """Random design of the sweep factors
+
+  Args:
+      factors (dict): {'factor': (low, high) range sampled uniformly, or list of values sampled with replacement}
+      num_points (int): Number of points
+      seed (int, optional): Seed of the random number generator (defaults to None)
+
+  Returns:
+      pandas.DataFrame: one row per point, one column per factor
+  """
+  rng = np.random.default_rng(seed)
+  design = {}
+  for name, values in factors.items():
+    if isinstance(values, tuple):
+      design[name] = rng.uniform(values[0], values[1], num_points)
+    else:
+      design[name] = rng.choice(values, num_points)
+  return pd.DataFrame(design)
+
+
+class ParameterSweep(object):
+  """
+    Sweep of the BBN task level assessment over review numbers, trigger coverages, human error mode
+    distribution parameters and sample counts. All points share one set of input samples (common random
+    numbers): the human error probabilities are drawn as standard normal latent variables, so that a change
+    of mu or sigma only rescales them, the DCP is a factor of the propagation, and a smaller sample count
+    uses the leading samples. Stage HEP samples are cached and only recomputed for the stages whose human
+    error modes change.
+  """
+
+  def __init__(self, defect_file, task_file, num_samples=1000, seed=42, cache=None, defect_data=None):
+    """Constructor
+
+    Args:
+        defect_file (str or file-like): Defect data file
+        task_file (str or file-like): Task list file
+        num_samples (int, optional): Number of samples of the points without a 'samples' factor (defaults to 1000)
+        seed (int, optional): Seed of the random number generator (defaults to 42)
+        cache (bahamas.cache.WorkbookCache, optional): Cache of parsed input workbooks (defaults to None)
+        defect_data (dict, optional): Defect data loaded by load_defect_data, which replaces defect_file (defaults to
+          None, i.e., load defect_file)
+    """
+    if defect_data is None:
+      defect_data = load_defect_data(defect_file, cache=cache)
+    self.num_samples = num_samples
+    self._seed = seed
+    self._task = read_workbook(task_file, cache=cache)
+    self._odc_params = defect_data['odc_params']
+    self._uca_params = defect_data['uca_params']
+    hemd = get_sheet(defect_data['sheets'], 'HEMD')
+    self._mu = dict(zip(hemd['key'], hemd['mu']))
+    self._sigma = dict(zip(hemd['key'], hemd['sigma']))
+    self._actions = {stage: get_stage_actions(self._task, stage).to_numpy() for stage in SDLC_stages}
+    self._review_trigger = {stage: get_stage_review_trigger(self._task, stage) for stage in SDLC_stages}
+    self._inputs = None # Cached input samples: latent variables of each stage, ODC and UCA correlation
+    self._hep_cache = {} # Cached stage HEP samples, keyed by stage and human error mode parameters
+    self.results = None
+
+  def _parse_factor(self, name):
+    """Split a factor name into its type and target
+
+    Args:
+        name (str): Factor name, e.g., 'review:Design' or 'mu:D1'
+
+    Returns:
+        tuple: type and target (None for 'samples') of the factor
+    """
+    kind, _, target = name.partition(':')
+    if kind == 'samples' and not target:
+      return kind, None
+    if kind in ['review', 'trigger'] and target in SDLC_stages:
+      return kind, target
+    if kind in ['mu', 'sigma'] and target in self._mu:
+      return kind, target
+    raise IOError(f'Unrecognized sweep factor {name}. Valid factors are "samples", "review:<stage>", "trigger:<stage>", '
+                  f'"mu:<mode>" and "sigma:<mode>" with stages {SDLC_stages} and modes {list(self._mu)}!')
+
+  def _sample_inputs(self, num_samples):
+    """Draw the input samples shared by all points, keeping the cached ones if they are large enough
+
+    Args:
+        num_samples (int): Number of samples
+    """
+    if self._inputs is not None and self._inputs['samples'] >= num_samples:
+      return
+    logger.info('Sample the inputs of the sweep with %s samples', num_samples)
+    rng = np.random.default_rng(self._seed)
+    latent = {stage: rng.standard_normal((len(actions), num_samples)) for stage, actions in self._actions.items()}
+    self._inputs = {'samples': num_samples,
+                    'latent': latent,
+                    'odc': sample_stage_odc(self._odc_params, num_samples, random_state=rng),
+                    'uca': sample_uca_defect_correlation(self._uca_params, num_samples, random_state=rng)}
+    self._hep_cache = {}
+
+  def _stage_hep(self, stage, mu, sigma):
+    """Get the HEP samples of a stage for the given human error mode parameters
+
+    Args:
+        stage (str): SDLC stage
+        mu (dict): mu of each human error mode
+        sigma (dict): sigma of each human error mode
+
+    Returns:
+        numpy.ndarray: HEP samples, shape (samples,)
+    """
+    modes = self._actions[stage]
+    key = (stage,) + tuple((mode, mu[mode], sigma[mode]) for mode in sorted(set(modes)))
+    if key not in self._hep_cache:
+      mus = np.array([mu[mode] for mode in modes])[:, None]
+      sigmas = np.array([sigma[mode] for mode in modes])[:, None]
+      # lognormal action HEP, bounded to avoid the explosion of the total distribution
+      action_samples = np.minimum(np.exp(mus + sigmas*self._inputs['latent'][stage]), 1.)
+      with np.errstate(divide='ignore'):
+        self._hep_cache[key] = -np.expm1(np.sum(np.log1p(-action_samples), axis=0))
+    return self._hep_cache[key]
+
+  def run(self, points):
+    """Evaluate the BBN at each point of a design
+
+    Args:
+        points (pandas.DataFrame or list): Design from grid_design or random_design, or a list of
+          {'factor': value} dicts; factors that are not provided keep the values of the input files
+
+    Returns:
+        pandas.DataFrame: tidy results table, one row per point and output (Total and each UCA type) with the
+          factor values, mean and sigma
+    """
+    if isinstance(points, pd.DataFrame):
+      points = points.to_dict('records') if len(points.columns) > 0 else [{}]*len(points)
+    # factors missing from a point, e.g., NaN cells of a table, keep the values of the input files
+    points = [{name: value for name, value in point.items() if not pd.isna(value)} for point in points]
+    factors = {name: self._parse_factor(name) for point in points for name in point}
+    num_samples = max([int(point.get('samples', self.num_samples)) for point in points], default=self.num_samples)
+    self._sample_inputs(num_samples)
+
+    rows = []
+    for i, point in enumerate(points):
+      num = int(point.get('samples', self.num_samples))
+      mu, sigma = dict(self._mu), dict(self._sigma)
+      reviews = {stage: self._review_trigger[stage][0] for stage in SDLC_stages}
+      triggers = {stage: self._review_trigger[stage][1] for stage in SDLC_stages}
+      params = {'mu': mu, 'sigma': sigma, 'review': reviews, 'trigger': triggers}
+      for name, value in point.items():
+        kind, target = factors[name]
+        if target is not None:
+          params[kind][target] = value
+
+      prob_stage = np.array([self._stage_hep(stage, mu, sigma)[:num] for stage in SDLC_stages])
+      prob_dcp = np.array([dcp_from_review_trigger(reviews[stage], triggers[stage]) for stage in SDLC_stages])
+      _, prob_uca, prob_total = propagate(prob_stage, self._inputs['odc'][..., :num], self._inputs['uca'][..., :num], prob_dcp)
+      for output, samples in [('Total', prob_total)] + list(zip(UCA_types, prob_uca)):
+        rows.append(dict({'Point': i}, **point, Output=output, Mean=np.mean(samples), Sigma=np.std(samples)))
+    logger.info('Evaluated %s sweep points', len(points))
+    self.results = pd.DataFrame(rows)
+    return self.results
+
+  def write(self, out_file):
+    """Write the results table
+
+    Args:
+        out_file (str): Output csv file
+    """
+    if self.results is None:
+      raise IOError('No results are available, call run first!')
+    self.results.to_csv(out_file, index=False)
+    logger.info('Sweep results are saved to: %s', out_file)
@@ -2,9 +2,10 @@
 
 import numpy as np
 from scipy.stats import truncnorm, norm, uniform
+from scipy.special import ndtr, ndtri
 import logging
 
-from .utils import ODC_types, UCA_types, UCA_mean, UCA_sigma, read_excel
+from .utils import ODC_types, UCA_types, UCA_mean, UCA_sigma, get_sheet
 
 logger = logging.getLogger('BAHAMAS.UCA')
 
@@ -13,7 +14,7 @@ def get_uca_defect_correlation_dist(excel_file, distribution='norm', sheet_name=
   """Assign distribution for each UCA defect correlation term
 
   Args:
-      excel_file (str): Excel file to read in
+      excel_file (str or dict): Excel file to read in, or its sheets loaded by utils.read_workbook
       distribution (str, optional): Type of distribution (defaults to "norm")
       sheet_name (str, optional): Name of the sheet with UCA correlation data (defaults to "UCA Correlation")
 
@@ -25,7 +26,7 @@ def get_uca_defect_correlation_dist(excel_file, distribution='norm', sheet_name=
   if distribution != 'norm':
     raise IOError(f'Unrecognized distribution {distribution}. Valid distribution is "norm"!')
 
-  df = read_excel(excel_file, sheet_name=sheet_name, index_col=0)
+  df = get_sheet(excel_file, sheet_name, index_col=0)
   dist_dict = {}
   for i, uca_name in enumerate(UCA_types):
     dist_dict[uca_name] = {}
@@ -41,3 +42,55 @@ def get_uca_defect_correlation_dist(excel_file, distribution='norm', sheet_name=
         # dist = norm(loc=mean, scale=sigma)
       dist_dict[uca_name][odc] = dist
   return dist_dict
+
+def get_uca_defect_correlation_params(excel_file, sheet_name='UCA Correlation'):
+  """Get the parameters of the truncated normal distribution of each UCA defect correlation term, the
+  parameter table equivalent of get_uca_defect_correlation_dist
+
+  Args:
+      excel_file (str or dict): Excel file to read in, or its sheets loaded by utils.read_workbook
+      sheet_name (str, optional): Name of the sheet with UCA correlation data (defaults to "UCA Correlation")
+
+  Returns:
+      dict: {'mean', 'sigma', 'a', 'b': truncnorm parameters, 'uniform': mask of the terms without data, which
+        are sampled from uniform(0, 1E-14)}, numpy.ndarray of shape (uca, odc) in the order of utils.UCA_types
+        and utils.ODC_types
+  """
+  df = get_sheet(excel_file, sheet_name, index_col=0)
+  mean = df.loc[ODC_types, UCA_mean].to_numpy(dtype=float).T
+  sigma = df.loc[ODC_types, UCA_sigma].to_numpy(dtype=float).T
+  uniform_mask = (mean == 0.) & (sigma == 0.)
+  # standard parameters for the uniform terms keep the vectorized truncnorm evaluation finite
+  sigma = np.where(uniform_mask, 1., sigma)
+  return {'mean': mean, 'sigma': sigma, 'a': (0 - mean) / sigma, 'b': (1 - mean) / sigma, 'uniform': uniform_mask}
+
+def sample_uca_defect_correlation(params, num_samples, random_state=None, uniforms=None):
+  """Sample all UCA defect correlation terms in one vectorized call
+
+  Args:
+      params (dict): Distribution parameters from get_uca_defect_correlation_params
+      num_samples (int): Number of samples
+      random_state (numpy.random.Generator, optional): Random number generator (defaults to None, i.e.,
+        numpy's global state)
+      uniforms (numpy.ndarray, optional): Uniform samples mapped through the inverse CDF, shape (uca, odc, samples)
+        (defaults to None, i.e., random sampling)
+
+  Returns:
+      numpy.ndarray: samples, shape (uca, odc, samples)
+  """
+  if uniforms is None:
+    if random_state is None or isinstance(random_state, np.random.RandomState):
+      # numpy's global state, seeded by numpy.random.seed, or a legacy RandomState
+      rng = np.random if random_state is None else random_state
+    else:
+      rng = np.random.default_rng(random_state)
+    uniforms = rng.random(params['mean'].shape + (num_samples,))
+  a, b, mean, sigma = [params[key][..., None] for key in ['a', 'b', 'mean', 'sigma']]
+  # inverse CDF of the standard normal truncated to [a, b], evaluated on the lower tail side of the truncation
+  # interval to keep the accuracy: X = -Y with Y truncated to [-b, -a] if a > 0
+  flip = a > 0
+  low = ndtr(np.where(flip, -b, a))
+  high = ndtr(np.where(flip, -a, b))
+  x = ndtri(low + np.where(flip, 1. - uniforms, uniforms)*(high - low))
+  samples = mean + sigma*np.where(flip, -x, x)
+  return np.where(params['uniform'][..., None], uniforms*1E-14, samples)
@@ -1,9 +1,11 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
 import logging
+import hashlib
 import pathlib
 import toml
 import os
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger()
@@ -24,6 +26,60 @@ UCA_mean = ['UCA-A Mean',	'UCA-B Mean',	'UCA-C Mean',	'UCA-D Mean']
 UCA_sigma = ['UCA-A Sigma',	'UCA-B Sigma','UCA-C Sigma','UCA-D Sigma']
 
 
+def _strip_values(values):
+  """Strip trailing/leading whitespace from the string cells of a Series, other cells are
+  kept untouched. The column is factorized, so that each distinct string is stripped only once
+
+  Args:
+      values (pandas.Series): Values to strip
+
+  Returns:
+      pandas.Series: The values with strings stripped
+  """
+  if isinstance(values.dtype, pd.StringDtype):
+    return values.str.strip()
+  inferred = pd.api.types.infer_dtype(values, skipna=True)
+  if inferred not in ('string', 'mixed', 'mixed-integer'):
+    # no string values at all (e.g., object column of numbers or dates)
+    return values
+  cells = values.to_numpy(dtype=object)
+  codes, uniques = pd.factorize(cells)
+  if inferred == 'string':
+    # all the non-missing cells are strings
+    stripped = np.fromiter((value.strip() for value in uniques), dtype=object, count=len(uniques))
+    keep = codes < 0
+  else:
+    # factorize treats e.g. True, 1 and 1.0 as equal, but never a string and another object, so the cells of the
+    # other uniques are kept
+    is_string = np.fromiter((isinstance(value, str) for value in uniques), dtype=bool, count=len(uniques))
+    stripped = np.array([value.strip() if string else value for value, string in zip(uniques, is_string)],
+                        dtype=object)
+    keep = (codes < 0) | ~is_string[codes]
+  result = stripped.take(codes)
+  if keep.any():
+    # missing cells (code -1) and non-string cells
+    result = np.where(keep, cells, result)
+  return pd.Series(result, index=values.index, name=values.name)
+
+
+def _strip_whitespace(df):
+  """Strip trailing/leading whitespace from string values of a DataFrame (including
+  the index if it holds strings)
+
+  Args:
+      df (pandas.DataFrame): Data to strip, modified in place
+
+  Returns:
+      pandas.DataFrame: The data with string values stripped
+  """
+  for col in df.columns:
+    if df[col].dtype == object or isinstance(df[col].dtype, pd.StringDtype):
+      df[col] = _strip_values(df[col])
+  if df.index.dtype == object or isinstance(df.index.dtype, pd.StringDtype):
+    df.index = pd.Index(_strip_values(df.index.to_series()), name=df.index.name)
+  return df
+
+
 def read_excel(*args, **kwargs):
   """Read an excel file into a pandas DataFrame, stripping trailing/leading
   whitespace from string values (including the column index if it holds strings)
@@ -32,15 +88,86 @@ def read_excel(*args, **kwargs):
       *args, **kwargs: Arguments passed directly to pandas.read_excel
 
   Returns:
-      pandas.DataFrame: The parsed excel data with string values stripped
+      pandas.DataFrame or dict: The parsed excel data with string values stripped,
+      a dict of DataFrames keyed by sheet name if multiple sheets are requested
   """
-  df = pd.read_excel(*args, **kwargs)
-  for col in df.columns:
-    if df[col].dtype == object:
-      df[col] = df[col].apply(lambda val: val.strip() if isinstance(val, str) else val)
-  if df.index.dtype == object:
-    df.index = df.index.map(lambda val: val.strip() if isinstance(val, str) else val)
-  return df
+  data = pd.read_excel(*args, **kwargs)
+  if isinstance(data, dict):
+    return {name: _strip_whitespace(df) for name, df in data.items()}
+  return _strip_whitespace(data)
+
+
+def read_workbook(excel_file, cache=None):
+  """Read all sheets of an excel file in a single pass, so that the workbook is only
+  parsed once no matter how many sheets are used by the calculation
+
+  Args:
+      excel_file (str, file-like or dict): The excel file to read in, or its sheets, which are returned as is
+      cache (bahamas.cache.WorkbookCache, optional): Cache of parsed workbooks (defaults to None)
+
+  Returns:
+      dict: The parsed sheets, {'sheet name': pandas.DataFrame}
+  """
+  if isinstance(excel_file, dict):
+    return excel_file
+  logger.info('Load workbook %s', getattr(excel_file, 'name', excel_file))
+  if cache is not None:
+    return cache.load(excel_file, lambda f: read_excel(f, sheet_name=None))
+  return read_excel(excel_file, sheet_name=None)
+
+
+def get_sheet(source, sheet_name, usecols=None, index_col=None):
+  """Get a sheet from a workbook loaded by read_workbook, or read it from the excel file
+
+  Args:
+      source (str, file-like or dict): The excel file, or the sheets returned by read_workbook
+      sheet_name (str): Name of the sheet
+      usecols (list, optional): Names of the columns to keep (defaults to all columns)
+      index_col (int, optional): Position of the column to use as index (defaults to None)
+
+  Returns:
+      pandas.DataFrame: The requested sheet
+  """
+  if not isinstance(source, dict):
+    return read_excel(source, sheet_name=sheet_name, usecols=usecols, index_col=index_col)
+  if sheet_name not in source:
+    raise ValueError(f'Worksheet named "{sheet_name}" not found')
+  df = source[sheet_name]
+  if usecols is not None:
+    df = df[usecols]
+  if index_col is not None:
+    df = df.set_index(df.columns[index_col])
+  return df.copy()
+
+
+def hash_sheet(df):
+  """Compute a content hash of a sheet, e.g., to detect which sheets of a workbook changed
+
+  Args:
+      df (pandas.DataFrame): The sheet
+
+  Returns:
+      str: SHA-256 hex digest of the column names, index and values
+  """
+  sha = hashlib.sha256(repr(list(df.columns)).encode())
+  sha.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+  return sha.hexdigest()
+
+
+def hash_workbook(sheets):
+  """Compute a content hash of a workbook loaded by read_workbook
+
+  Args:
+      sheets (dict): The sheets, {'sheet name': pandas.DataFrame}
+
+  Returns:
+      str: SHA-256 hex digest of the sheet names and the hash of each sheet
+  """
+  sha = hashlib.sha256()
+  for name in sorted(sheets):
+    sha.update(name.encode())
+    sha.update(hash_sheet(sheets[name]).encode())
+  return sha.hexdigest()
 
 
 def read_toml(file_path):
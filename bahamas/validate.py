@@ -29,6 +29,67 @@ bbn_schema = {
               "type": "integer",
               "minimum": 0,
               "description": "The seed value for random number generation to ensure reproducibility."
+            },
+            "cache_dir": {
+              "type": "string",
+              "description": "Directory of the on-disk cache of parsed input workbooks."
+            },
+            "chunk_size": {
+              "type": "integer",
+              "minimum": 1,
+              "description": "If provided, samples are processed in blocks of this size and only streaming statistics are kept."
+            },
+            "reservoir_size": {
+              "type": "integer",
+              "minimum": 0,
+              "description": "Number of raw samples kept for plotting when samples are processed in blocks."
+            },
+            "workers": {
+              "type": "integer",
+              "minimum": 1,
+              "description": "Number of worker processes; results are reproducible regardless of the number of workers."
+            },
+            "bit_generator": {
+              "type": "string",
+              "enum": ["PCG64", "PCG64DXSM", "SFC64", "Philox", "MT19937"],
+              "description": "The numpy bit generator used for random number generation."
+            },
+            "sampling": {
+              "type": "string",
+              "enum": ["random", "lhs", "sobol"],
+              "description": "Sampling method: 'random' for pseudo-random, 'lhs' for Latin hypercube, 'sobol' for scrambled Sobol sequence."
+            },
+            "tolerance": {
+              "type": "number",
+              "exclusiveMinimum": 0,
+              "description": "If provided, batches of 'samples' are drawn until the relative error of the total and UCA failure probabilities falls below this tolerance."
+            },
+            "max_samples": {
+              "type": "integer",
+              "minimum": 1,
+              "description": "Maximum number of samples drawn when a tolerance is provided."
+            },
+            "quantile": {
+              "type": "number",
+              "exclusiveMinimum": 0,
+              "exclusiveMaximum": 1,
+              "description": "Quantile whose confidence interval is used for the convergence check instead of the mean."
+            },
+            "importance": {
+              "type": "number",
+              "exclusiveMinimum": 0,
+              "exclusiveMaximum": 1,
+              "description": "If provided, importance sampling biases the stage HEP and ODC inputs toward total failure probabilities above this quantile of a pilot run, estimates are weighted."
+            },
+            "pilot_samples": {
+              "type": "integer",
+              "minimum": 1,
+              "description": "Minimum number of samples of the importance sampling pilot run."
+            },
+            "dtype": {
+              "type": "string",
+              "enum": ["float32", "float64"],
+              "description": "Precision of the stored samples, float32 halves the memory of the samples."
             }
           },
           "required": ["samples"]
@@ -14,6 +14,9 @@ from .utils import SDLC_stages, UCA_types
 from .validate import validate_toml
 from .software_total_failure_probability_bbn import BBN
 from .cccg import CCCG
+from .cache import WorkbookCache
+from .batch import BatchAssessment
+from .writer import write_bbn, write_table
 
 logger = logging.getLogger('BAHAMAS.Workflow')
 
@@ -46,6 +49,7 @@ class Workflow:
     self._config = config
     self._bbn_config = None
     self._ccf_config = None
+    self.bbn = None # BBN instance of the last BBN calculation
     # validate input
     self._validate(config)
     if 'BBN' in config:
@@ -88,27 +92,57 @@ class Workflow:
     self._task_data = self._bbn_config['files']['task']
     self._analysis_type = self._bbn_config['analysis']['type']
     self._approx_file = self._bbn_config['files']['approx']
+    cache_dir = self._bbn_config['params'].get('cache_dir')
+    self._cache = WorkbookCache(cache_dir) if cache_dir is not None else None
+    self._chunk_size = self._bbn_config['params'].get('chunk_size')
+    self._reservoir_size = self._bbn_config['params'].get('reservoir_size', 10000)
+    self._workers = self._bbn_config['params'].get('workers')
+    self._bit_generator = self._bbn_config['params'].get('bit_generator', 'PCG64')
+    self._sampling = self._bbn_config['params'].get('sampling', 'random')
+    self._tolerance = self._bbn_config['params'].get('tolerance')
+    self._max_samples = self._bbn_config['params'].get('max_samples', 1000000)
+    self._quantile = self._bbn_config['params'].get('quantile')
+    self._importance = self._bbn_config['params'].get('importance')
+    self._pilot_samples = self._bbn_config['params'].get('pilot_samples', 10000)
+    self._dtype = self._bbn_config['params'].get('dtype', 'float64')
 
   def initialize_ccf(self):
     """Initialize CCF calculation
     """
     self._sys_diagram = self._ccf_config['files']['structure']
 
+  def _bbn_options(self):
+    """Collect the BBN options from the config
+
+    Returns:
+        dict: keyword arguments of BBN
+    """
+    return {'seed':self._seed, 'cache':self._cache, 'chunk_size':self._chunk_size, 'reservoir_size':self._reservoir_size,
+            'workers':self._workers, 'bit_generator':self._bit_generator, 'sampling':self._sampling,
+            'tolerance':self._tolerance, 'max_samples':self._max_samples, 'quantile':self._quantile,
+            'importance':self._importance, 'pilot_samples':self._pilot_samples, 'dtype':self._dtype}
+
   def run_bbn(self):
     """Run BBN Calculation
 
     Raises:
         IOError: Error out if invalid input for analysis type is provided
     """
+    options = self._bbn_options()
     if self._analysis_type == 'precise':
-      software_BBN = BBN(self._defect_data, self._task_data, self._num_samples, approx=False, seed=self._seed)
+      software_BBN = BBN(self._defect_data, self._task_data, self._num_samples, approx=False, **options)
     elif self._analysis_type == 'approx':
-      software_BBN = BBN(self._defect_data, self._approx_file, self._num_samples, approx=True, seed=self._seed)
+      software_BBN = BBN(self._defect_data, self._approx_file, self._num_samples, approx=True, **options)
     else:
       raise IOError('Invalid input')
     software_BBN.calculate()
+    self.bbn = software_BBN
     software_BBN.plot(save=False)
 
+    if self._tolerance is not None:
+      logger.info('Number of samples: %s, converged: %s', software_BBN.total_samples, software_BBN.converged)
+    if self._importance is not None:
+      logger.info('Effective sample size: %s', software_BBN.get_effective_sample_size())
     total_failure_mean, total_failure_sigma, _ = software_BBN.get_total_failure_probability()
     logger.info('Software total failure: %s with std %s', total_failure_mean, total_failure_sigma)
 
@@ -116,6 +150,35 @@ class Workflow:
       mean, sigma, _ = software_BBN.get_uca(uca)
       logger.info('UCA type: %s, Mean: %s, STD: %s', uca, mean, sigma)
 
+  def run_batch(self, task_files, out_file, workers=None, style=None):
+    """Run the BBN calculation for many task lists that share the defect data of the config
+
+    Args:
+        task_files (str or list): Task list files (SDLC stage data files for the approx analysis), or a directory or
+          manifest file of such workbooks
+        out_file (str): Output file of the consolidated results
+        workers (int, optional): Number of worker processes, each task list is evaluated serially (defaults to None,
+          i.e., serial assessment)
+        style (str, optional): Type of the output file, "csv", "parquet" or "npz" (defaults to None, i.e., the file
+          extension)
+
+    Returns:
+        pandas.DataFrame: results table, one row per task list
+    """
+    if self._bbn_config is None:
+      raise IOError('Batch assessment requires a BBN config!')
+    if self._analysis_type not in ['precise', 'approx']:
+      raise IOError('Invalid input')
+    options = self._bbn_options()
+    # the task lists are distributed over the workers, each BBN runs serially to avoid nested worker pools
+    options.pop('workers')
+    cache = options.pop('cache')
+    batch = BatchAssessment(self._defect_data, task_files, workers=workers, cache=cache, approx=self._analysis_type == 'approx',
+                            num_samples=self._num_samples, **options)
+    results = batch.run()
+    batch.write(out_file, style)
+    return results
+
   def run_ccf(self):
     """Run CCF calculation
     """
@@ -135,18 +198,22 @@ class Workflow:
       logger.info('End CCCGs generation')
 
 
-  def write(self, data, fname, style='csv'):
+  def write(self, data, fname, style=None, chunk_rows=1000000):
     """Dump data
 
     Args:
-        data (pandas.DataFrame): Output data to dump
+        data (pandas.DataFrame or BBN): Output data to dump, a calculated BBN writes its stage, ODC, UCA and total
+          samples and their summary statistics, see bahamas.writer.write_bbn
         fname (str): File name for saving the data
-        style (str, optional): Type of file (defaults to "csv")
+        style (str, optional): Type of file, "csv", "parquet" or "npz" (defaults to None, i.e., the file extension)
+        chunk_rows (int, optional): Number of BBN samples written per block (defaults to 1000000)
     """
     if isinstance(data, pd.DataFrame):
-      data.to_csv(fname, index=False)
+      write_table(data, fname, style)
+    elif isinstance(data, BBN):
+      write_bbn(data, fname, style=style, chunk_rows=chunk_rows)
     else:
-      pass
+      raise IOError(f'Unsupported output data type {type(data).__name__}!')
 
   def visualize(self):
     pass
@@ -0,0 +1,233 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+import os
+import zipfile
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('BAHAMAS.Writer')
+
+output_formats = ['csv', 'parquet', 'npz']
+
+def output_format(file_path, style=None):
+  """Get the format of an output file
+
+  Args:
+      file_path (str): Output file
+      style (str, optional): Format, one of output_formats (defaults to None, i.e., the file extension)
+
+  Returns:
+      str: the format
+  """
+  if style is None:
+    style = os.path.splitext(file_path)[1].lstrip('.').lower() or 'csv'
+  if style not in output_formats:
+    raise IOError(f'Unrecognized output format {style}. Valid formats are {output_formats}!')
+  return style
+
+def _import_pyarrow():
+  """Import pyarrow, which is only required by the parquet format
+
+  Returns:
+      tuple: pyarrow and pyarrow.parquet modules
+  """
+  try:
+    import pyarrow
+    import pyarrow.parquet
+  except ImportError:
+    raise IOError('The parquet format requires pyarrow, install it with "pip install pyarrow" '
+                  'or use the csv or npz format!')
+  return pyarrow, pyarrow.parquet
+
+def write_table(df, file_path, style=None):
+  """Write a table
+
+  Args:
+      df (pandas.DataFrame): The table
+      file_path (str): Output file
+      style (str, optional): Format, one of output_formats (defaults to None, i.e., the file extension)
+  """
+  style = output_format(file_path, style)
+  if style == 'csv':
+    df.to_csv(file_path, index=False)
+  elif style == 'parquet':
+    _import_pyarrow()
+    df.to_parquet(file_path, index=False)
+  else:
+    # object columns, e.g., strings, are stored as unicode arrays, which load without pickle. The file is passed
+    # open, so that numpy does not add the .npz extension
+    with open(file_path, 'wb') as f:
+      np.savez(f, **{str(column): df[column].to_numpy(dtype=str) if df[column].dtype == object
+                     else df[column].to_numpy() for column in df.columns})
+
+
+class SampleWriter(object):
+  """
+    Chunked writer of a sample table with a known number of rows, so that large sample counts are written
+    block by block without building the whole table in memory. The npz format stores the samples as one
+    uncompressed (rows, columns) array, streamed into the archive, and the column names.
+  """
+
+  def __init__(self, file_path, columns, num_rows, style=None, dtype='float64'):
+    """Constructor
+
+    Args:
+        file_path (str): Output file
+        columns (list): Names of the columns
+        num_rows (int): Number of rows that will be written
+        style (str, optional): Format, one of output_formats (defaults to None, i.e., the file extension)
+        dtype (str, optional): Type of the samples in the npz and parquet formats (defaults to 'float64')
+    """
+    self._style = output_format(file_path, style)
+    self._file_path = file_path
+    self._columns = list(columns)
+    self._num_rows = num_rows
+    self._dtype = np.dtype(dtype)
+    self._rows = 0
+    if self._style == 'csv':
+      self._file = open(file_path, 'w', newline='')
+      pd.DataFrame(columns=self._columns).to_csv(self._file, index=False)
+    elif self._style == 'parquet':
+      pa, pq = _import_pyarrow()
+      schema = pa.schema([(column, pa.from_numpy_dtype(self._dtype)) for column in self._columns])
+      self._file = pq.ParquetWriter(file_path, schema)
+      self._schema = schema
+    else:
+      self._zip = zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+      self._file = self._zip.open('samples.npy', 'w', force_zip64=True)
+      header = {'descr': np.lib.format.dtype_to_descr(self._dtype), 'fortran_order': False,
+                'shape': (num_rows, len(self._columns))}
+      np.lib.format.write_array_header_1_0(self._file, header)
+
+  def write(self, block):
+    """Write a block of rows
+
+    Args:
+        block (numpy.ndarray): samples, shape (rows, columns)
+    """
+    block = np.asarray(block, dtype=self._dtype)
+    if block.ndim != 2 or block.shape[1] != len(self._columns):
+      raise IOError(f'Expected a block with {len(self._columns)} columns, got shape {block.shape}!')
+    if self._rows + block.shape[0] > self._num_rows:
+      raise IOError(f'More than the {self._num_rows} expected rows are written to {self._file_path}!')
+    if self._style == 'csv':
+      pd.DataFrame(block, columns=self._columns).to_csv(self._file, header=False, index=False)
+    elif self._style == 'parquet':
+      pa, _ = _import_pyarrow()
+      arrays = [pa.array(block[:, i]) for i in range(len(self._columns))]
+      self._file.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+    else:
+      self._file.write(np.ascontiguousarray(block).tobytes())
+    self._rows += block.shape[0]
+
+  def close(self):
+    """Finish the file
+    """
+    self._file.close()
+    if self._style == 'npz':
+      with self._zip.open('columns.npy', 'w') as f:
+        np.lib.format.write_array(f, np.array(self._columns))
+      self._zip.close()
+    if self._rows != self._num_rows:
+      raise IOError(f'{self._rows} rows are written to {self._file_path}, {self._num_rows} are expected!')
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    if exc_type is None:
+      self.close()
+    else:
+      self._file.close()
+      if self._style == 'npz':
+        self._zip.close()
+
+
+def sample_columns(bbn):
+  """Get the sample columns of a BBN calculation, the stored sample arrays are referenced, not copied
+
+  Args:
+      bbn (BBN): Calculated BBN instance
+
+  Returns:
+      tuple: column names, and the samples of each column (list of arrays of shape (samples,))
+  """
+  columns = [f'HEP:{stage}' for stage in bbn._sdlc] + [f'ODC:{odc}' for odc in bbn._odc]
+  columns += [f'UCA:{uca}' for uca in bbn._uca] + ['Total']
+  arrays = [bbn.prob_stage[stage] for stage in bbn._sdlc] + [bbn.prob_odc[odc] for odc in bbn._odc]
+  arrays += [bbn.prob_uca[uca] for uca in bbn._uca] + [bbn.prob_total]
+  if bbn.weights is not None:
+    columns.append('Weight')
+    arrays.append(bbn.weights)
+  return columns, arrays
+
+def summary_table(bbn, quantiles=(0.05, 0.5, 0.95)):
+  """Get the summary statistics of a BBN calculation, the estimates are weighted with importance sampling
+
+  Args:
+      bbn (BBN): Calculated BBN instance
+      quantiles (tuple, optional): Quantiles to report (defaults to (0.05, 0.5, 0.95))
+
+  Returns:
+      pandas.DataFrame: one row per stage HEP, ODC, UCA and total failure probability with the mean, sigma and
+        quantiles
+  """
+  outputs = [('HEP', stage, 'stage', bbn.prob_stage[stage]) for stage in bbn._sdlc]
+  outputs += [('ODC', odc, 'odc', bbn.prob_odc[odc]) for odc in bbn._odc]
+  outputs += [('UCA', uca, 'uca', bbn.prob_uca[uca]) for uca in bbn._uca]
+  rows = []
+  for group, name, key, samples in outputs + [('Total', 'Total', 'total', bbn.prob_total)]:
+    summary = None
+    if bbn.summary is not None:
+      summary = bbn.summary['total'] if key == 'total' else bbn.summary[key][name]
+    mean, sigma, _, values = bbn._estimates(summary, samples, list(quantiles))
+    row = {'Group': group, 'Output': name, 'Mean': mean, 'Sigma': sigma}
+    for q, value in zip(quantiles, values):
+      row[f'Q{q:g}'] = value
+    rows.append(row)
+  return pd.DataFrame(rows)
+
+def write_bbn(bbn, file_path, style=None, chunk_rows=1000000, quantiles=(0.05, 0.5, 0.95)):
+  """Write the samples and summary statistics of a BBN calculation. In chunked mode the samples are the
+  reservoir samples, while the summary statistics cover all samples. The npz format writes both to file_path,
+  the csv and parquet formats write the summary to a second file with the _summary suffix
+
+  Args:
+      bbn (BBN): Calculated BBN instance
+      file_path (str): Output file
+      style (str, optional): Format, one of output_formats (defaults to None, i.e., the file extension)
+      chunk_rows (int, optional): Number of samples written per block (defaults to 1000000)
+      quantiles (tuple, optional): Quantiles reported in the summary (defaults to (0.05, 0.5, 0.95))
+
+  Returns:
+      list: the written files
+  """
+  if bbn.prob_total is None:
+    raise IOError('No samples are available, call calculate first!')
+  style = output_format(file_path, style)
+  columns, arrays = sample_columns(bbn)
+  num_rows = bbn.prob_total.size
+  dtype = np.result_type(*arrays)
+  with SampleWriter(file_path, columns, num_rows, style=style, dtype=dtype) as writer:
+    # only one block of the samples is copied at a time
+    for start in range(0, num_rows, chunk_rows):
+      writer.write(np.column_stack([array[start:start + chunk_rows] for array in arrays]))
+  files = [file_path]
+
+  summary = summary_table(bbn, quantiles)
+  if style == 'npz':
+    statistics = [column for column in summary.columns if column not in ['Group', 'Output']]
+    with zipfile.ZipFile(file_path, 'a', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+      for name, array in [('summary', summary[statistics].to_numpy(dtype=float)),
+                          ('summary_outputs', (summary['Group'] + ':' + summary['Output']).to_numpy(dtype=str)),
+                          ('summary_columns', np.array(statistics))]:
+        with zf.open(name + '.npy', 'w') as f:
+          np.lib.format.write_array(f, array)
+  else:
+    base, ext = os.path.splitext(file_path)
+    summary_file = base + '_summary' + (ext or '.' + style)
+    write_table(summary, summary_file, style)
+    files.append(summary_file)
+  logger.info('BBN outputs are saved to: %s', ', '.join(files))
+  return files
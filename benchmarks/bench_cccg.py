@@ -0,0 +1,120 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+"""
+Benchmark the CCCG identification of bahamas.cccg.CCCG on synthetic plant inventories, written once to a
+temporary xlsx file. The steps are timed separately: parsing the workbook, identifying the CCCGs and joining the
+final CCCGs to the component table
+
+Usage:
+  python bench_cccg.py [--components 100 1000 10000] [--functions 20] [--inputs 50] [--designs 10] [--repeat 1] [--no-memory]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from bahamas.cccg import CCCG
+from bahamas.utils import read_workbook
+
+
+def make_inventory(components, functions=20, inputs=50, designs=10, divisions=3, max_shared=3, seed=0):
+  """Create a synthetic component table
+
+  Args:
+      components (int): Number of components
+      functions (int, optional): Number of distinct functions (defaults to 20)
+      inputs (int, optional): Number of distinct inputs (defaults to 50)
+      designs (int, optional): Number of distinct designs (defaults to 10)
+      divisions (int, optional): Number of divisions (defaults to 3)
+      max_shared (int, optional): Maximum number of functions, inputs and designs of a component (defaults to 3)
+      seed (int, optional): Seed of the random generator (defaults to 0)
+
+  Returns:
+      pandas.DataFrame: Component table in the Example_CCCG_Identification.xlsx schema
+  """
+  rng = np.random.default_rng(seed)
+
+  def configs(prefix, pool, missing):
+    cells = []
+    for _ in range(components):
+      if rng.random() < missing:
+        cells.append(np.nan)
+        continue
+      num = rng.integers(1, min(max_shared, pool) + 1)
+      cells.append('; '.join(f'{prefix}{k}' for k in rng.choice(pool, size=num, replace=False)))
+    return cells
+
+  return pd.DataFrame({'Component_Name': [f'Component_{i}' for i in range(components)],
+                       'Division': np.arange(components) % divisions + 1,
+                       'Function_Config': configs('function', functions, 0.),
+                       'Input_Config': configs('input', inputs, 0.2),
+                       'Design_Config': configs('design', designs, 0.)})
+
+
+def run_steps(file_path, trace=False):
+  """Run the CCCG steps on a component workbook
+
+  Args:
+      file_path (str): Component workbook
+      trace (bool, optional): Record the peak memory of each step with tracemalloc, which slows the steps down,
+        instead of their time (defaults to False)
+
+  Returns:
+      tuple: number of final CCCGs, and {step: time in s or peak memory in MB}
+  """
+  state = {}
+  def parse():
+    state['sheets'] = read_workbook(file_path)
+  def generate():
+    # the parsed sheets are passed on, so that the step does not parse the workbook again
+    state['cccg'] = CCCG(state['sheets'])
+    state['cccg'].generate()
+  steps = [('read xlsx', parse),
+           ('generate', generate),
+           ('aggregate', lambda: state['cccg'].get('final'))]
+  results = {}
+  for name, step in steps:
+    if trace:
+      tracemalloc.start()
+      step()
+      results[name] = tracemalloc.get_traced_memory()[1]/1024**2
+      tracemalloc.stop()
+    else:
+      start = time.perf_counter()
+      step()
+      results[name] = time.perf_counter() - start
+  return len(state['cccg']._cccg_final), results
+
+
+def main():
+  parser = argparse.ArgumentParser(description='Benchmark CCCG identification')
+  parser.add_argument('--components', type=int, nargs='+', default=[100, 1000, 10000], help='Numbers of components')
+  parser.add_argument('--functions', type=int, default=20, help='Number of distinct functions')
+  parser.add_argument('--inputs', type=int, default=50, help='Number of distinct inputs')
+  parser.add_argument('--designs', type=int, default=10, help='Number of distinct designs')
+  parser.add_argument('--repeat', type=int, default=1, help='Number of timing repetitions, the fastest is reported')
+  parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory run')
+  args = parser.parse_args()
+
+  print(f'{"components":>10} {"groups":>8} {"step":>10} {"time [s]":>10} {"peak [MB]":>10}')
+  with tempfile.TemporaryDirectory() as tmp_dir:
+    for components in args.components:
+      file_path = os.path.join(tmp_dir, f'components_{components}.xlsx')
+      make_inventory(components, args.functions, args.inputs, args.designs).to_excel(file_path, index=False)
+      runs = [run_steps(file_path) for _ in range(args.repeat)]
+      groups = runs[0][0]
+      peaks = run_steps(file_path, trace=True)[1] if not args.no_memory else {}
+      for name in runs[0][1]:
+        elapsed = min(run[name] for _, run in runs)
+        peak = f'{peaks[name]:.1f}' if name in peaks else '-'
+        print(f'{components:>10} {groups:>8} {name:>10} {elapsed:>10.4f} {peak:>10}')
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,76 @@
+# Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
+
+"""
+Benchmark the whitespace stripping of bahamas.utils.read_excel on a synthetic task list
+
+Usage:
+  python bench_read_excel.py [--rows 100000] [--repeat 5]
+"""
+import os
+import sys
+import timeit
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from bahamas.utils import human_error_modes, _strip_whitespace, _strip_values
+
+
+def make_task_list(rows, seed=0):
+  """Create a synthetic task list sheet with padded string cells
+
+  Args:
+      rows (int): Number of tasks
+      seed (int, optional): Seed of the random generator (defaults to 0)
+
+  Returns:
+      pandas.DataFrame: Task list in the Example_ComprehensiveAssessment_Task_List.xlsx schema
+  """
+  rng = np.random.default_rng(seed)
+  modes = np.array([f' {mode} ' for mode in human_error_modes], dtype=object)
+  return pd.DataFrame({'Task Number': np.arange(1, rows+1),
+                       'Human Error Mode': modes[rng.integers(len(modes), size=rows)],
+                       'Task Description': np.array([f'Task {i}  ' for i in range(rows)], dtype=object),
+                       'Review Number': rng.uniform(0., 3., size=rows),
+                       'Trigger Coverage': rng.uniform(0., 1., size=rows)})
+
+
+def strip_whitespace_apply(df):
+  """Per-cell stripping used by read_excel before the vectorized implementation
+  """
+  for col in df.columns:
+    if df[col].dtype == object:
+      df[col] = df[col].apply(lambda val: val.strip() if isinstance(val, str) else val)
+  if df.index.dtype == object:
+    df.index = df.index.map(lambda val: val.strip() if isinstance(val, str) else val)
+  return df
+
+
+def main():
+  parser = argparse.ArgumentParser(description='Benchmark whitespace stripping of read_excel')
+  parser.add_argument('--rows', type=int, default=100000, help='Number of rows of the task list')
+  parser.add_argument('--repeat', type=int, default=5, help='Number of timing repetitions')
+  args = parser.parse_args()
+
+  df = make_task_list(args.rows)
+  assert strip_whitespace_apply(df.copy()).equals(_strip_whitespace(df.copy()))
+
+  apply_time = min(timeit.repeat(lambda: strip_whitespace_apply(df.copy()), number=1, repeat=args.repeat))
+  vector_time = min(timeit.repeat(lambda: _strip_whitespace(df.copy()), number=1, repeat=args.repeat))
+  print(f'rows: {args.rows}')
+  print(f'per-cell apply: {apply_time:.4f} s')
+  print(f'vectorized:     {vector_time:.4f} s')
+  print(f'speedup:        {apply_time/vector_time:.2f}x')
+  # label columns repeat a few distinct strings, text columns hold distinct strings
+  for col in ['Human Error Mode', 'Task Description']:
+    values = df[col]
+    apply_time = min(timeit.repeat(lambda: values.apply(lambda val: val.strip() if isinstance(val, str) else val),
+                                   number=1, repeat=args.repeat))
+    vector_time = min(timeit.repeat(lambda: _strip_values(values), number=1, repeat=args.repeat))
+    print(f'{col}: {apply_time:.4f} s -> {vector_time:.4f} s ({apply_time/vector_time:.2f}x)')
+
+
+if __name__ == '__main__':
+  sys.exit(main())
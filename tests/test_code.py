@@ -1,21 +1,32 @@
 # Copyright 2025, Battelle Energy Alliance, LLC  ALL RIGHTS RESERVED
 
 import os
+import itertools
 import numpy as np
+import pandas as pd
 import pytest
 
 from bahamas.sdlc_stage_hep_calculation import sdlc_stage_hep_calculation
 from bahamas.human_error_mode_distribution import get_hemd_from_spreadsheet
-from bahamas.stage_odc_distribution import get_stage_odc_dist
+from bahamas.stage_odc_distribution import get_stage_odc_dist, get_stage_odc_params, sample_stage_odc
 from bahamas.defect_conditional_probability import stage_dcp_calculation
-from bahamas.uca_defect_correlation import get_uca_defect_correlation_dist
-from bahamas.software_total_failure_probability_bbn import BBN
-from bahamas.utils import SDLC_stages, ODC_types, UCA_types
+from bahamas.uca_defect_correlation import get_uca_defect_correlation_dist, get_uca_defect_correlation_params, sample_uca_defect_correlation
+from bahamas.software_total_failure_probability_bbn import BBN, odc_failure_probability
+from bahamas.cache import WorkbookCache
+from bahamas.cccg import CCCG, drop_dup, expand_configs, bitset, bitset_rows, match_CCCG_on, match_CCCG_list_on
+from bahamas.summary import StreamingSummary
+from bahamas.batch import BatchAssessment, find_task_files
+from bahamas.sweep import ParameterSweep, grid_design, random_design
+from bahamas.sensitivity import sobol_indices
+from bahamas.sampling import uniform_design
+from bahamas.writer import write_bbn, write_table, summary_table
+from bahamas.utils import SDLC_stages, ODC_types, UCA_types, read_workbook, _strip_whitespace
 
 
 workdir = os.path.dirname(__file__)
 defect_data = os.path.join(workdir, '..', 'data', 'Example_ComprehensiveAssessment_Defect_Data.xlsx')
 task_data = os.path.join(workdir, '..', 'data', 'Example_ComprehensiveAssessment_Task_List.xlsx')
+cccg_data = os.path.join(workdir, '..', 'data', 'Example_CCCG_Identification.xlsx')
 
 def test_HEP_EMD():
     _, d = get_hemd_from_spreadsheet(defect_data)
@@ -139,16 +150,16 @@ def test_uca_defect_correlation():
 
 def test_BNN():
     uca_mean = [
-        6.961020490811742e-06,
-        1.3120095588845446e-05,
-        4.769145258655531e-06,
-        4.227844956105028e-06,
+        2.7785334756062625e-05,
+        5.248573454179598e-05,
+        1.9106937487811505e-05,
+        1.700463009652695e-05,
     ]
     uca_sigma = [
-        3.0063594160166348e-06,
-        5.322152257419655e-06,
-        2.369530816602122e-06,
-        1.8371002599252646e-06,
+        9.728426883077045e-06,
+        1.6554039494924933e-05,
+        7.246074253622909e-06,
+        7.07209149570748e-06,
     ]
 
     software_BBN = BBN(defect_data, task_data, num_samples=1000)
@@ -162,14 +173,421 @@ def test_BNN():
     abs_tol = 1e-8
 
     assert total_failure_mean == pytest.approx(
-        2.9078106294417748e-05*4.0, rel=rel_tol, abs=abs_tol
+        0.00011638263688219704, rel=rel_tol, abs=abs_tol
     )
     assert total_failure_sigma == pytest.approx(
-        1.179881411364726e-05*4.0, rel=rel_tol, abs=abs_tol
+        3.7207317575501044e-05, rel=rel_tol, abs=abs_tol
     )
 
     for i, uca in enumerate(UCA_types):
         mean, sigma, _ = software_BBN.get_uca(uca)
-        assert mean == pytest.approx(uca_mean[i]*4.0, rel=rel_tol, abs=abs_tol)
-        assert sigma == pytest.approx(uca_sigma[i]*4.0, rel=rel_tol, abs=abs_tol)
+        assert mean == pytest.approx(uca_mean[i], rel=rel_tol, abs=abs_tol)
+        assert sigma == pytest.approx(uca_sigma[i], rel=rel_tol, abs=abs_tol)
 
+def test_distribution_params():
+    odc_dist = get_stage_odc_dist(defect_data)
+    uca_dist = get_uca_defect_correlation_dist(defect_data)
+    odc_params = get_stage_odc_params(defect_data)
+    uca_params = get_uca_defect_correlation_params(defect_data)
+
+    rng = np.random.default_rng(0)
+    odc_uniforms = rng.random((len(SDLC_stages), len(ODC_types), 20))
+    uca_uniforms = rng.random((len(UCA_types), len(ODC_types), 20))
+    odc_samples = sample_stage_odc(odc_params, 20, uniforms=odc_uniforms)
+    uca_samples = sample_uca_defect_correlation(uca_params, 20, uniforms=uca_uniforms)
+    for i, stage in enumerate(SDLC_stages):
+        for j, odc in enumerate(ODC_types):
+            assert odc_samples[i, j] == pytest.approx(odc_dist[stage][odc].ppf(odc_uniforms[i, j]), rel=1e-10)
+    for i, uca in enumerate(UCA_types):
+        for j, odc in enumerate(ODC_types):
+            assert uca_samples[i, j] == pytest.approx(uca_dist[uca][odc].ppf(uca_uniforms[i, j]), rel=1e-8, abs=1e-12)
+
+    assert sample_stage_odc(odc_params, 30, random_state=rng).shape == (len(SDLC_stages), len(ODC_types), 30)
+    assert sample_uca_defect_correlation(uca_params, 30, random_state=rng).shape == (len(UCA_types), len(ODC_types), 30)
+    # without a generator, numpy's global state is used
+    for sampler, params in [(sample_stage_odc, odc_params), (sample_uca_defect_correlation, uca_params)]:
+        np.random.seed(7)
+        first = sampler(params, 30)
+        np.random.seed(7)
+        assert np.array_equal(first, sampler(params, 30))
+
+def test_odc_failure_probability():
+    # Compare the closed form against the explicit sum over all stage combinations
+    rng = np.random.default_rng(0)
+    marg = rng.random((len(SDLC_stages), len(ODC_types), 50)) * 1e-3
+    expected = np.zeros((len(ODC_types), 50))
+    for combo in itertools.product(range(2), repeat=len(SDLC_stages)):
+        if all(combo):
+            continue
+        term = 1.
+        for i, k in enumerate(combo):
+            term = term * (marg[i] if k == 0 else 1. - marg[i])
+        expected += term
+
+    assert odc_failure_probability(marg) == pytest.approx(expected, rel=1e-10, abs=1e-20)
+
+def test_read_workbook():
+    task_sheets = read_workbook(task_data)
+    defect_sheets = read_workbook(defect_data)
+    assert set(SDLC_stages).issubset(task_sheets)
+
+    for stage in SDLC_stages:
+        assert stage_dcp_calculation(task_sheets, stage) == stage_dcp_calculation(task_data, stage)
+    assert get_stage_odc_dist(defect_sheets)["Design"]["Timing"].mean() == get_stage_odc_dist(defect_data)["Design"]["Timing"].mean()
+    assert get_uca_defect_correlation_dist(defect_sheets)["UCA-B"]["Checking"].std() == get_uca_defect_correlation_dist(defect_data)["UCA-B"]["Checking"].std()
+
+def test_strip_whitespace_mixed():
+    # the strings are factorized, other objects keep their type and value
+    df = pd.DataFrame({'mixed': [' a ']*5 + [1, True, 1.0, 'b '], 'numbers': range(9)})
+    stripped = _strip_whitespace(df.copy())['mixed'].tolist()
+    assert stripped == ['a']*5 + [1, True, 1.0, 'b']
+    assert [type(value) for value in stripped[5:8]] == [int, bool, float]
+
+def test_workbook_cache(tmp_path):
+    cache = WorkbookCache(cache_dir=str(tmp_path))
+    sheets = read_workbook(task_data, cache=cache)
+    key = WorkbookCache.key(task_data)
+    assert (tmp_path / (key + '.npz')).exists()
+
+    cached = read_workbook(task_data, cache=cache)
+    for stage in SDLC_stages:
+        assert cached[stage].equals(sheets[stage])
+        assert list(cached[stage].dtypes) == list(sheets[stage].dtypes)
+
+    # a corrupt entry is a miss and is removed
+    (tmp_path / (key + '.npz')).write_bytes(b'corrupt')
+    assert cache.get(key) is None
+    assert not (tmp_path / (key + '.npz')).exists()
+
+    # the least recently used entry is evicted once the size limit is exceeded
+    small_cache = WorkbookCache(cache_dir=str(tmp_path), max_size=1)
+    read_workbook(defect_data, cache=small_cache)
+    assert small_cache.get(key) is None
+    assert small_cache.get(WorkbookCache.key(defect_data)) is not None
+
+def test_streaming_summary():
+    rng = np.random.default_rng(1)
+    samples = rng.lognormal(mean=-10., sigma=1., size=20000)
+    summary = StreamingSummary(reservoir_size=100)
+    for block in np.array_split(samples, 7):
+        summary.update(block)
+
+    assert summary.count == samples.size
+    assert summary.mean == pytest.approx(np.mean(samples), rel=1e-12)
+    assert summary.std == pytest.approx(np.std(samples), rel=1e-10)
+    assert summary.quantile([0.05, 0.5, 0.95]) == pytest.approx(np.quantile(samples, [0.05, 0.5, 0.95]), rel=0.03)
+    assert np.array_equal(summary.reservoir, samples[:100])
+
+def test_BBN_chunked():
+    software_BBN = BBN(defect_data, task_data, num_samples=2500, chunk_size=1000, reservoir_size=300)
+    software_BBN.calculate()
+    mean, sigma, samples = software_BBN.get_total_failure_probability()
+
+    assert software_BBN.summary['total'].count == 2500
+    assert len(samples) == 300
+    for uca in UCA_types:
+        assert software_BBN.summary['uca'][uca].count == 2500
+
+    # the streaming statistics equal the statistics of all samples of a run with the same seed, kept in the reservoir
+    reference = BBN(defect_data, task_data, num_samples=2500, chunk_size=1000, reservoir_size=2500)
+    reference.calculate()
+    assert np.array_equal(samples, reference.prob_total[:300])
+    assert mean == pytest.approx(np.mean(reference.prob_total), rel=1e-12)
+    assert sigma == pytest.approx(np.std(reference.prob_total), rel=1e-9)
+    for uca in UCA_types:
+        assert software_BBN.get_uca(uca)[0] == pytest.approx(np.mean(reference.prob_uca[uca]), rel=1e-12)
+    assert mean == pytest.approx(0.00011604416452036063, rel=1e-10)
+
+def test_BBN_parallel():
+    # results must not depend on the number of workers
+    results = []
+    for workers in [1, 2]:
+        software_BBN = BBN(defect_data, task_data, num_samples=3000, chunk_size=1000, workers=workers)
+        software_BBN.calculate()
+        results.append(software_BBN.prob_total)
+
+    assert np.array_equal(results[0], results[1])
+
+def test_BBN_independent_streams():
+    # interleaved instances must not affect each other's random streams
+    first = BBN(defect_data, task_data, num_samples=500, seed=3)
+    second = BBN(defect_data, task_data, num_samples=500, seed=3, bit_generator='SFC64')
+    second.calculate()
+    first.calculate()
+
+    reference = BBN(defect_data, task_data, num_samples=500, seed=3)
+    reference.calculate()
+    assert np.array_equal(first.prob_total, reference.prob_total)
+    assert not np.array_equal(first.prob_total, second.prob_total)
+
+@pytest.mark.parametrize("sampling", ["lhs", "sobol"])
+def test_BBN_sampling(sampling):
+    software_BBN = BBN(defect_data, task_data, num_samples=1024, sampling=sampling)
+    software_BBN.calculate()
+    mean, _, samples = software_BBN.get_total_failure_probability()
+
+    assert len(samples) == 1024
+    assert mean == pytest.approx(0.00011638263688219704, rel=0.02)
+
+def test_sobol_dimension():
+    rng = np.random.default_rng(0)
+    assert uniform_design('sobol', 100, 8, rng).shape == (100, 8)
+    with pytest.raises(ValueError, match='at most'):
+        uniform_design('sobol', 30000, 8, rng)
+
+def test_BBN_adaptive():
+    software_BBN = BBN(defect_data, task_data, num_samples=1000, tolerance=0.01)
+    software_BBN.calculate()
+    mean, sigma, samples = software_BBN.get_total_failure_probability()
+
+    assert software_BBN.converged
+    assert software_BBN.total_samples % 1000 == 0
+    assert len(samples) == software_BBN.total_samples
+    assert sigma/np.sqrt(len(samples))/mean < 0.01
+
+    # the stopping rule of a quantile uses the running histogram
+    quantile_BBN = BBN(defect_data, task_data, num_samples=1000, tolerance=0.05, quantile=0.9, max_samples=20000)
+    quantile_BBN.calculate()
+    _, _, samples, value = quantile_BBN.get_total_failure_probability(quantiles=0.9)
+    assert len(samples) == quantile_BBN.total_samples
+    assert value > np.median(samples)
+
+def test_BBN_importance():
+    software_BBN = BBN(defect_data, task_data, num_samples=2000, importance=0.99)
+    software_BBN.calculate()
+    mean, sigma, samples, quantiles = software_BBN.get_total_failure_probability(quantiles=[0.5, 0.999])
+
+    assert len(software_BBN.weights) == len(samples)
+    assert 0 < software_BBN.get_effective_sample_size() < 2000
+    assert mean == pytest.approx(0.00011638263688219704, rel=0.02)
+    assert quantiles[1] == pytest.approx(0.00032628124447253476, rel=0.2)
+
+    # chunked mode gives the same weighted estimates
+    chunked_BBN = BBN(defect_data, task_data, num_samples=2000, importance=0.99, chunk_size=2000)
+    chunked_BBN.calculate()
+    chunked_mean, chunked_sigma, _ = chunked_BBN.get_total_failure_probability()
+    assert chunked_mean == pytest.approx(mean, rel=1e-10)
+    assert chunked_sigma == pytest.approx(sigma, rel=1e-8)
+    assert chunked_BBN.get_effective_sample_size() == pytest.approx(software_BBN.get_effective_sample_size())
+
+def test_BBN_float32():
+    reference = BBN(defect_data, task_data, num_samples=1000)
+    reference.calculate()
+    software_BBN = BBN(defect_data, task_data, num_samples=1000, dtype='float32')
+    software_BBN.calculate()
+    mean, sigma, samples = software_BBN.get_total_failure_probability()
+
+    assert samples.dtype == np.float32
+    assert all(software_BBN.prob_uca[uca].dtype == np.float32 for uca in UCA_types)
+    assert samples == pytest.approx(reference.prob_total, rel=1e-5)
+    assert mean == pytest.approx(0.00011638263688219704, rel=1e-5)
+
+def test_batch_assessment(tmp_path):
+    manifest = tmp_path / 'manifest.txt'
+    manifest.write_text('# task lists\n' + task_data + '\n\n' + task_data + '\n')
+    task_files = find_task_files(str(manifest))
+    assert task_files == [task_data, task_data]
+
+    batch = BatchAssessment(defect_data, str(manifest), workers=2, num_samples=1000)
+    results = batch.run()
+    assert len(results) == 2
+    assert results['Total Mean'].tolist() == pytest.approx([0.00011638263688219704]*2, rel=1e-6)
+    assert results['UCA-A Mean'].iloc[0] == pytest.approx(2.7785334756062625e-05, rel=1e-6)
+    assert results['Total Q0.05'].iloc[0] < results['Total Q0.5'].iloc[0] < results['Total Q0.95'].iloc[0]
+
+    out_file = tmp_path / 'results.csv'
+    batch.write(str(out_file))
+    assert out_file.exists()
+
+    # stage level assessment of SDLC stage data files
+    approx_data = os.path.join(workdir, '..', 'data', 'Example_PreliminaryAssessment.xlsx')
+    batch = BatchAssessment(defect_data, [approx_data], workers=1, approx=True, num_samples=1000)
+    bbn = BBN(defect_data, approx_data, num_samples=1000, approx=True)
+    bbn.calculate()
+    assert batch.run()['Total Mean'].iloc[0] == pytest.approx(np.mean(bbn.prob_total), rel=1e-10)
+
+def test_parameter_sweep():
+    sweep = ParameterSweep(defect_data, task_data, num_samples=20000)
+    results = sweep.run(grid_design({'review:Design': [2., 3.], 'mu:D1OC': [-5.00712, -4.], 'samples': [5000, 20000]}))
+    assert len(results) == 8*(1 + len(UCA_types))
+    total = results[results['Output'] == 'Total'].set_index(['review:Design', 'mu:D1OC', 'samples'])['Mean']
+
+    # more reviews and smaller human error probabilities lower the failure probability
+    assert total[(3., -5.00712, 20000)] < total[(2., -5.00712, 20000)]
+    assert total[(2., -5.00712, 20000)] < total[(2., -4., 20000)]
+
+    # the points reuse the same samples, the input files give the BBN estimate
+    base = sweep.run([{}])
+    assert base['Mean'].iloc[0] == pytest.approx(0.00011638263688219704, rel=0.05)
+    assert base['Mean'].iloc[0] == pytest.approx(sweep.run([{'samples': 20000}])['Mean'].iloc[0], rel=1e-12)
+
+    design = random_design({'trigger:Testing': (0.5, 1.), 'samples': [100, 200]}, 3, seed=1)
+    assert len(sweep.run(design)) == 3*(1 + len(UCA_types))
+    with pytest.raises(IOError):
+        sweep.run([{'review:Unknown': 1.}])
+
+    # points with different factors keep the input file values of the missing ones
+    mixed = sweep.run([{'review:Design': 3.}, {'mu:D1OC': -4.}, {'samples': 500}])
+    mixed = mixed[mixed['Output'] == 'Total'].set_index('Point')['Mean']
+    assert mixed[0] == pytest.approx(total[(3., -5.00712, 20000)], rel=1e-12)
+    assert mixed[1] == pytest.approx(sweep.run([{'mu:D1OC': -4.}])['Mean'].iloc[0], rel=1e-12)
+    assert mixed[1] > base['Mean'].iloc[0]
+    assert np.isfinite(mixed[2])
+
+def test_sobol_indices():
+    software_BBN = BBN(defect_data, task_data, sampling='sobol')
+    indices = sobol_indices(software_BBN, num_samples=256)
+    num_inputs = 2*len(SDLC_stages) + (len(SDLC_stages) + len(UCA_types))*len(ODC_types)
+    assert len(indices) == (1 + len(UCA_types))*num_inputs
+
+    total = indices[indices['Output'] == 'Total'].set_index('Input')
+    assert total['ST'].idxmax() in ['HEP:Requirement', 'DCP:Requirement']
+    assert total['S1'].sum() == pytest.approx(1., abs=0.3)
+
+    # the UCA-B correlation terms do not affect the UCA-A probability
+    uca_a = indices[indices['Output'] == 'UCA-A'].set_index('Input')
+    assert np.all(uca_a.loc[[f'UCA:UCA-B:{odc}' for odc in ODC_types], ['S1', 'ST']].to_numpy() == 0.)
+
+    # the indices describe the nominal inputs, also after an importance sampling calculation
+    biased_BBN = BBN(defect_data, task_data, num_samples=1024, sampling='sobol', importance=0.99, pilot_samples=2048)
+    biased_BBN.calculate()
+    biased = sobol_indices(biased_BBN, num_samples=256)
+    assert biased[['S1', 'ST']].to_numpy() == pytest.approx(indices[['S1', 'ST']].to_numpy(), rel=1e-10, abs=1e-12)
+
+def test_BBN_incremental():
+    software_BBN = BBN(defect_data, task_data, num_samples=1000, incremental=True)
+    software_BBN.calculate()
+    mean, _, _ = software_BBN.get_total_failure_probability()
+    assert mean == pytest.approx(0.00011638263688219704, rel=0.1)
+    kept = {name: samples for name, (_, samples) in software_BBN._intermediates.items()}
+
+    # edit one stage: only its samples are redrawn, and the result equals a calculation from scratch
+    sheets = {name: df.copy() for name, df in read_workbook(task_data).items()}
+    sheets['Design'].loc[0, 'Human Error Mode'] = 'D1'
+    software_BBN.update_task(sheets)
+    software_BBN.calculate()
+    for name, (_, samples) in software_BBN._intermediates.items():
+        assert (samples is kept[name]) == (name != 'Design')
+
+    reference = BBN(defect_data, sheets, num_samples=1000, incremental=True)
+    reference.calculate()
+    assert np.array_equal(software_BBN.prob_total, reference.prob_total)
+
+    # edit the reviews of one stage: the HEP samples are kept, only its DCP is recomputed
+    kept = {name: samples for name, (_, samples) in software_BBN._intermediates.items()}
+    sheets['Testing']['Review Number'] = sheets['Testing']['Review Number'] + 1
+    software_BBN.update_task(sheets)
+    software_BBN.calculate()
+    for name, (_, samples) in software_BBN._intermediates.items():
+        assert (samples is kept[name]) == (name != 'DCP:Testing')
+    reference = BBN(defect_data, sheets, num_samples=1000, incremental=True)
+    reference.calculate()
+    assert np.array_equal(software_BBN.prob_total, reference.prob_total)
+
+    # the kept samples are keyed by the stage sheets, user provided stage data are not supported
+    data = {stage: {'mean': 1e-3, 'std': 1e-4, 'review': 1., 'trigger': 0.5} for stage in SDLC_stages}
+    with pytest.raises(IOError):
+        BBN(defect_data, None, approx=True, data=data, incremental=True)
+
+def test_BBN_save_load(tmp_path):
+    software_BBN = BBN(defect_data, task_data, num_samples=1000)
+    software_BBN.calculate()
+    file_path = os.path.join(tmp_path, 'bbn.npz')
+    software_BBN.save(file_path)
+    loaded = BBN.load(file_path)
+    assert isinstance(loaded.prob_total, np.memmap)
+    assert np.array_equal(loaded.prob_total, software_BBN.prob_total)
+    assert loaded.get_total_failure_probability()[:2] == software_BBN.get_total_failure_probability()[:2]
+    assert loaded.metadata['seed'] == 42
+    assert len(loaded.metadata['input_hashes']['task']) == 64
+    with pytest.raises(IOError):
+        loaded.calculate()
+
+    # the .npz extension is added if missing
+    software_BBN.save(os.path.join(tmp_path, 'run'))
+    assert os.path.exists(os.path.join(tmp_path, 'run.npz'))
+    assert np.array_equal(BBN.load(os.path.join(tmp_path, 'run')).prob_total, software_BBN.prob_total)
+
+    # chunked mode keeps the streaming statistics
+    chunked = BBN(defect_data, task_data, num_samples=1000, chunk_size=300, reservoir_size=100)
+    chunked.calculate()
+    chunked.save(file_path)
+    loaded = BBN.load(file_path, mmap=False)
+    assert loaded.get_uca('UCA-A', quantiles=0.5)[3] == chunked.get_uca('UCA-A', quantiles=0.5)[3]
+    assert loaded.get_total_failure_probability()[:2] == chunked.get_total_failure_probability()[:2]
+
+def test_write_bbn(tmp_path):
+    software_BBN = BBN(defect_data, task_data, num_samples=1000)
+    software_BBN.calculate()
+    mean, sigma, _ = software_BBN.get_total_failure_probability()
+
+    csv_file = os.path.join(tmp_path, 'out.csv')
+    write_bbn(software_BBN, csv_file, chunk_rows=300)
+    samples = pd.read_csv(csv_file)
+    assert len(samples) == 1000
+    assert samples['Total'].to_numpy() == pytest.approx(software_BBN.prob_total)
+    summary = pd.read_csv(os.path.join(tmp_path, 'out_summary.csv'))
+    assert summary.iloc[-1]['Mean'] == pytest.approx(mean)
+
+    npz_file = os.path.join(tmp_path, 'out.npz')
+    write_bbn(software_BBN, npz_file, chunk_rows=300)
+    with np.load(npz_file) as npz:
+        columns = list(npz['columns'])
+        assert np.array_equal(npz['samples'][:, columns.index('Total')], software_BBN.prob_total)
+        assert npz['summary'][-1, :2] == pytest.approx([mean, sigma])
+
+    # string columns of a table load without pickle
+    table_file = os.path.join(tmp_path, 'table.npz')
+    write_table(summary_table(software_BBN), table_file)
+    with np.load(table_file, allow_pickle=False) as npz:
+        assert npz['Output'][-1] == 'Total'
+        assert npz['Mean'][-1] == pytest.approx(mean)
+    # the file is written at the requested path, whatever its extension
+    write_table(summary_table(software_BBN), os.path.join(tmp_path, 'table.csv'), style='npz')
+    assert not os.path.exists(os.path.join(tmp_path, 'table.csv.npz'))
+    with np.load(os.path.join(tmp_path, 'table.csv'), allow_pickle=False) as npz:
+        assert npz['Output'][-1] == 'Total'
+
+def test_plot_histogram():
+    software_BBN = BBN(defect_data, task_data, num_samples=1000, chunk_size=300, reservoir_size=100)
+    software_BBN.calculate()
+    fig = software_BBN.plot(type='total', show=False, bins=20)
+    assert fig.data[0].type == 'bar'
+    assert len(fig.data[0].x) == 20
+    assert np.sum(fig.data[0].y) == 100
+    # the streaming histograms cover all samples
+    figs = software_BBN.plot(show=False, log=True)
+    assert len(figs) == 4
+    assert np.sum(figs[3].data[0].y) == 1000
+    assert len(figs[0].data) == len(SDLC_stages)
+
+def test_CCCG():
+    cccg = CCCG(cccg_data)
+    cccg.generate()
+    groups = {name: cccg.get(name) for name in ['final', 'single', 'double', 'triple']}
+    assert [len(groups[name]) for name in groups] == [20, 8, 16, 1]
+    assert list(groups['final'][0].index) == [0, 1, 2, 12, 13, 14, 24, 25, 26, 36, 37, 38]
+    assert list(groups['triple'][0]['Component_Name']) == ['OV_D1', 'OV_D2', 'OV_D3']
+    assert groups['triple'][0]['Coupling_Factor'].iloc[0] == 'Function;Input;Design'
+    # duplicates hold the same components, the first one is kept
+    df = groups['final'][0]
+    unique = drop_dup([df, df.iloc[::-1], df.iloc[:2]])
+    assert len(unique) == 2
+    assert unique[0] is df
+
+def test_CCCG_index():
+    # the inverted index engine gives the groups of the DataFrame matching functions, in the same order
+    cccg = CCCG(cccg_data)
+    cccg.generate()
+    df = expand_configs(next(iter(read_workbook(cccg_data).values())))
+    function = match_CCCG_on(df, 'Function_')
+    assert [list(g.index) for g in function] == [list(g) for g in cccg._cccg_function]
+    function_design = match_CCCG_list_on(function, 'Design_')
+    assert [list(g.index) for g in function_design] == [list(g) for g in cccg._cccg_function_design]
+    # DataFrame groups are joined to the aggregated Config strings by their row ids
+    for frame, rows in zip(cccg.aggregate(function_design), cccg.aggregate(cccg._cccg_function_design)):
+        assert frame.equals(rows)
+    unknown = function[0].rename(index=lambda row: row + 1000)
+    with pytest.raises(IOError, match=unknown['Component_Name'].iloc[0]):
+        cccg.aggregate([unknown])
+    assert list(bitset_rows(bitset([0, 3, 9], 12))) == [0, 3, 9]